@@ -18,25 +18,48 @@ from __future__ import annotations
 # Importaciones de la Biblioteca Estándar
 import argparse
 import logging
+import logging.handlers
+import multiprocessing
 import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from datetime import datetime 
 from pathlib import Path
-from typing import Callable, Dict, List, Optional, Tuple
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
 
-# Importaciones Locales
-from src.scrapers import (
-    CourseraProgressScraper,
-    GitHubDailyActivityScraper,
-    GoodreadsReadingScraper,
-    UPSOStudyPlanScraper,
-    LinkedInProfileScraper,
-)
+# NOTA: cada scraper se importa desde su propio módulo dentro de su runner.
+# Así `--help`/`--list` (y las fuentes no solicitadas) no pagan el costo de
+# importar Selenium/requests/BS4; Python cachea el import tras el primer uso.
 
 # Variables Globales de Entorno
 CONFIG_DIR = Path(__file__).parent / "config"
 ENV_NAME = "dev"
 LOG_FILE_PATH = Path(__file__).parent / "data/personal_sync.log"
 
+# Directorios de log ya creados en este proceso (evita mkdir repetidos)
+_ENSURED_DIRS: set[Path] = set()
+
+# Último segundo formateado para el log de éxito (evita strftime repetidos)
+_LAST_TS, _LAST_STR = 0, ""
+
+# Rotación de logs: tope de ~5 MB por archivo, con 3 backups (.1, .2, .3)
+LOG_MAX_BYTES = 5 * 1024 * 1024
+LOG_BACKUP_COUNT = 3
+
+
+def _ensure_dir(path: Path) -> None:
+    """Crea `path` (y sus padres) solo la primera vez que se pide en el proceso."""
+    if path not in _ENSURED_DIRS:
+        path.mkdir(parents=True, exist_ok=True)
+        _ENSURED_DIRS.add(path)
+
+def _now_str() -> str:
+    """Devuelve 'YYYY-mm-dd HH:MM:SS' actual, reformateando solo si cambió el segundo."""
+    global _LAST_TS, _LAST_STR
+    now = int(time.time())
+    if now != _LAST_TS:
+        _LAST_TS, _LAST_STR = now, datetime.fromtimestamp(now).strftime("%Y-%m-%d %H:%M:%S")
+    return _LAST_STR
 
 def setup_logging(level: int = logging.INFO, log_file: str | Path = "data/personal_sync.log"):
     """
@@ -45,8 +68,10 @@ def setup_logging(level: int = logging.INFO, log_file: str | Path = "data/person
     log_file = Path(log_file)
     handlers: List[logging.Handler] = [logging.StreamHandler()]
     try:
-        log_file.parent.mkdir(parents=True, exist_ok=True)
-        handlers.append(logging.FileHandler(log_file, encoding='utf-8'))
+        _ensure_dir(log_file.parent)
+        handlers.append(logging.handlers.RotatingFileHandler(
+            log_file, maxBytes=LOG_MAX_BYTES, backupCount=LOG_BACKUP_COUNT, encoding='utf-8'
+        ))
     except PermissionError:
         print(f"[ERROR] No se pudo crear/escribir en {log_file}. "
               f"Verifica permisos o la ruta de log para el entorno '{ENV_NAME}'. "
@@ -77,14 +102,19 @@ def setup_success_logger(log_dir: Path) -> logging.Logger:
     formatter = logging.Formatter('%(message)s')
     
     try:
-        log_dir.mkdir(parents=True, exist_ok=True)
-        # Modo 'a' para (append)
-        fh = logging.FileHandler(log_file, encoding='utf-8', mode='a')
+        _ensure_dir(log_dir)
+        # Modo 'a' para (append), rotando al superar LOG_MAX_BYTES
+        fh = logging.handlers.RotatingFileHandler(
+            log_file, mode='a', maxBytes=LOG_MAX_BYTES,
+            backupCount=LOG_BACKUP_COUNT, encoding='utf-8'
+        )
         fh.setFormatter(formatter)
+        # Sin buffer: cada corrida escribe su resumen en un solo info()
         
-        # Limpiar handlers viejos si se reconfigura
-        if logger.hasHandlers():
-            logger.handlers.clear()
+        # Cerrar y limpiar handlers viejos si se reconfigura
+        for old in list(logger.handlers):
+            logger.removeHandler(old)
+            old.close()
             
         logger.addHandler(fh)
     except Exception as e:
@@ -99,6 +129,8 @@ def setup_success_logger(log_dir: Path) -> logging.Logger:
 
 def run_coursera() -> Optional[Path]:
     """Ejecuta el scraper de Coursera."""
+    from src.scrapers.coursera_progress import CourseraProgressScraper
+
     scraper = CourseraProgressScraper(config_dir=CONFIG_DIR, env_name=ENV_NAME)
     json_path = scraper.run()
     print(f"[Coursera] Datos guardados en: {json_path}")
@@ -106,6 +138,8 @@ def run_coursera() -> Optional[Path]:
 
 def run_goodreads() -> Optional[Path]:
     """Ejecuta el scraper de Goodreads."""
+    from src.scrapers.goodreads_reading import GoodreadsReadingScraper
+
     scraper = GoodreadsReadingScraper(config_dir=CONFIG_DIR, env_name=ENV_NAME)
     json_path = scraper.run()
     print(f"[Goodreads] Datos guardados en: {json_path}")
@@ -113,6 +147,8 @@ def run_goodreads() -> Optional[Path]:
 
 def run_upso() -> Optional[Path]:
     """Ejecuta el scraper de UPSO."""
+    from src.scrapers.upso_study_plan import UPSOStudyPlanScraper
+
     scraper = UPSOStudyPlanScraper(config_dir=CONFIG_DIR, env_name=ENV_NAME)
     json_path = scraper.run()
     print(f"[UPSO] Datos guardados en: {json_path}")
@@ -120,6 +156,8 @@ def run_upso() -> Optional[Path]:
 
 def run_github_today() -> Optional[Path]:
     """Ejecuta el scraper de actividad diaria de GitHub."""
+    from src.scrapers.github_daily_activity import GitHubDailyActivityScraper
+
     scraper = GitHubDailyActivityScraper(config_dir=CONFIG_DIR, env_name=ENV_NAME)
     json_path = scraper.run()
     print(f"[GitHub] Datos guardados en: {json_path}")
@@ -127,6 +165,8 @@ def run_github_today() -> Optional[Path]:
 
 def run_linkedin() -> Optional[Path]:
     """Ejecuta el scraper de perfil de LinkedIn."""
+    from src.scrapers.linkedin_profile import LinkedInProfileScraper
+
     scraper = LinkedInProfileScraper(config_dir=CONFIG_DIR, env_name=ENV_NAME)
     json_path = scraper.run()
     print(f"[LinkedIn] Datos guardados en: {json_path}")
@@ -142,6 +182,96 @@ RUNNERS: Dict[str, Callable[[], Optional[Path]]] = {
     "linkedin": run_linkedin,
 }
 
+# ---------------------------
+# Ejecución (secuencial o en paralelo)
+# ---------------------------
+
+def _init_worker(config_dir: Path, env_name: str, log_level: int, log_queue: "multiprocessing.Queue") -> None:
+    """
+    Inicializa cada proceso del pool: replica los globales de entorno
+    (con el método 'spawn' no se heredan) y envía sus logs al proceso
+    principal por `log_queue`. Solo el principal escribe el archivo de log
+    (RotatingFileHandler no es seguro con varios procesos).
+    """
+    global CONFIG_DIR, ENV_NAME
+    CONFIG_DIR, ENV_NAME = config_dir, env_name
+    root = logging.getLogger()
+    for handler in root.handlers[:]:
+        root.removeHandler(handler)
+    # Sin formatter: el registro se formatea una sola vez, en los handlers del principal
+    root.addHandler(logging.handlers.QueueHandler(log_queue))
+    root.setLevel(log_level)
+
+def _run_source(runner: Callable[[], Optional[Path]]) -> Optional[Path]:
+    """
+    Ejecuta `runner` y cierra los navegadores que hayan quedado en el pool.
+
+    El cierre es explícito: los workers del ProcessPoolExecutor terminan con
+    os._exit y no ejecutan los hooks de atexit, así que un Chromium ocioso
+    quedaría huérfano.
+    """
+    from src.browser_pool import BrowserPool
+
+    try:
+        return runner()
+    finally:
+        BrowserPool.shutdown()
+
+def _iter_results(
+    runners: Dict[str, Callable[[], Optional[Path]]],
+    requested: List[str], jobs: int, log_level: int
+) -> Iterator[Tuple[str, Optional[Path], Optional[Exception]]]:
+    """
+    Ejecuta los runners y entrega (fuente, json_path, error) a medida que terminan.
+
+    Con jobs <= 1 (default) corre todo en este proceso y en orden. Si no,
+    usa un ProcessPoolExecutor: procesos (no threads) porque cada scraper
+    maneja su propio navegador/sesión y son I/O sobre sitios independientes.
+    Los logs de los workers vuelven por una cola a los handlers de este proceso.
+    """
+    logger = logging.getLogger("main")
+
+    if jobs <= 1:
+        for src in requested:
+            logger.info(f"[RUN] Iniciando scraper: {src}")
+            print(f"\n[RUN] {src}…")
+            try:
+                json_path = _run_source(runners[src])
+            except Exception as e:
+                yield src, None, e
+            else:
+                yield src, json_path, None
+        return
+
+    for src in requested:
+        logger.info(f"[RUN] Iniciando scraper: {src}")
+        print(f"[RUN] {src}…")
+    # Vaciar stdout antes de crear procesos, para que no hereden el buffer pendiente
+    sys.stdout.flush()
+
+    log_queue = multiprocessing.Queue()
+    listener = logging.handlers.QueueListener(
+        log_queue, *logging.getLogger().handlers, respect_handler_level=True
+    )
+    listener.start()
+    try:
+        with ProcessPoolExecutor(
+            max_workers=jobs,
+            initializer=_init_worker,
+            initargs=(CONFIG_DIR, ENV_NAME, log_level, log_queue),
+        ) as executor:
+            futures = {executor.submit(_run_source, runners[src]): src for src in requested}
+            for future in as_completed(futures):
+                src = futures[future]
+                try:
+                    json_path = future.result()
+                except Exception as e:
+                    yield src, None, e
+                else:
+                    yield src, json_path, None
+    finally:
+        listener.stop() # Vacía la cola antes de volver
+
 # ---------------------------
 # Interfaz de Línea de Comandos (CLI)
 # ---------------------------
@@ -171,6 +301,15 @@ def parse_args() -> argparse.Namespace:
         action="store_true",
         help="Muestra las fuentes (scrapers) disponibles y sale."
     )
+    parser.add_argument(
+        "--jobs", "-j",
+        type=int,
+        default=1,
+        help=(
+            "Cantidad de scrapers a ejecutar en paralelo (procesos). "
+            "Default: 1 (secuencial; en la RPi varios Chromium a la vez no entran en RAM)."
+        ),
+    )
     parser.add_argument(
         "--verbose", "-v",
         action="store_true",
@@ -184,10 +323,18 @@ def main() -> int:
     1. Parsea args.
     2. Configura globales (ENV_NAME, CONFIG_DIR, LOG_FILE_PATH).
     3. Configura logging (principal y de éxito).
-    4. Ejecuta los scrapers solicitados.
+    4. Ejecuta los scrapers solicitados (en orden, o en paralelo con --jobs).
     5. Imprime resumen y retorna código de salida.
     """
     global CONFIG_DIR, ENV_NAME, LOG_FILE_PATH
+
+    # 0. Atajo para --list: se resuelve antes de construir argparse
+    # o configurar logging.
+    if "--list" in sys.argv[1:]:
+        print("Fuentes disponibles:")
+        for k in RUNNERS:
+            print(f" - {k}")
+        return 0
     
     args = parse_args()
     
@@ -209,16 +356,9 @@ def main() -> int:
     logger = logging.getLogger("main")
     logger.info(f"Iniciando Personal Sync. Entorno: {ENV_NAME.upper()}")
 
-    # 3. Manejar --list
-    if args.list:
-        print("Fuentes disponibles:")
-        for k in RUNNERS:
-            print(f" - {k}")
-        return 0
-
-    # 4. Seleccionar Scrapers
+    # 3. Seleccionar Scrapers
     if args.sources.strip().lower() == "all":
-        requested = list(RUNNERS.keys())
+        requested = list(RUNNERS)
     else:
         requested = [s.strip().lower() for s in args.sources.split(",") if s.strip()]
 
@@ -229,52 +369,63 @@ def main() -> int:
               f"Opciones válidas: {', '.join(RUNNERS)}")
         return 2
 
-    # 5. Ejecutar Scrapers
+    # 4. Ejecutar Scrapers
     exit_code = 0
     outputs: Dict[str, str] = {}
+    success_lines: List[str] = []
 
     logger.info(f"Ejecutando {len(requested)} scraper(s): {', '.join(requested)}")
     print(f"Ejecutando {len(requested)} scraper(s): {', '.join(requested)}")
     print(f"Entorno: {ENV_NAME.upper()}")
     print("=" * 50)
 
-    for src in requested:
-        try:
-            logger.info(f"[RUN] Iniciando scraper: {src}")
-            print(f"\n[RUN] {src}…")
-            
-            json_path = RUNNERS[src]()
-            outputs[src] = f"JSON: {json_path}"
-            logger.info(f"[RUN] {src} completado.")
-
-            # Solo escribimos en el log de éxito si se generó un archivo
-            if json_path: 
-                timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-                log_line = f"{timestamp} - {src} - ejecutada con éxito."
-                success_logger.info(log_line)
-                
-        except Exception as e:
-            exit_code = 1
-            outputs[src] = f"ERROR: {e}"
-            print(f"[{src.upper()}][ERROR] {e}")
-            logger.exception(f"Error fatal durante la ejecución de {src}")
+    jobs = min(args.jobs, len(requested))
 
-    # 6. Resumen Final
-    print("\n" + "=" * 50)
-    print("=== RESUMEN EJECUCIÓN ===")
+    # El log de éxito se escribe solo desde este proceso (sin escritores concurrentes),
+    # acumulando las líneas para volcarlas de una vez al final.
+    for src, json_path, error in _iter_results(RUNNERS, requested, jobs, log_level):
+        if error is not None:
+            exit_code = 1
+            outputs[src] = f"ERROR: {error}"
+            print(f"[{src.upper()}][ERROR] {error}")
+            # El traceback completo solo con --verbose (formatearlo es costoso)
+            if args.verbose:
+                logger.error(f"Error fatal durante la ejecución de {src}", exc_info=error)
+            else:
+                logger.error(f"Error fatal durante la ejecución de {src}: {error!r}")
+            continue
+
+        outputs[src] = f"JSON: {json_path}"
+        logger.info(f"[RUN] {src} completado.")
+
+        # Solo escribimos en el log de éxito si se generó un archivo
+        if json_path: 
+            timestamp = _now_str()
+            log_line = f"{timestamp} - {src} - ejecutada con éxito."
+            success_lines.append(log_line)
+
+    # 5. Resumen Final (se arma completo y se escribe de una sola vez)
+    summary = ["", "=" * 50, "=== RESUMEN EJECUCIÓN ==="]
     logger.info("=== RESUMEN EJECUCIÓN ===")
     for src in requested:
         status = "Ok." if "ERROR" not in outputs[src] else "Error."
         log_msg = f"{status} {src}: {outputs[src]}"
-        print(log_msg)
+        summary.append(log_msg)
         logger.info(log_msg)
 
     if exit_code == 0:
         logger.info("Todos los scrapers completados exitosamente.")
-        print(f"\nTodos los scrapers completados exitosamente")
+        summary += ["", "Todos los scrapers completados exitosamente"]
     else:
         logger.warning("Algunos scrapers fallaron (revisa los logs).")
-        print(f"\nAlgunos scrapers fallaron (revisa los logs)")
+        summary += ["", "Algunos scrapers fallaron (revisa los logs)"]
+
+    sys.stdout.write("\n".join(summary) + "\n")
+    sys.stdout.flush()
+
+    # Un único registro (y un único write) con todas las líneas de éxito
+    if success_lines:
+        success_logger.info("\n".join(success_lines))
 
     return exit_code
 
@@ -63,7 +63,7 @@ sudo install -D -m 0640 -o "$SERVICE_USER" -g "$SERVICE_USER" /dev/null "$DEST_L
 
 # 7. Despliegue de Código (rsync)
 echo "[5/9] Copiando código fuente con rsync (El código es la fuente de verdad)..."
-sudo rsync -a --delete --exclude ".git" --exclude ".venv" "$REPO_ROOT/" "$DEST_CODE/"
+sudo rsync -a --delete --exclude ".git" --exclude ".venv" --exclude "config/chromium_profile_coursera" "$REPO_ROOT/" "$DEST_CODE/"
 sudo chown -R "$SERVICE_USER":"$SERVICE_USER" "$DEST_CODE"
 sudo chmod -R 0750 "$DEST_CODE"
 echo "    -> Código copiado. No se aplicarán parches."
@@ -16,17 +16,102 @@ from __future__ import annotations
 
 # Importaciones de la Biblioteca Estándar
 import csv
+import hashlib
 import json
 import logging
+import os
+import platform
+import shutil
+import time
 from abc import ABC, abstractmethod
 from dataclasses import asdict, is_dataclass
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, List, Optional, Tuple
+from typing import TYPE_CHECKING, Any, List, Optional, Sequence, Tuple
+from urllib.parse import urlsplit
+
+# Importaciones de Terceros (opcionales)
+try:
+    import orjson  # Serializador en C, varias veces más rápido que json
+except ImportError:
+    orjson = None
+
+if TYPE_CHECKING:
+    import requests
 
 # Importaciones Locales
 from .config_loader import Config
 
+# Directorios de salida ya creados en este proceso (evita un mkdir por instancia)
+_ENSURED_DIRS: set[Path] = set()
+
+# Rutas conocidas del binario de Chromium (scrapers con Selenium)
+_CHROMIUM_PATHS = (
+    "/usr/bin/chromium",
+    "/usr/bin/chromium-browser",
+    "/usr/lib/chromium/chromium",
+    "/usr/lib/chromium-browser/chromium-browser",
+)
+
+# Rutas conocidas de chromedriver en Debian/RPi (ARM)
+_ARM_DRIVER_PATHS = (
+    "/usr/bin/chromedriver",
+    "/usr/lib/chromium-browser/chromedriver",
+    "/usr/lib/chromium/chromedriver",
+)
+
+# Preferencias de Chrome que bloquean contenido que los scrapers no leen
+# (2 = bloquear). JS queda habilitado: LinkedIn y Guaraní lo necesitan.
+_BLOCKED_CONTENT_PREFS = {
+    "profile.managed_default_content_settings.images": 2,
+    "profile.managed_default_content_settings.stylesheets": 2,
+    "profile.managed_default_content_settings.fonts": 2,
+    "profile.managed_default_content_settings.plugins": 2,
+    "profile.managed_default_content_settings.media_stream": 2,
+}
+
+# Antigüedad máxima del archivo de cookies de sesión (Selenium) antes de ignorarlo
+_SESSION_COOKIES_MAX_AGE = 7 * 24 * 3600
+
+
+@lru_cache(maxsize=1)
+def _is_arm_architecture() -> bool:
+    """Determina si estamos ejecutando en una arquitectura ARM (como Raspberry Pi)."""
+    arch = platform.machine().lower()
+    return any(a in arch for a in ("arm", "aarch64", "armv"))
+
+
+@lru_cache(maxsize=1)
+def _detect_chromium_binary() -> Optional[str]:
+    """
+    Devuelve el primer binario de Chromium existente (rutas conocidas,
+    luego el PATH), o None.
+    Cacheado: el sistema de archivos se consulta una vez por proceso.
+    """
+    for path in _CHROMIUM_PATHS:
+        if os.path.exists(path):
+            return path
+    return shutil.which("chromium") or shutil.which("chromium-browser")
+
+
+@lru_cache(maxsize=2)
+def _detect_chromedriver(is_arm: bool) -> Tuple[str, ...]:
+    """
+    Devuelve los chromedriver del sistema existentes, en orden de preferencia
+    (todos, para poder probar el siguiente si uno falla al iniciar). Cacheado.
+
+    Fuera de ARM devuelve una tupla vacía: ahí resuelve Selenium Manager.
+    """
+    if not is_arm:
+        return ()
+    found = [p for p in _ARM_DRIVER_PATHS if os.path.exists(p)]
+    on_path = shutil.which("chromedriver")
+    if on_path and on_path not in found:
+        found.append(on_path)
+    return tuple(found)
+
+
 class BaseScraper(ABC):
     """Clase base abstracta para todos los scrapers."""
     
@@ -42,8 +127,8 @@ class BaseScraper(ABC):
         self.config_dir = config_dir
         self.scraper_name = scraper_name
         self.env_name = env_name
-        # Carga la configuración unificada
-        self.config = Config(config_dir, env_name=env_name)
+        # Carga la configuración unificada (compartida entre scrapers del mismo proceso)
+        self.config = Config.get_or_create(config_dir, env_name=env_name)
         self.logger = logging.getLogger(scraper_name)
         
         # Configura el directorio de salida (ej. 'data/coursera/')
@@ -56,12 +141,249 @@ class BaseScraper(ABC):
             outdir_path = Path("/var/lib/personal-track") / outdir_path
 
         self.outdir = outdir_path
-        self.outdir.mkdir(parents=True, exist_ok=True)
+        if self.outdir not in _ENSURED_DIRS:
+            self.outdir.mkdir(parents=True, exist_ok=True)
+            _ENSURED_DIRS.add(self.outdir)
         
         # Configuración común (usando helpers de Config para consistencia)
         self.headless = self.config.get_bool(f"{scraper_name}.headless", True)
         self.timeout = self.config.get_int(f"{scraper_name}.timeout", 25)
 
+        # Sesión HTTP (se crea al primer acceso a self.session)
+        self._session: Optional["requests.Session"] = None
+        # Digest del último JSON de cookies escrito (ver _save_session_cookies)
+        self._cookie_digest: Optional[bytes] = None
+
+    @property
+    def session(self) -> "requests.Session":
+        """
+        Sesión HTTP del scraper (requests se importa recién al primer uso).
+
+        Cada scraper monta su propio adapter (pool y reintentos) para el
+        host que consulta.
+        """
+        if self._session is None:
+            import requests
+            self._session = requests.Session()
+        return self._session
+
+    def _make_driver(
+        self,
+        profile_name: Optional[str] = None,
+        extra_args: Sequence[str] = (),
+        disable_features: Sequence[str] = (),
+        page_load_strategy: str = "eager",
+        block_resources: Optional[bool] = None,
+    ) -> None:
+        """
+        Inicializa self.driver (Chromium) con lógica multi-arquitectura.
+
+        Compartido por los scrapers con Selenium: cada uno solo aporta su
+        perfil y sus argumentos de Chrome propios.
+
+        Args:
+            profile_name: Subdirectorio de datos de Chromium en prod
+                (chromium_data_<perfil>). Por defecto, el nombre del scraper.
+            extra_args: Argumentos de Chrome adicionales (ej. '--window-size=...').
+            disable_features: Features extra para el único --disable-features.
+            page_load_strategy: 'eager' (default), 'normal' o 'none'.
+            block_resources: Bloquear imágenes/CSS/fuentes vía preferencias.
+                Si es None, se lee '<scraper>.block_resources' (default True).
+
+        Raises:
+            RuntimeError: Si no se pudo iniciar ningún driver.
+        """
+        from selenium import webdriver
+        from selenium.webdriver.chrome.options import Options
+        from selenium.webdriver.chrome.service import Service
+
+        options = Options()
+        # 'eager': driver.get vuelve en DOMContentLoaded (las esperas sondean el DOM)
+        options.page_load_strategy = page_load_strategy
+        if self.headless:
+            options.add_argument("--headless=new")
+        # No descargar imágenes/CSS/fuentes: solo se lee el HTML
+        if block_resources is None:
+            block_resources = self.config.get_bool(f"{self.scraper_name}.block_resources", True)
+        if block_resources:
+            options.add_experimental_option("prefs", _BLOCKED_CONTENT_PREFS)
+            options.add_argument("--blink-settings=imagesEnabled=false")
+
+        # Argumentos de Seguridad/Headless
+        options.add_argument("--disable-gpu")
+        options.add_argument("--disable-software-rasterizer")
+        options.add_argument("--disable-dev-shm-usage")
+        options.add_argument("--no-sandbox")
+        options.add_argument("--disable-setuid-sandbox")
+        # Chrome solo respeta el ÚLTIMO --disable-features: van en uno solo
+        features = ("UtilityProcessSandbox", "TranslateService", *disable_features)
+        options.add_argument(f"--disable-features={','.join(features)}")
+        options.add_argument("--disable-dbus")
+
+        # Rutas de datos persistentes (prod), escribibles por el usuario 'track'
+        if self.env_name == "prod":
+            data_dir = f"/var/lib/personal-track/chromium_data_{profile_name or self.scraper_name}"
+            options.add_argument(f"--user-data-dir={data_dir}/user-data")
+            options.add_argument(f"--disk-cache-dir={data_dir}/cache")
+            options.add_argument(f"--crash-dumps-dir={data_dir}/crash-dumps")
+
+        for arg in extra_args:
+            options.add_argument(arg)
+
+        options.add_experimental_option("excludeSwitches", ["enable-automation"])
+        options.add_experimental_option("useAutomationExtension", False)
+
+        # Binario de Chromium (descubrimiento cacheado por proceso). Si no se
+        # encuentra, Selenium Manager resuelve (PC local).
+        found_binary = _detect_chromium_binary()
+        if found_binary:
+            options.binary_location = found_binary
+            self.logger.info(f"Usando binario de Chromium: {found_binary}")
+
+        is_arm = _is_arm_architecture()
+
+        # 1. RPi/ARM: chromedriver del sistema (executable_path: no confiar en el PATH de servicios)
+        if is_arm:
+            for path in _detect_chromedriver(is_arm):
+                self.logger.info(f"Usando chromedriver del sistema ARM: {path}")
+                try:
+                    self.driver = webdriver.Chrome(service=Service(executable_path=path), options=options)
+                    self._setup_driver()
+                    return
+                except Exception as e:
+                    self.logger.warning(f"Driver ARM encontrado pero falló al iniciar: {e}")
+                    continue
+
+            # La descarga de WDM es x86-64: en ARM no sirve
+            raise RuntimeError("Driver ARM no encontrado/funcional. La descarga automática está deshabilitada en esta arquitectura (Exec format error).")
+
+        # 2. PC: Selenium Manager
+        try:
+            self.logger.info("Intentando iniciar driver con Selenium Manager (PC x86-64).")
+            self.driver = webdriver.Chrome(options=options)
+            self._setup_driver()
+            return
+        except Exception as e1:
+            self.logger.warning(f"Selenium Manager falló: {e1}")
+
+        # 3. PC: chromedriver del sistema (ej. Arch) o, si no hay, WebDriver Manager
+        try:
+            if os.path.exists("/usr/bin/chromedriver"):
+                self.logger.info("Intentando con /usr/bin/chromedriver.")
+                service = Service("/usr/bin/chromedriver")
+            else:
+                self.logger.info("Intentando descarga con WebDriver Manager (solo para PC).")
+                from webdriver_manager.chrome import ChromeDriverManager
+                service = Service(ChromeDriverManager().install())
+            self.driver = webdriver.Chrome(service=service, options=options)
+            self._setup_driver()
+        except Exception as e3:
+            raise RuntimeError(f"No se pudo inicializar Chrome (PC Error): {e3}")
+
+    def _setup_driver(self) -> None:
+        """Ajustes tras crear el driver. Las subclases pueden extenderlo."""
+        self.driver.set_page_load_timeout(self.timeout)
+
+    def _acquire_driver(self) -> None:
+        """
+        Toma un navegador del BrowserPool para self.driver (scrapers con Selenium).
+        Si no hay uno ocioso para este scraper, lo lanza con self._make_driver().
+        """
+        from .browser_pool import BrowserPool
+
+        def launch():
+            self._make_driver()
+            return self.driver
+
+        self.driver = BrowserPool.acquire(self.scraper_name, launch)
+
+    def _release_driver(self, discard: bool = False) -> None:
+        """
+        Devuelve self.driver al BrowserPool (lo cierra si toca reciclarlo).
+        Con discard=True se cierra siempre (ej. navegador en mal estado tras un error).
+        """
+        from .browser_pool import POOL_RECYCLE_AFTER, BrowserPool
+
+        if self.driver is None:
+            return
+        recycle_after = 0 if discard else self.config.get_int("general.browser_recycle_after", POOL_RECYCLE_AFTER)
+        BrowserPool.release(self.scraper_name, self.driver, recycle_after=recycle_after)
+        self.driver = None
+
+    def _session_cookies_path(self) -> Path:
+        """Ruta del JSON de cookies de sesión ('<scraper>.cookies_file' o config/<scraper>_cookies.json)."""
+        path = self.config.get(f"{self.scraper_name}.cookies_file")
+        if path:
+            return Path(path).expanduser().resolve()
+        return self.config_dir / f"{self.scraper_name}_cookies.json"
+
+    def _save_session_cookies(self, note: str = "") -> None:
+        """
+        Guarda las cookies del dominio actual de self.driver en JSON.
+
+        Si el contenido no cambió desde el último guardado de esta instancia,
+        no escribe. La escritura es atómica (archivo temporal + os.replace).
+
+        Args:
+            note: Contexto para el log (ej. 'post-login').
+        """
+        suffix = f" - {note}" if note else ""
+        try:
+            # Orden estable para que el mismo conjunto produzca el mismo JSON
+            cookies = sorted(self.driver.get_cookies(), key=lambda c: (c.get("domain", ""), c["name"]))
+            payload = json.dumps(cookies, ensure_ascii=False, separators=(",", ":"))
+            digest = hashlib.blake2b(payload.encode("utf-8"), digest_size=16).digest()
+            if digest == self._cookie_digest:
+                self.logger.debug(f"Cookies sin cambios, no se reescriben{suffix}")
+                return
+
+            path = self._session_cookies_path()
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_name(path.name + ".tmp")
+            tmp_path.write_text(payload, encoding="utf-8")
+            os.replace(tmp_path, path)
+            self._cookie_digest = digest
+            self.logger.info(f"Cookies de sesión guardadas ({len(cookies)} items){suffix}.")
+        except Exception as e:
+            self.logger.warning(f"No se pudieron guardar las cookies de sesión{suffix}: {e}")
+
+    def _restore_session_cookies(self, home_url: str) -> bool:
+        """
+        Navega a `home_url` si no se está ya en su dominio (add_cookie lo
+        exige) y aplica las cookies guardadas. Se ignoran si el archivo
+        tiene más de 7 días.
+
+        Returns:
+            True si se aplicó al menos una cookie.
+        """
+        path = self._session_cookies_path()
+        try:
+            if time.time() - path.stat().st_mtime > _SESSION_COOKIES_MAX_AGE:
+                self.logger.info("Cookies de sesión vencidas (más de 7 días); se hará login.")
+                return False
+            cookies = json.loads(path.read_text(encoding="utf-8"))
+        except OSError:
+            return False # Sin cookies guardadas
+        except ValueError as e:
+            self.logger.warning(f"Archivo de cookies corrupto ({path}): {e}")
+            return False
+
+        now = time.time()
+        if urlsplit(self.driver.current_url or "").netloc != urlsplit(home_url).netloc:
+            self.driver.get(home_url)
+        applied = 0
+        for c in cookies:
+            if c.get("expiry") and c["expiry"] < now:
+                continue # Vencida
+            c.pop("sameSite", None) # A veces rechazada por add_cookie
+            try:
+                self.driver.add_cookie(c)
+                applied += 1
+            except Exception:
+                continue # Ignorar cookies individuales que fallen
+        self.logger.info(f"Cookies de sesión restauradas ({applied} items).")
+        return applied > 0
+
     @abstractmethod
     def fetch_data(self) -> List[Any]:
         """
@@ -72,17 +394,22 @@ class BaseScraper(ABC):
         """
         pass
 
-    def save_data(self, data: List[Any]) -> Optional[Path]:
+    def save_data(self, data: List[Any], timestamp: Optional[str] = None) -> Optional[Path]:
         """
         Guarda los datos en JSON de forma consistente.
         Retorna la ruta a json_path o None si no hay datos.
+
+        Args:
+            data: Lista de dataclasses o dicts.
+            timestamp: Sufijo del nombre de archivo; si es None, se usa el momento actual.
         """
         if not data:
             self.logger.warning("No hay datos para guardar.")
             return None
 
         # Generar nombres de archivo con timestamp
-        timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
+        if timestamp is None:
+            timestamp = self._file_timestamp()
         base_name = f"{self.scraper_name}_{timestamp}"
 
         json_path = self.outdir / f"{base_name}.json"
@@ -91,12 +418,29 @@ class BaseScraper(ABC):
         is_dc = is_dataclass(data[0])
 
         # Guardar JSON
-        # Convertir dataclasses a dicts; si ya son dicts, usarlos tal cual.
-        json_data = [asdict(item) for item in data] if is_dc else data
-        
+        # Se escribe item por item (sin armar una copia completa de la lista);
+        # cada item se re-indenta para que el archivo quede idéntico a
+        # json.dump(lista, indent=2).
         try:
-            with open(json_path, "w", encoding="utf-8") as f:
-                json.dump(json_data, f, ensure_ascii=False, indent=2)
+            if orjson is not None:
+                # orjson serializa dataclasses directamente (sin asdict) y emite UTF-8
+                with open(json_path, "wb") as f:
+                    f.write(b"[\n")
+                    for i, item in enumerate(data):
+                        if i:
+                            f.write(b",\n")
+                        f.write(b"  " + self._orjson_dumps(item).replace(b"\n", b"\n  "))
+                    f.write(b"\n]")
+            else:
+                with open(json_path, "w", encoding="utf-8") as f:
+                    f.write("[\n")
+                    for i, item in enumerate(data):
+                        if i:
+                            f.write(",\n")
+                        # Convertir dataclasses a dicts; si ya son dicts, usarlos tal cual.
+                        obj = asdict(item) if is_dc else item
+                        f.write("  " + json.dumps(obj, ensure_ascii=False, indent=2).replace("\n", "\n  "))
+                    f.write("\n]")
         except Exception as e:
             self.logger.error(f"Error al guardar JSON en {json_path}: {e}")
             return None # Falló el guardado
@@ -104,14 +448,30 @@ class BaseScraper(ABC):
         self.logger.info(f"Datos guardados: {json_path.name}")
         return json_path
 
+    @staticmethod
+    def _orjson_dumps(obj: Any) -> bytes:
+        """Serializa con orjson (indent=2); tipos no soportados caen a str()."""
+        return orjson.dumps(obj, default=str, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+
+    @staticmethod
+    def _file_timestamp() -> str:
+        """Timestamp para nombres de archivo (ej. '2024-01-31_12-00-00')."""
+        return datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
+
     def run(self) -> Optional[Path]:
         """
         Ejecuta el ciclo completo: fetch -> save.
+
+        Ante un error, el traceback se loguea solo si
+        '{scraper_name}.verbose_errors' está activo.
         """
         try:
+            # Timestamp de la corrida, calculado una sola vez
+            timestamp = self._file_timestamp()
             self.logger.info(f"Iniciando scraper: {self.scraper_name}")
             data = self.fetch_data()
-            return self.save_data(data)
+            return self.save_data(data, timestamp=timestamp)
         except Exception as e:
-            self.logger.error(f"Error fatal en {self.scraper_name}: {e}", exc_info=True)
+            verbose = self.config.get_bool(f"{self.scraper_name}.verbose_errors", False)
+            self.logger.error(f"Error fatal en {self.scraper_name}: {e}", exc_info=verbose)
             raise # Re-lanzar la excepción
@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+# src/browser_pool.py
+
+"""
+Pool de navegadores (BrowserPool) para los scrapers con Selenium.
+
+Opcionalmente mantiene vivo, por proceso, un driver de Chromium por perfil
+('linkedin', 'upso', ...). Un scraper que vuelve a ejecutarse en el mismo
+proceso (reintentos, corridas repetidas) reutiliza el navegador ya abierto,
+con su sesión, en lugar de pagar otro arranque en frío + login.
+
+Por defecto (recycle_after = 0) no se reutiliza nada: release() cierra el
+driver enseguida, como antes del pool. En una corrida normal cada perfil se
+usa una sola vez, y un Chromium ocioso por perfil no entra en la RAM de la
+RPi. Con recycle_after > 0 los drivers se reciclan (quit + nuevo) tras ese
+número de usos; los ociosos se cierran con shutdown(), que el dueño del
+proceso debe llamar explícitamente (main.py lo hace tras cada runner): en
+los workers de un ProcessPoolExecutor los hooks de atexit no corren.
+"""
+
+from __future__ import annotations
+
+# Importaciones de la Biblioteca Estándar
+import logging
+import threading
+from typing import TYPE_CHECKING, Callable, Dict, Tuple
+
+if TYPE_CHECKING:
+    from selenium import webdriver
+
+logger = logging.getLogger("browser_pool")
+
+# Usos por driver antes de reciclarlo; 0 = cerrarlo tras cada uso
+# (override con general.browser_recycle_after)
+POOL_RECYCLE_AFTER = 0
+
+
+class BrowserPool:
+    """
+    Pool por proceso de drivers de Chromium, uno ocioso por perfil.
+
+    Uso:
+        driver = BrowserPool.acquire("upso", factory)
+        try:
+            ...
+        finally:
+            BrowserPool.release("upso", driver, recycle_after=100)
+    """
+
+    # perfil -> (driver ocioso, usos acumulados)
+    _idle: Dict[str, Tuple["webdriver.Chrome", int]] = {}
+    # id(driver) -> usos acumulados, para los drivers prestados
+    _uses: Dict[int, int] = {}
+    _lock = threading.Lock()
+
+    @classmethod
+    def acquire(cls, profile: str, factory: Callable[[], "webdriver.Chrome"]) -> "webdriver.Chrome":
+        """
+        Devuelve el driver ocioso de `profile` si sigue vivo; si no, crea uno con `factory`.
+
+        Args:
+            profile: Nombre del perfil (normalmente el del scraper).
+            factory: Función sin argumentos que lanza un driver nuevo.
+
+        Returns:
+            Un driver listo para usar (exclusivo hasta que se libere).
+        """
+        with cls._lock:
+            driver, uses = cls._idle.pop(profile, (None, 0))
+
+        if driver is not None and cls._is_alive(driver):
+            logger.info(f"Reutilizando navegador del pool '{profile}' (usos: {uses}).")
+        else:
+            if driver is not None:
+                cls._quit(driver)
+            driver, uses = factory(), 0
+
+        with cls._lock:
+            cls._uses[id(driver)] = uses + 1
+        return driver
+
+    @classmethod
+    def release(cls, profile: str, driver: "webdriver.Chrome", recycle_after: int = POOL_RECYCLE_AFTER) -> None:
+        """
+        Devuelve `driver` al pool. Se cierra si alcanzó `recycle_after` usos,
+        si el reciclado está deshabilitado (recycle_after <= 0) o si ya hay
+        otro driver ocioso para el perfil.
+        """
+        with cls._lock:
+            uses = cls._uses.pop(id(driver), 0)
+            keep = 0 < uses < recycle_after and profile not in cls._idle
+            if keep:
+                cls._idle[profile] = (driver, uses)
+
+        if not keep:
+            cls._quit(driver)
+            return
+
+        # Dejar una sola pestaña abierta para el próximo uso
+        try:
+            handles = driver.window_handles
+            for handle in handles[1:]:
+                driver.switch_to.window(handle)
+                driver.close()
+            driver.switch_to.window(handles[0])
+        except Exception as e:
+            logger.warning(f"Navegador del pool '{profile}' inutilizable al liberarlo: {e}")
+            with cls._lock:
+                cls._idle.pop(profile, None)
+            cls._quit(driver)
+
+    @classmethod
+    def shutdown(cls) -> None:
+        """Cierra todos los drivers ociosos del proceso."""
+        with cls._lock:
+            drivers = [driver for driver, _ in cls._idle.values()]
+            cls._idle.clear()
+        for driver in drivers:
+            cls._quit(driver)
+
+    @staticmethod
+    def _is_alive(driver: "webdriver.Chrome") -> bool:
+        """True si el navegador sigue respondiendo a comandos."""
+        try:
+            driver.current_window_handle
+            return True
+        except Exception:
+            return False
+
+    @staticmethod
+    def _quit(driver: "webdriver.Chrome") -> None:
+        """quit() que no propaga errores (el proceso del navegador puede haber muerto)."""
+        try:
+            driver.quit()
+        except Exception:
+            pass
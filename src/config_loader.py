@@ -17,15 +17,80 @@ from __future__ import annotations
 # Importaciones de la Biblioteca Estándar
 import os
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 # Importaciones de Terceros
 from dotenv import load_dotenv
 import yaml
 
+# Loader en C (libyaml) si está disponible; si no, el SafeLoader en Python puro.
+try:
+    from yaml import CSafeLoader as _YAMLLoader
+except ImportError:
+    from yaml import SafeLoader as _YAMLLoader
+
+# Cache de instancias por (config_dir, env_name). Evita re-parsear los .env
+# y settings.yaml cuando se ejecutan varios scrapers en el mismo proceso.
+_CONFIG_CACHE: Dict[Tuple[Path, str], "Config"] = {}
+
+# Valores string que get_bool interpreta como True
+_TRUTHY = frozenset({'true', '1', 'yes', 'on', 't', 'y'})
+
+# mtime de cada archivo .env ya cargado en este proceso. Si no cambió,
+# load_dotenv no vuelve a abrirlo ni parsearlo.
+_DOTENV_MTIMES: Dict[Path, float] = {}
+
+# Último .env.{env_name} aplicado a os.environ. Si se pide otro entorno, el
+# del entorno pedido se recarga aunque su mtime no haya cambiado (otro .env
+# pudo haber pisado sus valores en el medio).
+_ACTIVE_ENV_FILE: Optional[Path] = None
+
+
+def _load_dotenv_cached(path: Path, force: bool = False) -> bool:
+    """
+    Carga `path` con load_dotenv(override=True) solo si cambió desde la última vez.
+
+    Args:
+        path: Ruta al archivo .env.
+        force: Recargar aunque el mtime no haya cambiado.
+
+    Returns:
+        True si el archivo se (re)cargó, False si se omitió.
+    """
+    try:
+        mtime = path.stat().st_mtime
+    except OSError:
+        _DOTENV_MTIMES.pop(path, None)
+        return False # No existe; load_dotenv tampoco haría nada
+    if not force and _DOTENV_MTIMES.get(path) == mtime:
+        return False
+    load_dotenv(dotenv_path=path, override=True)
+    _DOTENV_MTIMES[path] = mtime
+    return True
+
+
+def _flatten(tree: Dict[str, Any], prefix: str = "") -> Dict[str, Any]:
+    """
+    Aplana un dict anidado a claves con notación de puntos.
+
+    Ej: `{'coursera': {'outdir': 'x'}}` -> `{'coursera': {...}, 'coursera.outdir': 'x'}`.
+    Los nodos intermedios también se incluyen, para que `get('coursera')`
+    siga devolviendo la sección completa.
+    """
+    flat: Dict[str, Any] = {}
+    for k, v in tree.items():
+        key = f"{prefix}{k}"
+        flat[key] = v
+        if isinstance(v, dict):
+            flat.update(_flatten(v, prefix=f"{key}."))
+    return flat
+
 
 class Config:
     """Cargador unificado de configuración desde .env y YAML."""
+
+    # Atributos fijos: sin __dict__ por instancia
+    __slots__ = ("config_dir", "env_name", "_yaml_config", "_flat")
     
     def __init__(self, config_dir: Path, env_name: str = "dev"):
         """
@@ -36,14 +101,51 @@ class Config:
             env_name: Entorno de ejecución (ej. 'dev', 'prod').
         """
         self.config_dir = config_dir
-        # Carga las variables de entorno primero
-        self._env_config = self._load_env(env_name)
+        self.env_name = env_name
+        # Carga las variables de entorno primero (quedan en os.environ)
+        self._load_env(env_name)
         # Carga el YAML después
         self._yaml_config = self._load_yaml()
+        # Índice plano 'seccion.clave' -> valor para búsquedas O(1). Un YAML
+        # cuya raíz no es un mapeo (lista, escalar) no aporta claves.
+        self._flat = _flatten(self._yaml_config) if isinstance(self._yaml_config, dict) else {}
+
+    @classmethod
+    def get_or_create(cls, config_dir: Path, env_name: str = "dev") -> "Config":
+        """
+        Devuelve la instancia cacheada para (config_dir, env_name),
+        creándola la primera vez.
 
-    def _load_env(self, env_name: str) -> Dict[str, str]:
+        Args:
+            config_dir: Ruta al directorio de configuración (ej. 'config/').
+            env_name: Entorno de ejecución (ej. 'dev', 'prod').
+
+        Returns:
+            La instancia de Config compartida.
+        """
+        key = (Path(config_dir), env_name)
+        config = _CONFIG_CACHE.get(key)
+        if config is None:
+            config = _CONFIG_CACHE[key] = cls(config_dir, env_name=env_name)
+        return config
+
+    @classmethod
+    def invalidate(cls) -> None:
+        """
+        Vacía el cache de instancias y el de archivos .env (útil en tests o
+        tras editar la config): el próximo get_or_create relee todo.
         """
-        Carga variables de entorno desde archivos .env.
+        global _ACTIVE_ENV_FILE
+        _CONFIG_CACHE.clear()
+        _DOTENV_MTIMES.clear()
+        _ACTIVE_ENV_FILE = None
+
+    def _load_env(self, env_name: str) -> None:
+        """
+        Carga variables de entorno desde archivos .env hacia os.environ.
+
+        Cada archivo se parsea una sola vez por proceso mientras su mtime
+        no cambie y el entorno activo sea el mismo.
         
         Prioridad (el último gana):
         1. Variables del sistema existentes.
@@ -52,20 +154,20 @@ class Config:
         
         Args:
             env_name: El nombre del entorno (dev, prod).
-
-        Returns:
-            Un diccionario de os.environ actualizado.
         """
         
+        global _ACTIVE_ENV_FILE
+
         # 1. Cargar config de entorno (ej: config/.env.dev)
         env_path = self.config_dir / f".env.{env_name}"
-        load_dotenv(dotenv_path=env_path, override=True) # Pisa vars del sistema
+        switched = env_path != _ACTIVE_ENV_FILE
+        reloaded = _load_dotenv_cached(env_path, force=switched) # Pisa vars del sistema
+        _ACTIVE_ENV_FILE = env_path
 
         # 2. Cargar secretos (ej: config/.env)
+        # Si se recargó .env.{env}, hay que re-aplicar .env para que siga ganando.
         secret_path = self.config_dir / ".env"
-        load_dotenv(dotenv_path=secret_path, override=True) # Pisa vars del sistema Y de .env.dev
-        
-        return dict(os.environ)
+        _load_dotenv_cached(secret_path, force=reloaded) # Pisa vars del sistema Y de .env.dev
 
     def _load_yaml(self) -> Dict[str, Any]:
         """Carga la configuración base desde settings.yaml."""
@@ -74,7 +176,7 @@ class Config:
             return {}
         try:
             with open(yaml_path, "r", encoding="utf-8") as f:
-                return yaml.safe_load(f) or {}
+                return yaml.load(f, Loader=_YAMLLoader) or {}
         except Exception as e:
             print(f"Error al cargar settings.yaml: {e}")
             return {}
@@ -84,6 +186,9 @@ class Config:
         Obtiene un valor de configuración con prioridad.
 
         Prioridad: .env (MAYUSCULAS_CON_GUION) > YAML (dot.notation) > default.
+
+        Las variables de entorno se leen en vivo desde os.environ (no hay
+        copia), por lo que cambios posteriores a os.environ son visibles.
         
         Ej: `get('coursera.email')` buscará:
         1. OS.environ['COURSERA_EMAIL']
@@ -99,23 +204,12 @@ class Config:
         """
         # 1. Buscar en .env (convertir 'db.host' a 'DB_HOST')
         env_key = key.upper().replace('.', '_')
-        if env_key in self._env_config:
-            return self._env_config[env_key]
+        value = os.environ.get(env_key)
+        if value is not None:
+            return value
 
-        # 2. Buscar en YAML (usando notación con puntos)
-        yaml_keys = key.split('.')
-        current = self._yaml_config
-        try:
-            for k in yaml_keys:
-                if isinstance(current, dict) and k in current:
-                    current = current[k]
-                else:
-                    # No encontrado en YAML, devolver default
-                    return default
-            # Encontrado en YAML
-            return current
-        except Exception:
-            return default # Fallback por si la estructura no es un dict
+        # 2. Buscar en YAML (índice plano con notación de puntos)
+        return self._flat.get(key, default)
 
     def get_list(self, key: str, default: Optional[List[str]] = None) -> List[str]:
         """
@@ -140,13 +234,14 @@ class Config:
     def get_bool(self, key: str, default: bool = False) -> bool:
         """
         Obtiene un valor y lo convierte a booleano.
-        Maneja 'true', '1', 'yes', 'on' como True.
+        Maneja 'true', '1', 'yes', 'on', 't', 'y' como True (sin distinguir mayúsculas).
         """
         value = self.get(key, default)
         if isinstance(value, bool):
             return value
         if isinstance(value, str):
-            return value.lower() in ('true', '1', 'yes', 'on')
+            s = value.strip()
+            return s in _TRUTHY or s.lower() in _TRUTHY
         
         # Fallback (ej. 0 -> False, 1 -> True)
         return bool(value)
\ No newline at end of file
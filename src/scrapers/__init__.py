@@ -1,14 +1,36 @@
 # src/scrapers/__init__.py
-from .coursera_progress import CourseraProgressScraper
-from .github_daily_activity import GitHubDailyActivityScraper
-from .goodreads_reading import GoodreadsReadingScraper
-from .upso_study_plan import UPSOStudyPlanScraper
-from .linkedin_profile import LinkedInProfileScraper # <--- AÑADIDO
-
-__all__ = [
-    'CourseraProgressScraper',
-    'GitHubDailyActivityScraper', 
-    'GoodreadsReadingScraper',
-    'UPSOStudyPlanScraper',
-    'LinkedInProfileScraper' # <--- AÑADIDO
-]
\ No newline at end of file
+"""
+Paquete de scrapers.
+
+Las clases se importan de forma diferida (PEP 562): cada módulo se carga
+recién cuando se accede a su clase, para no arrastrar Selenium/requests/BS4
+de todos los scrapers cuando solo se ejecuta uno (o `--list`/`--help`).
+"""
+
+import importlib
+
+# Nombre público -> (módulo, clase)
+_CLASS_MAP = {
+    'CourseraProgressScraper': ('coursera_progress', 'CourseraProgressScraper'),
+    'GitHubDailyActivityScraper': ('github_daily_activity', 'GitHubDailyActivityScraper'),
+    'GoodreadsReadingScraper': ('goodreads_reading', 'GoodreadsReadingScraper'),
+    'UPSOStudyPlanScraper': ('upso_study_plan', 'UPSOStudyPlanScraper'),
+    'LinkedInProfileScraper': ('linkedin_profile', 'LinkedInProfileScraper'),
+}
+
+__all__ = list(_CLASS_MAP)
+
+
+def __getattr__(name):
+    """Importa el módulo del scraper solicitado al primer acceso."""
+    try:
+        module_name, class_name = _CLASS_MAP[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    cls = getattr(importlib.import_module(f".{module_name}", __name__), class_name)
+    globals()[name] = cls  # Cachear para accesos siguientes
+    return cls
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
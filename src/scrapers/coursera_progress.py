@@ -12,32 +12,384 @@ junto con su porcentaje de finalización.
 from __future__ import annotations
 
 # Importaciones de la Biblioteca Estándar
-import json
 import logging
 import os
-import platform
 import re
 import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from types import MappingProxyType
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
 # Importaciones de Terceros (Selenium)
 from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.chrome.service import Service
+from selenium.common.exceptions import NoSuchElementException, StaleElementReferenceException
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.remote.webelement import WebElement
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.ui import WebDriverWait
 
-# NOTA: webdriver_manager se importa condicionalmente dentro de _make_driver
-# como un fallback, para no hacerlo un requisito estricto si no se usa.
-
 # Importaciones Locales
-from src.base_scraper import BaseScraper
+from src.base_scraper import BaseScraper, _is_arm_architecture
+
+
+# Página de inicio (dominio de las cookies de sesión)
+_HOME_URL = "https://www.coursera.org/"
+
+# Recursos que el scraper nunca lee (imágenes, fuentes, media, trackers).
+# Se bloquean vía CDP solo en headless: con ventana visible puede haber que
+# resolver un captcha a mano, y ese necesita sus imágenes.
+_BLOCKED_URLS = [
+    "*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.svg",
+    "*.woff", "*.woff2", "*.ttf", "*.mp4", "*.webm",
+    "*google-analytics*", "*googletagmanager*", "*doubleclick*",
+    "*hotjar*", "*segment.io*", "*segment.com*",
+]
+
+# Regex de porcentajes (compiladas una vez)
+_RE_PCT_COMPLETE = re.compile(r'(\d{1,3})\s?%\s*(?:complete|completado|completados?)', re.I)
+_RE_PCT_BARE = re.compile(r'(\d{1,3})\s?%')
+# Tarjeta de especialización ("Course 1 of 5")
+_RE_SPEC = re.compile(r'\bCourse\s+\d+\s+of\s+\d+\b', re.I)
+
+# Polling de las esperas: más rápido que el default de Selenium (0.5s)
+_WAIT_POLL = 0.15
+_WAIT_IGNORED = (NoSuchElementException, StaleElementReferenceException)
+
+# Vida de la sonda de estado: consultas dentro del mismo "tick" (< 1 poll)
+# reutilizan el resultado en vez de volver a preguntar al navegador
+_STATE_TTL = 0.1
+
+# Estado devuelto si la sonda falla (ej. navegación en curso)
+_STATE_UNKNOWN = MappingProxyType({"logged_in": False, "challenge": False, "learning_loaded": False, "url": ""})
+
+# Extracción de progreso de un contenedor en una sola llamada al navegador.
+# Mismo orden que antes: aria-valuenow de [role=progressbar] -> style.width
+# (en %) del primer elemento con estilo -> texto ("85% complete", o solo "85%").
+# Devuelve el número crudo (o null); el clamp a 0-100 se hace en Python.
+_PCT_FN_JS = r"""
+function pct(c) {
+    var pb = c.querySelector('[role="progressbar"]');
+    if (pb) {
+        var v = parseFloat(pb.getAttribute('aria-valuenow'));
+        if (!isNaN(v)) return v;
+    }
+    var s = c.querySelector('[style*="width"][style*="%"]');
+    if (s) {
+        // Propiedad ya parseada por el navegador (ej. "80%"), sin regex sobre el atributo
+        var m = /(\d{1,3})(?:\.\d+)?%$/.exec(s.style.width);
+        if (m) return +m[1];
+    }
+    var t = c.innerText || '';
+    var m1 = /(\d{1,3})\s?%\s*(?:complete|completado|completados?)/i.exec(t);
+    if (m1) return +m1[1];
+    var m2 = /(\d{1,3})\s?%/.exec(t);
+    return m2 ? +m2[1] : null;
+}
+"""
+_PCT_JS = _PCT_FN_JS + "return pct(arguments[0]);"
+
+# Estrategia 2 de _parse_courses en un solo recorrido del DOM: por cada enlace
+# a un curso dentro de `scope`, busca su contenedor (article > li > section >
+# div tipo card, en ese orden de prioridad) y devuelve título, href y progreso.
+# Aplica el mismo filtro que antes: sin % debe decir "Resume"/"Continuar".
+# Requiere pct() (_PCT_FN_JS).
+_ANCHORS_FN_JS = r"""
+function harvestAnchors(scope) {
+    var anchors = scope.querySelectorAll('a[href*="/learn/"], a[href*="/courses/"]');
+    var DIV_CARD = 'div[class*="card"], div[class*="Card"], div[class*="Row"], div[class*="Grid"]';
+    var items = [];
+    for (var i = 0; i < anchors.length; i++) {
+        var a = anchors[i];
+        var up = a.parentElement;
+        var card = (up && (up.closest('article') || up.closest('li') ||
+                           up.closest('section') || up.closest(DIV_CARD))) || a;
+        var percent = pct(card);
+        if (percent === null) {
+            var txt = (card.innerText || '').toLowerCase();
+            if (txt.indexOf('resume') < 0 && txt.indexOf('continuar') < 0 && txt.indexOf('%') < 0) continue;
+        }
+        var title = (a.getAttribute('aria-label') || a.innerText || '').trim();
+        if (!title) {
+            var h = card.querySelector('h2, h3, h4, span');
+            if (h) title = (h.getAttribute('aria-label') || h.innerText || '').trim();
+        }
+        if (!a.href || !title) continue;
+        items.push({title: title, href: a.href, percent: percent});
+    }
+    return {total: anchors.length, items: items};
+}
+"""
+
+# Señales de estado de la página, compartidas por la sonda puntual y los
+# observers async: sesión iniciada (avatar/links de perfil en el header),
+# desafío presente (iframes o elementos de captcha/hCaptcha/Cloudflare) y
+# "My Learning" cargada (pestaña activa, <h1> visible o enlaces a cursos).
+_STATE_FN_JS = r"""
+var LOGGED_IN = 'header img[alt*="avatar"], header img[src*="avatar"], header img[src*="profile"], ' +
+    'header button[aria-label*="Account"], header button[aria-label*="Cuenta"], ' +
+    'header a[href="/my-learning"], header a[href*="/profile"], header a[href*="/user/"]';
+var LEARNING_NAMES = ['my learning', 'mi aprendizaje'];
+function loggedIn() {
+    return !!document.querySelector(LOGGED_IN);
+}
+function challengePresent() {
+    var frames = document.getElementsByTagName('iframe');
+    for (var i = 0; i < frames.length; i++) {
+        var title = (frames[i].getAttribute('title') || '').toLowerCase();
+        var src = (frames[i].getAttribute('src') || '').toLowerCase();
+        if (/captcha|challenge/.test(title) || /captcha|hcaptcha|cf-chl/.test(src)) return true;
+    }
+    return !!document.querySelector('[class*="captcha"], [id*="captcha"], [class*="challenge"]');
+}
+function learningLoaded() {
+    if (location.href.toLowerCase().indexOf('/my-learning') < 0) return false;
+    var tab = document.querySelector('.isCurrent > span:nth-child(1) .cds-button-label');
+    if (tab && LEARNING_NAMES.indexOf((tab.textContent || '').trim().toLowerCase()) >= 0) return true;
+    var hs = document.getElementsByTagName('h1');
+    for (var i = 0; i < hs.length; i++) {
+        var t = (hs[i].textContent || '').replace(/\s+/g, ' ').trim();
+        if ((t === 'My Learning' || t === 'Mi aprendizaje') && hs[i].getClientRects().length) return true;
+    }
+    return !!document.querySelector('a[href*="/learn/"], a[href*="/courses/"]');
+}
+"""
 
+# Sonda puntual: las tres señales + URL en un solo round-trip (ver _probe_state)
+_STATE_JS = _STATE_FN_JS + """
+return {logged_in: loggedIn(), challenge: challengePresent(),
+        learning_loaded: learningLoaded(), url: location.href};
+"""
+
+# Espera (async) a que "My Learning" parezca cargada (learningLoaded). Usa un
+# MutationObserver en lugar de sondear con sleeps; antes de observar hace un
+# scroll como "empujón" para disparar la carga diferida.
+# arguments[0] = timeout en ms. Devuelve true/false.
+_WAIT_MY_LEARNING_JS = _STATE_FN_JS + r"""
+var timeoutMs = arguments[0], cb = arguments[arguments.length - 1];
+var done = false, mo = null;
+function finish(ok) {
+    if (done) return;
+    done = true;
+    if (mo) mo.disconnect();
+    cb(ok);
+}
+window.scrollTo(0, document.body ? document.body.scrollHeight / 3 : 0);
+window.scrollTo(0, 0);
+if (learningLoaded()) { finish(true); return; }
+mo = new MutationObserver(function () { if (learningLoaded()) finish(true); });
+mo.observe(document.documentElement, {childList: true, subtree: true, attributes: true, attributeFilter: ['class']});
+setTimeout(function () { finish(learningLoaded()); }, timeoutMs);
+"""
+
+# Vigila (async) la resolución de un captcha/puzzle: resuelve con
+# {state: 'logged_in'} ante señales de sesión (o URL de perfil),
+# {state: 'puzzle_gone'} si ya no hay desafío, o {state: 'timeout'}.
+# arguments[0] = ms.
+_CHALLENGE_WATCH_JS = _STATE_FN_JS + r"""
+var timeoutMs = arguments[0], cb = arguments[arguments.length - 1];
+var done = false, mo = null, pending = false;
+function state() {
+    var url = location.href;
+    if (loggedIn() || url.indexOf('/profile') >= 0 || url.indexOf('/user/') >= 0) return 'logged_in';
+    if (!challengePresent()) return 'puzzle_gone';
+    return null;
+}
+function finish(st) {
+    if (done) return;
+    done = true;
+    if (mo) mo.disconnect();
+    cb({state: st});
+}
+function check() {
+    pending = false;
+    var st = state();
+    if (st) finish(st);
+}
+var st0 = state();
+if (st0) { finish(st0); return; }
+mo = new MutationObserver(function () {
+    if (!pending) { pending = true; setTimeout(check, 50); }
+});
+mo.observe(document.documentElement, {childList: true, subtree: true, attributes: true,
+                                      attributeFilter: ['class', 'id', 'src', 'title', 'href']});
+setTimeout(function () { finish(state() || 'timeout'); }, timeoutMs);
+"""
+
+# Filas de cursos dentro de una tarjeta, en un solo round-trip y con CSS en
+# lugar del XPath anterior (mismas reglas, en orden de documento):
+#   li con algún a/h3/span adentro, o div con clase "row"/"ListItem" o con
+#   un botón "Resume" adentro.
+_ROWS_FN_JS = r"""
+function rowsOf(card) {
+    var out = [], els = card.querySelectorAll('li, div');
+    for (var i = 0; i < els.length; i++) {
+        var e = els[i];
+        if (e.tagName === 'LI') {
+            if (e.querySelector('a, h3, span')) out.push(e);
+            continue;
+        }
+        var cls = e.getAttribute('class') || '';
+        if (cls.indexOf('row') >= 0 || cls.indexOf('ListItem') >= 0) { out.push(e); continue; }
+        var btns = e.getElementsByTagName('button');
+        for (var j = 0; j < btns.length; j++) {
+            if ((btns[j].textContent || '').indexOf('Resume') >= 0) { out.push(e); break; }
+        }
+    }
+    return out;
+}
+"""
+_ROWS_JS = _ROWS_FN_JS + "return rowsOf(arguments[0]);"
+
+# Datos de una fila de curso: título (aria-label o texto del primer
+# h2/h3/h4/a/span), enlace a /learn|/courses, progreso (pct) y si dice
+# "Not started". Devuelve null si falta título o enlace.
+_ROW_INFO_FN_JS = r"""
+var NOT_STARTED = /\bNot\s+started\b|\bNo\s+iniciado\b/i;
+function rowInfo(row) {
+    var t = row.querySelector('h2, h3, h4, a, span');
+    var title = t ? (t.getAttribute('aria-label') || t.innerText || '').trim() : '';
+    var a = row.querySelector('a[href*="/learn/"], a[href*="/courses/"]');
+    var href = a ? a.href : '';
+    if (!title || !href) return null;
+    var percent = pct(row);
+    return {title: title, href: href, percent: percent,
+            not_started: percent === null && NOT_STARTED.test(row.innerText || '')};
+}
+"""
+# Una fila en un solo round-trip (fallback por WebElements). arguments[0] = fila.
+_EXTRACT_ROW_JS = _PCT_FN_JS + _ROW_INFO_FN_JS + "return rowInfo(arguments[0]);"
+
+# Estrategia 1: tarjetas de especialización ("Course N of M") -> filas
+# (rowInfo), más el progreso de la tarjeta (spec_percent).
+_SPECS_FN_JS = r"""
+var CARDS = 'article, section, li[class*="card"], li[class*="Card"], ' +
+    'div[class*="card"], div[class*="Card"], div[class*="Grid"]';
+var SPEC = /\bCourse\s+\d+\s+of\s+\d+\b/i;
+function harvestSpecs(scope) {
+    var cards = scope.querySelectorAll(CARDS), specs = [];
+    for (var i = 0; i < cards.length; i++) {
+        var card = cards[i];
+        if (!SPEC.test(card.innerText || '')) continue;
+        var rows = rowsOf(card), items = [];
+        for (var j = 0; j < rows.length; j++) {
+            var info = rowInfo(rows[j]);
+            if (info) items.push(info);
+        }
+        specs.push({percent: pct(card), items: items});
+    }
+    return specs;
+}
+"""
+
+# Ambas estrategias de _parse_courses en una sola llamada al navegador.
+# arguments[0] = <main>. Devuelve {specs: [...], anchors: {total, items}};
+# el clamp, el fallback a spec_percent y la deduplicación van en Python.
+_HARVEST_JS = _PCT_FN_JS + _ROWS_FN_JS + _ROW_INFO_FN_JS + _SPECS_FN_JS + _ANCHORS_FN_JS + r"""
+var scope = arguments[0];
+return {specs: harvestSpecs(scope), anchors: harvestAnchors(scope)};
+"""
+
+# Valores aceptados por Chrome para pageLoadStrategy ('none' vuelve apenas
+# empieza la navegación; las esperas explícitas cubren el resto)
+_PAGE_LOAD_STRATEGIES = frozenset({"normal", "eager", "none"})
+
+# Tamaño explícito del caché en disco del perfil persistente (100 MB)
+_DISK_CACHE_BYTES = 100 * 1024 * 1024
+
+# Tramo máximo de cada espera async del puzzle (el cliente HTTP de Selenium
+# corta las respuestas lentas, así que no se espera todo de una vez)
+_CHALLENGE_WATCH_CHUNK = 60
+
+# Separador para combinar varios selectores del mismo tipo en una sola consulta
+_LOCATOR_JOINERS = {By.CSS_SELECTOR: ", ", By.XPATH: " | "}
+
+
+def _compile_locators(locators: Sequence[Tuple[str, str]]) -> Tuple[Tuple[str, str], ...]:
+    """
+    Agrupa localizadores consecutivos del mismo tipo en un único selector.
+
+    Ej: dos CSS seguidos -> 'a, b'; dos XPath seguidos -> 'x | y'. Así una
+    sola consulta (un round-trip al driver por poll) prueba todas las
+    alternativas. Otros tipos de By quedan como están.
+    """
+    groups: List[Tuple[str, List[str]]] = []
+    for by, value in locators:
+        if groups and groups[-1][0] == by and by in _LOCATOR_JOINERS:
+            groups[-1][1].append(value)
+        else:
+            groups.append((by, [value]))
+    return tuple((by, _LOCATOR_JOINERS.get(by, "").join(values)) for by, values in groups)
+
+
+# Localizadores (CSS y XPath), construidos una sola vez al importar. Se
+# prefiere CSS por atributo; XPath queda solo donde hace falta el texto.
+# Se usan múltiples selectores para resiliencia ante cambios en la UI.
+_LOCATORS = MappingProxyType({
+    "email": (
+        (By.CSS_SELECTOR, 'input[type="email"]'),
+        (By.CSS_SELECTOR, 'input[name="email"]'),
+        (By.CSS_SELECTOR, 'input[autocomplete="username"]'),
+    ),
+    "email_continue": (
+        (By.CSS_SELECTOR, 'form button[type="submit"]'),
+        (By.XPATH, '//form//button[contains(.,"Continue") or contains(.,"Siguiente") or contains(.,"Next")]'),
+    ),
+    "password": (
+        (By.CSS_SELECTOR, 'input[type="password"]'),
+        (By.CSS_SELECTOR, 'input[name="password"]'),
+        (By.CSS_SELECTOR, 'input[autocomplete="current-password"]'),
+    ),
+    "submit": (
+        (By.CSS_SELECTOR, 'form button[type="submit"]'),
+    ),
+    "email_tab": (
+        (By.XPATH, '//button[contains(.,"Email") or contains(.,"Correo")]'),
+        (By.XPATH, '//a[contains(.,"Email") or contains(.,"Correo")]'),
+    ),
+    "cookie_accept": (
+        (By.XPATH, '//button[contains(.,"Accept") and contains(.,"cookies")]'),
+        (By.XPATH, '//button[contains(.,"Aceptar") and contains(.,"cookies")]'),
+    ),
+})
+# Versión compilada: un selector combinado por cada tramo del mismo tipo de By
+_LOCATORS_COMPILED = MappingProxyType({k: _compile_locators(v) for k, v in _LOCATORS.items()})
+
+# Pestaña "In Progress"/"En curso" (de más a menos específico)
+_IN_PROGRESS_TAB_XPATHS = (
+    '//button[normalize-space()="In Progress"]',
+    '//button[contains(.,"In Progress")]',
+    '//button[normalize-space()="En curso"]',
+    '//button[contains(.,"En curso")]',
+    '//a[normalize-space()="In Progress"]',
+    '//a[normalize-space()="En curso"]',
+)
+
+# Selectores de "My Learning" y del login, construidos una sola vez
+# Tarjetas candidatas a especialización (dentro de <main>)
+_CARD_XPATH = (
+    './/article | .//section | '
+    './/li[contains(@class,"card") or contains(@class,"Card")] | '
+    './/div[contains(@class,"card") or contains(@class,"Card") or contains(@class,"Grid")]'
+)
+# Formulario de login: en un modal o en la página
+_LOGIN_DIALOG_FORM_XPATH = '//div[@role="dialog"]//form'
+_LOGIN_PAGE_FORM_XPATH = '//form[.//input[@type="email" or @name="email"]]'
+_EMAIL_TAB_XPATH = './/button[contains(.,"Email") or contains(.,"Correo")]'
+# Botón "Log In" del header (cuando no aparece el formulario)
+_HEADER_LOGIN_XPATH = (
+    '//header//a[normalize-space()="Log In" or normalize-space()="Sign in" or normalize-space()="Iniciar sesión"] | '
+    '//header//button[normalize-space()="Log In" or normalize-space()="Sign in" or normalize-space()="Iniciar sesión"]'
+)
+# Enlace/botón "My Learning" para la navegación manual (de más a menos específico)
+_MY_LEARNING_LINK_XPATHS = (
+    '//a[@href="/my-learning"]',
+    ('//a[span[normalize-space()="My Learning"]] | //a[normalize-space()="My Learning"] | '
+     '//a[span[normalize-space()="Mi aprendizaje"]] | //a[normalize-space()="Mi aprendizaje"] | '
+     '//button[normalize-space()="My Learning"] | //button[normalize-space()="Mi aprendizaje"]'),
+)
 
 @dataclass
 class CourseProgress:
@@ -71,224 +423,157 @@ class CourseraProgressScraper(BaseScraper):
         self.email = self.config.get("coursera.email")
         self.password = self.config.get("coursera.password")
         self.puzzle_max_wait = self.config.get_int("coursera.puzzle_max_wait", 300)
+        self.block_resources = self.config.get_bool("coursera.block_resources", True)
+        # 'eager': driver.get vuelve en DOMContentLoaded (las esperas ya sondean el DOM)
+        self.page_load_strategy = str(self.config.get("coursera.page_load_strategy", "eager")).strip().lower()
+        if self.page_load_strategy not in _PAGE_LOAD_STRATEGIES:
+            self.logger.warning(f"page_load_strategy inválido ({self.page_load_strategy!r}); se usa 'eager'.")
+            self.page_load_strategy = "eager"
         
         if not self.email or not self.password:
             raise ValueError("Faltan las variables COURSERA_EMAIL o COURSERA_PASSWORD")
             
         self.driver: Optional[webdriver.Chrome] = None
+        # WebDriverWait reutilizables por timeout (ver _wait); dependen del driver
+        self._waits: Dict[int, WebDriverWait] = {}
+        # Escritor de dumps HTML en segundo plano (se crea al primer dump)
+        self._dump_exec: Optional[ThreadPoolExecutor] = None
+        # Última sonda de estado: (monotonic, resultado)
+        self._state_cache: Tuple[float, Dict[str, Any]] = (0.0, _STATE_UNKNOWN)
         
         # URLs y configuraciones
         self.login_url = "https://www.coursera.org/?authMode=login&redirectTo=%2Fmy-learning"
         self.timeout = self.config.get_int("coursera.timeout", 25)
         
-        # Localizadores (CSS y XPath)
-        # Se usan múltiples selectores para resiliencia ante cambios en la UI.
-        self.locators = {
-            "email": [
-                (By.CSS_SELECTOR, 'input[type="email"]'),
-                (By.CSS_SELECTOR, 'input[name="email"]'),
-                (By.XPATH, '//input[@autocomplete="username"]'),
-            ],
-            "email_continue": [
-                (By.CSS_SELECTOR, 'form button[type="submit"]'),
-                (By.XPATH, '//form//button[contains(.,"Continue") or contains(.,"Siguiente") or contains(.,"Next")]'),
-            ],
-            "password": [
-                (By.CSS_SELECTOR, 'input[type="password"]'),
-                (By.CSS_SELECTOR, 'input[name="password"]'),
-                (By.XPATH, '//input[@autocomplete="current-password" or @type="password"]'),
-            ],
-            "submit": [
-                (By.CSS_SELECTOR, 'form button[type="submit"]'),
-                (By.XPATH, '//form//button[contains(.,"Log in") or contains(.,"Acceder") or contains(.,"Iniciar sesión") or contains(.,"Sign in")]'),
-            ],
-            "email_tab": [
-                (By.XPATH, '//button[contains(.,"Email") or contains(.,"Correo")]'),
-                (By.XPATH, '//a[contains(.,"Email") or contains(.,"Correo")]'),
-            ],
-            "cookie_accept": [
-                (By.XPATH, '//button[contains(.,"Accept") and contains(.,"cookies")]'),
-                (By.XPATH, '//button[contains(.,"Aceptar") and contains(.,"cookies")]'),
-            ],
-        }
-
-    def _is_arm_architecture(self) -> bool:
-        """Determina si estamos ejecutando en una arquitectura ARM (como Raspberry Pi)."""
-        arch = platform.machine().lower()
-        return any(a in arch for a in ["arm", "aarch64", "armv"])
+        # Localizadores (módulo; ver _LOCATORS)
+        self.locators = _LOCATORS
+        self._locators_compiled = _LOCATORS_COMPILED
 
     def _make_driver(self) -> None:
-        """Inicializa el driver de Selenium con lógica multi-arquitectura."""
-        
-        options = Options()
-        if self.headless:
-            options.add_argument("--headless=new")
-        
-        # Argumentos de Seguridad/Headless Agregados
-        options.add_argument("--disable-gpu")
-        options.add_argument("--disable-software-rasterizer")
-        options.add_argument("--disable-dev-shm-usage")
-        options.add_argument("--no-sandbox")
-        options.add_argument("--window-size=1280,1600")
-
-        # Bloque de perfil de usuario para 'prod'
-        if self.env_name == "prod":
-            # Forzar a Chromium a usar directorios escribibles por el usuario 'track'.
-            data_dir = "/var/lib/personal-track/chromium_data_coursera"
-            options.add_argument(f"--user-data-dir={data_dir}/user-data")
-            options.add_argument(f"--disk-cache-dir={data_dir}/cache")
-            options.add_argument(f"--crash-dumps-dir={data_dir}/crash-dumps")
-
-        options.add_argument("--disable-setuid-sandbox")
-        options.add_argument("--disable-features=UtilityProcessSandbox") # Necesario a veces en RPi
-        options.add_argument("--disable-features=TranslateService") 
-        options.add_argument("--disable-dbus") # CLAVE: Inhabilita la conexión a D-Bus
-        
-        options.add_experimental_option("excludeSwitches", ["enable-automation"])
-        options.add_experimental_option("useAutomationExtension", False)
-
-        # Encontrar el binario de Chromium en rutas conocidas
-        chromium_binaries = [
-            "/usr/bin/chromium",
-            "/usr/bin/chromium-browser",
-            "/usr/lib/chromium/chromium",
-            "/usr/lib/chromium-browser/chromium-browser",
-        ]
-        
-        found_binary = None
-        for path in chromium_binaries:
-            if os.path.exists(path):
-                found_binary = path
-                break
-        
-        if not found_binary and self.env_name == "prod":
-             # Si estamos en prod y no encontramos ninguno, fallar rápido
-             raise FileNotFoundError(f"No se encontró el binario de Chromium en ninguna ruta: {chromium_binaries}")
-        elif found_binary:
-             options.binary_location = found_binary
-             self.logger.info(f"Usando binario de Chromium: {found_binary}")
-        # Si no se encontró y estamos en 'dev', dejamos que Selenium Manager (PC) resuelva
-        
-        is_arm = self._is_arm_architecture()
-        
-        # 1. Intento RPi/ARM: Usar driver pre-instalado
-        if is_arm:
-            # Rutas conocidas en Debian/RPi
-            arm_driver_paths = [
-                "/usr/bin/chromedriver",
-                "/usr/lib/chromium-browser/chromedriver",
-                "/usr/lib/chromium/chromedriver",
-            ]
-            
-            for path in arm_driver_paths:
-                if os.path.exists(path):
-                    self.logger.info(f"Usando chromedriver del sistema ARM: {path}")
-                    try:
-                        # Usamos executable_path ya que no confiamos en el PATH en servicios
-                        service = Service(executable_path=path) 
-                        self.driver = webdriver.Chrome(service=service, options=options)
-                        self.driver.set_page_load_timeout(self.timeout)
-                        return
-                    except Exception as e:
-                        self.logger.warning(f"Driver ARM encontrado pero falló al iniciar: {e}")
-                        continue
-            
-            # Si el driver ARM no funciona, saltamos la descarga de WDM (x86-64)
-            raise RuntimeError("Driver ARM no encontrado/funcional. La descarga automática está deshabilitada en esta arquitectura (Exec format error).")
+        """
+        Inicializa el driver (ver BaseScraper._make_driver) con perfil
+        persistente y, en RPi/prod, perfil de memoria reducida.
+        """
+        extra_args = ["--window-size=1280,1600", f"--disk-cache-size={_DISK_CACHE_BYTES}"]
+        # En headless se bloquean solo las imágenes (el resto vía CDP, ver
+        # _configure_network); con ventana visible puede haber un captcha.
+        if self.headless and self.block_resources:
+            extra_args.append("--blink-settings=imagesEnabled=false")
+
+        # Perfil persistente: el caché HTTP (bundles JS/CSS de Coursera)
+        # sobrevive entre corridas, así solo la primera paga la carga en frío.
+        # En prod lo arma la base (chromium_data_coursera).
+        if self.env_name != "prod":
+            profile_dir = self.config_dir / "chromium_profile_coursera"
+            try:
+                profile_dir.mkdir(parents=True, exist_ok=True)
+                extra_args.append(f"--user-data-dir={profile_dir.resolve()}")
+            except OSError as e:
+                self.logger.warning(f"No se pudo crear el perfil persistente ({e}); se usa uno temporal.")
+
+        # Perfil de memoria reducida (RPi/prod): menos procesos de renderer
+        # y heap de V8 acotado, para que Chromium no termine paginando a la SD.
+        disable_features: Tuple[str, ...] = ()
+        if _is_arm_architecture() or self.env_name == "prod":
+            disable_features = ("IsolateOrigins", "site-per-process")
+            extra_args += ["--renderer-process-limit=2", "--no-zygote", "--js-flags=--max-old-space-size=256"]
+            single_process = self.config.get_bool("coursera.single_process", False)
+            if single_process:
+                extra_args.append("--single-process") # Más liviano, pero menos estable
+            self.logger.info(
+                f"Perfil de memoria reducida para Chromium (single_process={single_process})."
+            )
 
-        # 2. Intento PC (Selenium Manager)
-        try:
-            # Esto funciona en PC x86-64 y usa el driver descargado por Selenium Manager
-            self.logger.info("Intentando iniciar driver con Selenium Manager (PC x86-64).")
-            self.driver = webdriver.Chrome(options=options)
-            self.driver.set_page_load_timeout(self.timeout)
-            return
-        except Exception as e1:
-            self.logger.warning(f"Selenium Manager falló: {e1}")
+        super()._make_driver(
+            extra_args=extra_args,
+            disable_features=disable_features,
+            page_load_strategy=self.page_load_strategy,
+            block_resources=False, # Sin bloquear CSS: las esperas chequean visibilidad
+        )
 
-        # 3. Intento PC (WebDriver Manager - Fallback)
+    def _wait(self, timeout: int) -> WebDriverWait:
+        """
+        Devuelve un WebDriverWait cacheado para `timeout` segundos, con
+        polling de 0.15s e ignorando elementos ausentes/obsoletos.
+        """
+        wait = self._waits.get(timeout)
+        if wait is None:
+            wait = self._waits[timeout] = WebDriverWait(
+                self.driver, timeout, poll_frequency=_WAIT_POLL, ignored_exceptions=_WAIT_IGNORED
+            )
+        return wait
+
+    def _setup_driver(self) -> None:
+        """Ajustes comunes tras crear el driver (timeouts y red)."""
+        self._waits.clear() # Las esperas cacheadas apuntan al driver anterior
+        super()._setup_driver()
+        # Sin espera implícita: las búsquedas fallidas vuelven al instante y
+        # toda espera es explícita (ver _wait)
+        self.driver.implicitly_wait(0)
+        self._configure_network()
+
+    def _configure_network(self) -> None:
+        """
+        Ajustes de red vía CDP: caché HTTP y service workers habilitados
+        explícitamente (la segunda visita a /my-learning sale del caché), y
+        bloqueo de recursos pesados en headless si está configurado.
+        """
         try:
-            # Si Selenium Manager falla en PC, intentamos con WDM
-            self.logger.info("Intentando descarga con WebDriver Manager (solo para PC).")
-            from webdriver_manager.chrome import ChromeDriverManager
-            service = Service(ChromeDriverManager().install())
-            self.driver = webdriver.Chrome(service=service, options=options)
-            self.driver.set_page_load_timeout(self.timeout)
+            self.driver.execute_cdp_cmd("Network.enable", {})
+            self.driver.execute_cdp_cmd("Network.setCacheDisabled", {"cacheDisabled": False})
+            self.driver.execute_cdp_cmd("Network.setBypassServiceWorker", {"bypass": False})
+        except Exception as e:
+            self.logger.debug(f"No se pudo configurar el caché de red vía CDP: {e}")
+            return
+        if not (self.headless and self.block_resources):
             return
-        except Exception as e3:
-            raise RuntimeError(f"No se pudo inicializar Chrome (PC Error): {e3}")
-
-    def _cookies_path(self) -> Path:
-        """Devuelve la ruta estandarizada para el archivo de cookies."""
-        env_path = self.config.get("coursera.cookies_file")
-        if env_path:
-            return Path(env_path).expanduser().resolve()
-        return self.config_dir / "coursera_cookies.json"
-
-    def _refresh_and_save_cookies(self, note: str = "") -> None:
-        """Refresca la página actual y guarda las cookies en el archivo JSON."""
+        try:
+            self.driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": _BLOCKED_URLS})
+        except Exception as e:
+            self.logger.warning(f"No se pudo configurar el bloqueo de recursos vía CDP: {e}")
+
+    def _save_cookies(self, note: str = "") -> None:
+        """
+        Guarda las cookies de Coursera (ver BaseScraper._save_session_cookies).
+        No refresca la página: get_cookies solo ve el dominio actual, así que
+        se navega a coursera.org únicamente si se está en otro.
+        """
         if not self.driver:
             return
         try:
             if "coursera.org" not in (self.driver.current_url or ""):
-                self.driver.get("https://www.coursera.org/")
-                time.sleep(0.8)
-            else:
-                self.driver.refresh()
-                time.sleep(0.8)
-            
-            cookies = self.driver.get_cookies()
-            path = self._cookies_path()
-            path.parent.mkdir(parents=True, exist_ok=True)
-            
-            with open(path, "w", encoding="utf-8") as f:
-                json.dump(cookies, f, ensure_ascii=False, indent=2)
-            
-            self.logger.info(f"Cookies guardadas ({len(cookies)} items){' - ' + note if note else ''}")
+                self.driver.get(_HOME_URL)
         except Exception as e:
             self.logger.warning(f"No se pudieron guardar cookies ({note}): {e}")
+            return
+        self._save_session_cookies(note)
 
     def _load_cookies(self) -> bool:
-        """Carga las cookies desde el archivo JSON y las aplica al driver."""
+        """Aplica las cookies guardadas (ver BaseScraper._restore_session_cookies) y recarga."""
         if not self.driver:
             return False
-            
-        path = self._cookies_path()
-        if not path.exists():
-            return False
-            
         try:
-            with open(path, "r", encoding="utf-8") as f:
-                cookies = json.load(f)
-            
-            # Se necesita visitar el dominio antes de añadir cookies
-            self.driver.get("https://www.coursera.org/")
-            
-            for c in cookies:
-                # 'sameSite' y 'expiry' a veces causan problemas al cargar
-                c.pop("sameSite", None)
-                c.pop("expiry", None)
-                try:
-                    self.driver.add_cookie(c)
-                except Exception:
-                    # Ignorar cookies individuales que fallen
-                    continue
-                    
+            # Se necesita el documento del dominio antes de añadir cookies
+            self.driver.get(_HOME_URL)
+            self._await_document_ready() # Con 'none', get() no espera al documento
+            if not self._restore_session_cookies(_HOME_URL):
+                return False
             self.driver.refresh()
-            time.sleep(1.2)
-            self.logger.info("Cookies restauradas exitosamente")
+            self._await_document_ready()
             return True
         except Exception as e:
             self.logger.warning(f"Error al cargar cookies: {e}")
             return False
 
-    def _find_first(self, locators: List[Tuple[str, str]], timeout: Optional[int] = None) -> WebElement:
+    def _find_first(self, locators: Sequence[Tuple[str, str]], timeout: Optional[int] = None) -> WebElement:
         """
         Encuentra el primer elemento que coincida con una lista de localizadores.
 
         Args:
-            locators: Lista de tuplas (By, selector_value).
-            timeout: Tiempo máximo de espera (usa self.timeout si es None).
+            locators: Lista de tuplas (By, selector_value), idealmente ya
+                compiladas con `_compile_locators`.
+            timeout: Tiempo máximo de espera total (usa self.timeout si es None);
+                se reparte entre los grupos, con un mínimo de 2s por grupo.
 
         Returns:
             El primer WebElement encontrado.
@@ -297,67 +582,63 @@ class CourseraProgressScraper(BaseScraper):
             TimeoutError: Si ningún localizador encuentra un elemento.
         """
         timeout = timeout or self.timeout
+        per_group = max(2, timeout // max(1, len(locators)))
         for by, value in locators:
             try:
-                return WebDriverWait(self.driver, timeout).until(
+                return self._wait(per_group).until(
                     EC.presence_of_element_located((by, value))
                 )
             except Exception:
                 continue
         raise TimeoutError(f"No se encontró elemento con {locators=}")
 
-    def _click_first_visible(self, locators: List[Tuple[str, str]], timeout: Optional[int] = None) -> None:
+    def _click_first_visible(self, locators: Sequence[Tuple[str, str]], timeout: Optional[int] = None) -> WebElement:
         """
         Hace click en el primer elemento clickeable de una lista de localizadores.
 
         Args:
-            locators: Lista de tuplas (By, selector_value).
-            timeout: Tiempo máximo de espera (usa self.timeout si es None).
+            locators: Lista de tuplas (By, selector_value), idealmente ya
+                compiladas con `_compile_locators`.
+            timeout: Tiempo máximo de espera total (usa self.timeout si es None);
+                se reparte entre los grupos, con un mínimo de 2s por grupo.
+
+        Returns:
+            El WebElement clickeado (para esperar luego a que desaparezca).
 
         Raises:
             TimeoutError: Si ningún elemento es clickeable.
         """
         timeout = timeout or self.timeout
+        per_group = max(2, timeout // max(1, len(locators)))
         for by, value in locators:
             try:
-                el = WebDriverWait(self.driver, timeout).until(
+                el = self._wait(per_group).until(
                     EC.element_to_be_clickable((by, value))
                 )
                 el.click()
-                return
+                return el
             except Exception:
                 continue
         raise TimeoutError(f"No se pudo hacer click en el elemento deseado: {locators=}")
 
-    def _has_text(self, text: str, pattern: str) -> bool:
-        """Verifica si el texto coincide con un patrón regex (case-insensitive)."""
-        try:
-            return re.search(pattern, text, re.I) is not None
-        except Exception:
-            return False
-
     def _ensure_in_progress_tab(self) -> None:
         """Asegura que la pestaña 'In Progress' (o 'En curso') esté seleccionada."""
         try:
-            # Lista de XPaths para encontrar la pestaña "En curso"
-            for xp in [
-                '//button[normalize-space()="In Progress"]',
-                '//button[contains(.,"In Progress")]',
-                '//button[normalize-space()="En curso"]',
-                '//button[contains(.,"En curso")]',
-                '//a[normalize-space()="In Progress"]',
-                '//a[normalize-space()="En curso"]',
-            ]:
+            # XPaths para encontrar la pestaña "En curso"
+            for xp in _IN_PROGRESS_TAB_XPATHS:
                 try:
-                    btn = WebDriverWait(self.driver, 2).until(EC.element_to_be_clickable((By.XPATH, xp)))
+                    btn = self._wait(2).until(EC.element_to_be_clickable((By.XPATH, xp)))
                     # Verificar si ya está seleccionada
                     aria_current = (btn.get_attribute("aria-current") or "").lower()
                     if aria_current in ("page", "true"):
                         return # Ya está seleccionada
                     
-                    # Si no, hacer click
+                    # Si no, hacer click y esperar a que el tab se re-renderice o quede activo
                     btn.click()
-                    time.sleep(0.4)
+                    try:
+                        self._wait(3).until(lambda drv: self._tab_selected_or_stale(btn))
+                    except Exception:
+                        pass # No es crítico; el parseo igual espera a las filas
                     return
                 except Exception:
                     continue
@@ -365,16 +646,38 @@ class CourseraProgressScraper(BaseScraper):
             # Si falla, no es crítico, pero se logueará si no se encuentran cursos.
             pass
 
+    @staticmethod
+    def _tab_selected_or_stale(btn: WebElement) -> bool:
+        """True si el tab quedó marcado como actual o fue reemplazado en el DOM."""
+        try:
+            return (btn.get_attribute("aria-current") or "").lower() in ("page", "true")
+        except StaleElementReferenceException:
+            return True # React re-renderizó la barra de tabs
+
+    def _await_document_ready(self, timeout: int = 8) -> bool:
+        """
+        Espera a que exista <body> y el documento haya salido de 'loading'.
+        Reemplaza las pausas fijas tras refresh/navegación.
+        """
+        try:
+            self._wait(timeout).until(EC.presence_of_element_located((By.TAG_NAME, "body")))
+            self._wait(timeout).until(
+                lambda drv: drv.execute_script("return document.readyState") != "loading"
+            )
+            return True
+        except Exception:
+            return False
+
     def _extract_percent_text(self, text: str) -> Optional[int]:
         """Extrae un porcentaje (ej. '85% complete') de una cadena de texto."""
         # Busca "XX% complete" o "XX% completado"
-        m = re.search(r'(\d{1,3})\s?%\s*(?:complete|completado|completados?)', text, re.I)
+        m = _RE_PCT_COMPLETE.search(text)
         if m:
             v = max(0, min(100, int(m.group(1))))
             return v
         
         # Fallback: busca solo "XX%"
-        m2 = re.search(r'(\d{1,3})\s?%', text)
+        m2 = _RE_PCT_BARE.search(text)
         if m2:
             v = max(0, min(100, int(m2.group(1))))
             return v
@@ -382,72 +685,27 @@ class CourseraProgressScraper(BaseScraper):
 
     def _extract_percent_from_container(self, container: WebElement) -> Optional[int]:
         """Extrae el porcentaje de un contenedor de curso (progressbar, style, o texto)."""
-        # 1. Intentar por 'role="progressbar"' (aria-valuenow)
-        try:
-            pb = container.find_element(By.CSS_SELECTOR, '[role="progressbar"]')
-            now = pb.get_attribute("aria-valuenow")
-            if now is not None:
-                return max(0, min(100, int(float(now))))
-        except Exception:
-            pass
-        
-        # 2. Intentar por estilo (ej. style="width: 80%;")
+        # Un único execute_script en lugar de 3-4 round-trips (find_element + .text)
         try:
-            bar = container.find_element(By.XPATH, './/*[contains(@style,"width") and contains(@style,"%")]')
-            style = bar.get_attribute("style") or ""
-            m = re.search(r'width\s*:\s*(\d{1,3})\s?%', style, re.I)
-            if m:
-                return max(0, min(100, int(m.group(1))))
-        except Exception:
-            pass
-            
-        # 3. Intentar por texto dentro del contenedor
-        try:
-            return self._extract_percent_text(container.text or "")
+            val = self.driver.execute_script(_PCT_JS, container)
         except Exception:
             return None
+        if val is None:
+            return None
+        return max(0, min(100, int(val)))
 
     def _find_course_rows(self, card: WebElement) -> List[WebElement]:
         """Encuentra elementos que parecen ser filas de cursos dentro de una tarjeta."""
-        rows = card.find_elements(
-            By.XPATH,
-            # Selector genérico para listas o divs que contienen enlaces/títulos
-            './/li[.//a or .//h3 or .//span] | '
-            './/div[contains(@class,"row") or contains(@class,"ListItem") or .//button[contains(.,"Resume")]]'
-        )
+        # Selector genérico para listas o divs que contienen enlaces/títulos (ver _ROWS_JS)
+        rows = self.driver.execute_script(_ROWS_JS, card) or []
         return rows
 
-    def _safe_text_first(self, scope: WebElement, locators: List[Tuple[str, str]]) -> Optional[str]:
-        """Obtiene texto (aria-label o text) del primer elemento encontrado."""
-        for by, value in locators:
-            try:
-                el = scope.find_element(by, value)
-                # Priorizar aria-label, luego .text
-                txt = (el.get_attribute("aria-label") or el.text or "").strip()
-                if txt:
-                    return txt
-            except Exception:
-                continue
-        return None
-
-    def _attr_first(self, scope: WebElement, attr: str, locators: List[Tuple[str, str]]) -> Optional[str]:
-        """Obtiene un atributo del primer elemento encontrado."""
-        for by, value in locators:
-            try:
-                el = scope.find_element(by, value)
-                v = el.get_attribute(attr)
-                if v:
-                    return v
-            except Exception:
-                continue
-        return None
-
     def _get_login_form(self) -> Optional[WebElement]:
         """Encuentra el formulario de login, ya sea en un modal o en la página."""
         # 1. Buscar en un diálogo/modal
         try:
-            dialog = WebDriverWait(self.driver, 2).until(
-                EC.presence_of_element_located((By.XPATH, '//div[@role="dialog"]//form'))
+            dialog = self._wait(2).until(
+                EC.presence_of_element_located((By.XPATH, _LOGIN_DIALOG_FORM_XPATH))
             )
             return dialog
         except Exception:
@@ -455,75 +713,67 @@ class CourseraProgressScraper(BaseScraper):
             
         # 2. Buscar formulario principal en la página
         try:
-            form = WebDriverWait(self.driver, 2).until(
-                EC.presence_of_element_located((By.XPATH, '//form[.//input[@type="email" or @name="email"]]'))
+            form = self._wait(2).until(
+                EC.presence_of_element_located((By.XPATH, _LOGIN_PAGE_FORM_XPATH))
             )
             return form
         except Exception:
             pass
         return None
 
-    def _is_logged_in(self) -> bool:
-        """Verifica si el usuario parece estar logueado (busca avatar o links de perfil)."""
+    def _probe_state(self, fresh: bool = False) -> Dict[str, Any]:
+        """
+        Consulta en un solo execute_script si hay sesión, si hay un desafío
+        y si 'My Learning' cargó, junto con la URL actual.
+
+        El resultado se reutiliza durante _STATE_TTL segundos, así las
+        comprobaciones encadenadas de un mismo tick cuestan un round-trip.
+
+        Args:
+            fresh: Ignorar el resultado memorizado.
+
+        Returns:
+            Dict con 'logged_in', 'challenge', 'learning_loaded' y 'url'.
+        """
+        now = time.monotonic()
+        ts, state = self._state_cache
+        if not fresh and now - ts < _STATE_TTL:
+            return state
         try:
-            # Busca varios indicadores de sesión activa en el header
-            self.driver.find_element(
-                By.XPATH,
-                '//header//img[contains(@alt,"avatar") or contains(@src,"avatar") or contains(@src,"profile")] | '
-                '//header//button[contains(@aria-label,"Account") or contains(@aria-label,"Cuenta")] | '
-                '//header//a[@href="/my-learning"] | '
-                '//header//a[contains(@href,"/profile")] | '
-                '//header//a[contains(@href,"/user/")]'
-            )
-            return True
+            state = self.driver.execute_script(_STATE_JS) or _STATE_UNKNOWN
         except Exception:
-            return False
+            state = _STATE_UNKNOWN
+        self._state_cache = (now, state)
+        return state
+
+    def _is_logged_in(self) -> bool:
+        """Verifica si el usuario parece estar logueado (busca avatar o links de perfil)."""
+        return bool(self._probe_state()["logged_in"])
 
     def _challenge_present(self) -> bool:
         """Detecta la presencia de un captcha, puzzle o desafío hCaptcha/Cloudflare."""
-        try:
-            # 1. Buscar iframes de desafío
-            iframes = self.driver.find_elements(By.TAG_NAME, "iframe")
-            for fr in iframes:
-                title = (fr.get_attribute("title") or "").lower()
-                src = (fr.get_attribute("src") or "").lower()
-                if any(k in title for k in ("captcha", "challenge")) or \
-                   any(k in src for k in ("captcha", "hcaptcha", "cf-chl")):
-                    return True
-            
-            # 2. Buscar elementos genéricos de desafío
-            self.driver.find_element(By.XPATH, '//*[contains(@class,"captcha") or contains(@id,"captcha") or contains(@class,"challenge")]')
-            return True
-        except Exception:
-            return False
+        return bool(self._probe_state()["challenge"])
 
     def _my_learning_looks_loaded(self) -> bool:
         """Verifica si la página 'My Learning' parece estar completamente cargada."""
-        d = self.driver
-        url_ok = "/my-learning" in (d.current_url or "").lower()
-        if not url_ok:
-            return False
-            
-        # Comprobar indicadores de carga
-        try:
-            el = d.find_element(By.CSS_SELECTOR, '.isCurrent > span:nth-child(1) .cds-button-label')
-            tab_ok = el.text.strip().lower() in ("my learning", "mi aprendizaje")
-        except Exception:
-            tab_ok = False
-            
-        try:
-            h1 = d.find_element(By.XPATH, '//h1[normalize-space()="My Learning" or normalize-space()="Mi aprendizaje"]')
-            h1_ok = h1.is_displayed()
-        except Exception:
-            h1_ok = False
-            
+        return bool(self._probe_state()["learning_loaded"])
+
+    def _has_session_signals(self) -> bool:
+        """Sesión activa: señales de login en el header o ya estamos en /my-learning."""
+        state = self._probe_state()
+        return bool(state["logged_in"]) or "/my-learning" in (state["url"] or "").lower()
+
+    def _await_my_learning(self, timeout: int) -> bool:
+        """
+        Espera hasta `timeout` segundos a que 'My Learning' cargue, observando
+        el DOM desde el navegador (retorna apenas aparece). Si el script async
+        falla, cae a una verificación puntual.
+        """
         try:
-            cards_ok = len(d.find_elements(By.XPATH, '//a[contains(@href,"/learn/") or contains(@href,"/courses/")]')) > 0
+            self.driver.set_script_timeout(timeout + 2)
+            return bool(self.driver.execute_async_script(_WAIT_MY_LEARNING_JS, timeout * 1000))
         except Exception:
-            cards_ok = False
-            
-        # Si la pestaña, el H1 o las tarjetas están presentes, asumimos que cargó.
-        return tab_ok or h1_ok or cards_ok
+            return self._my_learning_looks_loaded()
 
     def _await_puzzle_resolution(self) -> bool:
         """Espera a que el usuario resuelva un puzzle/captcha manualmente."""
@@ -532,24 +782,48 @@ class CourseraProgressScraper(BaseScraper):
         last_notice = -1
 
         if not self._challenge_present():
-            self._refresh_and_save_cookies("puzzle-gone-immediate")
+            self._save_cookies("puzzle-gone-immediate")
             return True
 
         self.logger.info(f"¡PUZZLE DETECTADO! Resuélvelo manualmente en la ventana del navegador.")
         self.logger.info(f"Esperando {self.puzzle_max_wait} segundos...")
 
+        # 1. Vigilar desde el navegador (retorna apenas cambia el DOM), por tramos
+        try:
+            while (remaining := self.puzzle_max_wait - (time.time() - t0)) > 0:
+                chunk = min(_CHALLENGE_WATCH_CHUNK, remaining)
+                d.set_script_timeout(chunk + 5)
+                result = d.execute_async_script(_CHALLENGE_WATCH_JS, int(chunk * 1000)) or {}
+                state = result.get("state")
+                if state == "logged_in":
+                    self._save_cookies("login-signals-after-puzzle")
+                    return True
+                if state == "puzzle_gone":
+                    self._await_document_ready(3) # Por si la página navega al cerrarse el desafío
+                    self._save_cookies("puzzle-gone")
+                    return True
+                elapsed = int(time.time() - t0)
+                self.logger.info(f"Esperando resolución del puzzle… {elapsed}s / {self.puzzle_max_wait}s")
+            self.logger.error("Timeout esperando la resolución del puzzle.")
+            return False
+        except Exception as e:
+            # Ej. navegación en curso (el script se descarta con la página)
+            self.logger.debug(f"Vigilancia async del puzzle interrumpida ({e}); sigo con sondeo.")
+
+        # 2. Fallback: sondeo periódico con el tiempo restante
         while time.time() - t0 < self.puzzle_max_wait:
-            url = d.current_url or ""
+            state = self._probe_state(fresh=True) # Una sola consulta por tick
+            url = state["url"] or ""
             
             # 1. Éxito si vemos señal de login
-            if self._is_logged_in() or "/profile" in url or "/user/" in url:
-                self._refresh_and_save_cookies("login-signals-after-puzzle")
+            if state["logged_in"] or "/profile" in url or "/user/" in url:
+                self._save_cookies("login-signals-after-puzzle")
                 return True
                 
             # 2. Éxito si el desafío desaparece
-            if not self._challenge_present():
-                time.sleep(0.5) # Espera breve a que la página reaccione
-                self._refresh_and_save_cookies("puzzle-gone")
+            if not state["challenge"]:
+                self._await_document_ready(3) # Por si la página navega al cerrarse el desafío
+                self._save_cookies("puzzle-gone")
                 return True
                 
             # Loguear progreso
@@ -567,56 +841,49 @@ class CourseraProgressScraper(BaseScraper):
         """Realiza el proceso completo de login en Coursera."""
         d = self.driver
         d.get(self.login_url)
-        time.sleep(0.6)
         
         # 1. Comprobar si ya estamos logueados
-        if self._is_logged_in() or "/my-learning" in (d.current_url or "").lower():
-            self._refresh_and_save_cookies("already-in")
+        if self._has_session_signals():
+            self._save_cookies("already-in")
             return
 
         # 2. Aceptar cookies si aparece el banner
         try:
-            self._click_first_visible(self.locators["cookie_accept"], timeout=2)
-            time.sleep(0.2)
+            banner_btn = self._click_first_visible(self._locators_compiled["cookie_accept"], timeout=2)
+            self._wait(2).until(EC.invisibility_of_element(banner_btn))
         except Exception:
             pass # No es crítico si no está
 
         # 3. Encontrar el formulario de login
         form = self._get_login_form()
-        if form is None and (self._is_logged_in() or "/my-learning" in (d.current_url or "").lower()):
-            self._refresh_and_save_cookies("no-form-but-logged-in")
+        if form is None and self._has_session_signals():
+            self._save_cookies("no-form-but-logged-in")
             return
             
         # 4. Si no hay formulario, intentar clickear el botón "Log In" del header
         if form is None:
             try:
-                btn_login = WebDriverWait(d, 4).until(EC.element_to_be_clickable((
-                    By.XPATH,
-                    '//header//a[normalize-space()="Log In" or normalize-space()="Sign in" or normalize-space()="Iniciar sesión"] | '
-                    '//header//button[normalize-space()="Log In" or normalize-space()="Sign in" or normalize-space()="Iniciar sesión"]'
-                )))
+                btn_login = self._wait(4).until(EC.element_to_be_clickable((By.XPATH, _HEADER_LOGIN_XPATH)))
                 btn_login.click()
-                time.sleep(0.4)
-                form = self._get_login_form() # Reintentar buscar el formulario
+                form = self._get_login_form() # Reintentar (ya espera a que aparezca)
             except Exception:
                 form = None # Seguir sin formulario
 
         if form is None:
-            if self._is_logged_in() or "/my-learning" in (d.current_url or "").lower():
-                self._refresh_and_save_cookies("logged-in-without-form")
+            if self._has_session_signals():
+                self._save_cookies("logged-in-without-form")
                 return
             raise RuntimeError("No se encontró el formulario de login de Coursera.")
 
         # 5. Asegurar que estamos en la pestaña "Email"
         try:
-            within_email_tab = form.find_element(By.XPATH, './/button[contains(.,"Email") or contains(.,"Correo")]')
+            within_email_tab = form.find_element(By.XPATH, _EMAIL_TAB_XPATH)
             within_email_tab.click()
-            time.sleep(0.1)
         except Exception:
             pass # Asumir que ya está
 
         # 6. Ingresar Email
-        email_field = self._find_first(self.locators["email"], timeout=6)
+        email_field = self._find_first(self._locators_compiled["email"], timeout=6)
         email_field.clear()
         email_field.send_keys(self.email)
         email_field.send_keys(Keys.ENTER)
@@ -626,13 +893,13 @@ class CourseraProgressScraper(BaseScraper):
             self.logger.info("Puzzle detectado antes del password.")
             if not self._await_puzzle_resolution():
                 raise RuntimeError("Timeout esperando la resolución del puzzle (previo a password).")
-            if self._is_logged_in() or "/my-learning" in (d.current_url or "").lower():
-                self._refresh_and_save_cookies("after-prepass-puzzle")
+            if self._has_session_signals():
+                self._save_cookies("after-prepass-puzzle")
                 return
 
         # 8. Ingresar Password
         try:
-            pass_field = self._find_first(self.locators["password"], timeout=10)
+            pass_field = self._find_first(self._locators_compiled["password"], timeout=10)
         except Exception:
             # A veces el ENTER en email no muestra el password si la UI es lenta
             if not self._is_logged_in():
@@ -653,13 +920,13 @@ class CourseraProgressScraper(BaseScraper):
 
         # 10. Esperar confirmación de login
         try:
-            WebDriverWait(d, self.timeout).until(lambda drv: self._is_logged_in() or "/my-learning" in (drv.current_url or "").lower())
+            self._wait(self.timeout).until(lambda drv: self._has_session_signals())
         except Exception:
             if not self._is_logged_in():
                 raise TimeoutError(f"Login fallido. URL actual: {d.current_url}")
 
         self.logger.info("Login exitoso.")
-        self._refresh_and_save_cookies("post-login-final")
+        self._save_cookies("post-login-final")
 
     def _ensure_session(self) -> None:
         """Asegura que haya una sesión activa, usando cookies o logueándose."""
@@ -668,18 +935,10 @@ class CourseraProgressScraper(BaseScraper):
         
         # 1. Intentar cargar con cookies
         try:
-            WebDriverWait(d, 10).until(lambda drv: "/my-learning" in (drv.current_url or "").lower())
-            # Forzar renderizado con scroll
-            for _ in range(3):
-                d.execute_script("window.scrollTo(0, document.body.scrollHeight/3);")
-                time.sleep(0.25)
-                d.execute_script("window.scrollTo(0, 0);")
-                time.sleep(0.25)
-                if self._my_learning_looks_loaded():
-                    return # Éxito con cookies
-            
-            WebDriverWait(d, 4).until(lambda drv: self._my_learning_looks_loaded())
-            return # Éxito con cookies
+            self._wait(10).until(lambda drv: "/my-learning" in (drv.current_url or "").lower())
+            # Forzar renderizado con scroll y esperar a que el DOM muestre la página
+            if self._await_my_learning(6):
+                return # Éxito con cookies
         except Exception:
             pass
             
@@ -695,177 +954,178 @@ class CourseraProgressScraper(BaseScraper):
 
         # 1. Esperar a que la URL sea correcta y la página cargue
         try:
-            WebDriverWait(d, 12).until(lambda drv: "/my-learning" in (drv.current_url or "").lower())
-            for _ in range(2):
-                self._ensure_in_progress_tab()
-                d.execute_script("window.scrollTo(0, document.body.scrollHeight/2);")
-                time.sleep(0.3)
-                d.execute_script("window.scrollTo(0, 0);")
-                time.sleep(0.3)
-                if self._my_learning_looks_loaded():
-                    return
-            WebDriverWait(d, 6).until(lambda drv: self._my_learning_looks_loaded())
-            return
+            self._wait(12).until(lambda drv: "/my-learning" in (drv.current_url or "").lower())
+            self._ensure_in_progress_tab()
+            if self._await_my_learning(6):
+                return
         except Exception:
             pass # Intentar navegación manual
 
         # 2. Fallback: Intentar clickear el enlace "My Learning"
         self.logger.warning("No se pudo cargar /my-learning directamente, intentando click manual.")
-        for xp in [
-            '//a[@href="/my-learning"]',
-            ('//a[span[normalize-space()="My Learning"]] | //a[normalize-space()="My Learning"] | '
-             '//a[span[normalize-space()="Mi aprendizaje"]] | //a[normalize-space()="Mi aprendizaje"] | '
-             '//button[normalize-space()="My Learning"] | //button[normalize-space()="Mi aprendizaje"]')
-        ]:
+        for xp in _MY_LEARNING_LINK_XPATHS:
             try:
-                el = WebDriverWait(d, 6).until(EC.element_to_be_clickable((By.XPATH, xp)))
+                el = self._wait(6).until(EC.element_to_be_clickable((By.XPATH, xp)))
                 el.click()
-                WebDriverWait(d, 10).until(lambda drv: "/my-learning" in (drv.current_url or "").lower())
+                # Esperar directamente la señal de carga (incluye la URL): una
+                # sonda por poll, que sobrevive a la navegación que dispara el click
+                self._wait(10).until(lambda drv: self._my_learning_looks_loaded())
                 self._ensure_in_progress_tab()
-                # Esperar carga post-click
-                for _ in range(2):
-                    d.execute_script("window.scrollTo(0, document.body.scrollHeight/2);")
-                    time.sleep(0.3)
-                    d.execute_script("window.scrollTo(0, 0);")
-                    time.sleep(0.3)
-                    if self._my_learning_looks_loaded():
-                        return
-                WebDriverWait(d, 6).until(lambda drv: self._my_learning_looks_loaded())
                 return
             except Exception:
                 continue
 
         # 3. Fallo total
         debug_path = self.outdir / "debug_last_my_learning.html"
-        try:
-            with open(debug_path, "w", encoding="utf-8") as f:
-                f.write(d.page_source)
-        except Exception as e:
-            self.logger.error(f"No se pudo guardar el dump HTML: {e}")
+        self._dump_page(debug_path)
             
         raise RuntimeError(
             f"No cargó My Learning (URL actual: {d.current_url}). Se guardó dump en {debug_path}"
         )
 
-    def _parse_courses(self) -> List[CourseProgress]:
-        """Parsea la página 'My Learning' para extraer los cursos en progreso."""
-        d = self.driver
-        scope = d.find_element(By.TAG_NAME, 'main') # Buscar solo en el contenido principal
+    def _write_dump(self, path: Path, html: str) -> None:
+        """Escribe un dump HTML (corre en el hilo de dumps)."""
+        try:
+            path.write_text(html, encoding="utf-8")
+        except Exception as e:
+            self.logger.error(f"No se pudo guardar el dump HTML {path}: {e}")
 
-        self._ensure_in_progress_tab() # Asegurar pestaña correcta
-        time.sleep(0.2)
+    def _dump_page(self, path: Path) -> bool:
+        """
+        Guarda el HTML actual del navegador en `path` sin bloquear.
 
-        results: List[CourseProgress] = []
-        seen: set[Tuple[str, str]] = set() # (title, href)
+        El page_source se lee ahora (la página puede cambiar), pero la
+        escritura a disco queda en un hilo aparte. Si el logger no emite
+        WARNING, no se hace nada.
 
-        # 1. Estrategia: Buscar tarjetas de Especialización (que contienen cursos)
-        cards = scope.find_elements(
-            By.XPATH,
-            './/article | .//section | '
-            './/li[contains(@class,"card") or contains(@class,"Card")] | '
-            './/div[contains(@class,"card") or contains(@class,"Card") or contains(@class,"Grid")]'
-        )
+        Returns:
+            True si el dump quedó encolado.
+        """
+        if not self.logger.isEnabledFor(logging.WARNING):
+            return False
+        try:
+            html = self.driver.page_source
+        except Exception as e:
+            self.logger.error(f"No se pudo leer el HTML para el dump: {e}")
+            return False
+        if self._dump_exec is None:
+            self._dump_exec = ThreadPoolExecutor(max_workers=1, thread_name_prefix="coursera-dump")
+        self._dump_exec.submit(self._write_dump, path, html)
+        return True
+
+    def _percent_from(self, el: WebElement) -> Optional[int]:
+        """Progreso de un elemento: contenedor (progressbar/style/texto) o su texto."""
+        p = self._extract_percent_from_container(el)
+        if p is not None:
+            return p
+        txt = (el.text or "").strip()
+        return self._extract_percent_text(txt)
+
+    def _course_from_info(self, info: Dict[str, Any], spec_percent: Optional[int]) -> CourseProgress:
+        """Arma un CourseProgress a partir de rowInfo (ver _ROW_INFO_FN_JS)."""
+        percent = info.get("percent")
+        if percent is not None:
+            percent = max(0, min(100, int(percent)))
+        elif info.get("not_started"):
+            percent = 0
+        else:
+            percent = spec_percent # Usar progreso de la spec como fallback
+        return CourseProgress(title=info["title"], percent=percent, course_url=info["href"])
+
+    def _extract_row(self, row: WebElement, spec_percent: Optional[int]) -> Optional[CourseProgress]:
+        """
+        Extrae un curso de una fila de especialización, o None si no sirve.
+        Un solo execute_script por fila (título, enlace, progreso y "Not started").
+        """
+        try:
+            info = self.driver.execute_script(_EXTRACT_ROW_JS, row)
+        except Exception:
+            return None # Ignorar fila individual
+        return self._course_from_info(info, spec_percent) if info else None
 
-        def _percent_from(el: WebElement) -> Optional[int]:
-            p = self._extract_percent_from_container(el)
-            if p is not None:
-                return p
-            txt = (el.text or "").strip()
-            return self._extract_percent_text(txt)
+    def _parse_spec_cards(self, scope: WebElement, results: List[CourseProgress], seen: set[Tuple[str, str]]) -> None:
+        """
+        Recorrido de especializaciones con WebElements (fallback de
+        _HARVEST_JS). Agrega a `results` los cursos no vistos.
+        """
+        cards = scope.find_elements(By.XPATH, _CARD_XPATH)
 
         for card in cards:
             try:
                 text = card.text or ""
                 # Buscar tarjetas que sean Especializaciones (ej. "Curso 1 de 5")
-                is_spec = self._has_text(text, r'\bCourse\s+\d+\s+of\s+\d+\b')
+                is_spec = _RE_SPEC.search(text) is not None
                 if not is_spec:
                     continue
 
-                spec_percent = _percent_from(card) # Progreso general de la especialización
+                spec_percent = self._percent_from(card) # Progreso general de la especialización
                 rows = self._find_course_rows(card) # Cursos dentro de la especialización
                 
                 for row in rows:
-                    try:
-                        title = self._safe_text_first(row, [(By.XPATH, './/h2|.//h3|.//h4|.//a|.//span')])
-                        href = self._attr_first(row, 'href', [(By.CSS_SELECTOR, 'a[href*="/learn/"], a[href*="/courses/"]')])
-                        
-                        percent = _percent_from(row) # Progreso específico del curso
-                        if percent is None and self._has_text(row.text, r'\bNot\s+started\b|\bNo\s+iniciado\b'):
-                            percent = 0
-                        if percent is None:
-                            percent = spec_percent # Usar progreso de la spec como fallback
-                            
-                        if title and href:
-                            key = (title, href)
-                            if key not in seen:
-                                seen.add(key)
-                                results.append(CourseProgress(title=title, percent=percent, course_url=href))
-                    except Exception:
-                        continue # Ignorar fila individual
+                    course = self._extract_row(row, spec_percent)
+                    if course is None:
+                        continue
+                    key = (course.title, course.course_url)
+                    if key not in seen:
+                        seen.add(key)
+                        results.append(course)
             except Exception:
                 continue # Ignorar tarjeta individual
 
-        # 2. Estrategia: Buscar todos los enlaces de cursos (fallback)
-        anchors = scope.find_elements(By.CSS_SELECTOR, 'a[href*="/learn/"], a[href*="/courses/"]')
-
-        def _nearest_card(a: WebElement) -> WebElement:
-            # Encuentra el contenedor "padre" más cercano que contenga la info
-            for xp in [
-                './ancestor::article[1]',
-                './ancestor::li[1]',
-                './ancestor::section[1]',
-                './ancestor::div[contains(@class,"card") or contains(@class,"Card") or contains(@class,"Row") or contains(@class,"Grid")][1]'
-            ]:
-                try:
-                    return a.find_element(By.XPATH, xp)
-                except Exception:
-                    continue
-            return a # Devolver el mismo anchor como último recurso
+    def _parse_courses(self) -> List[CourseProgress]:
+        """Parsea la página 'My Learning' para extraer los cursos en progreso."""
+        d = self.driver
+        scope = d.find_element(By.TAG_NAME, 'main') # Buscar solo en el contenido principal
 
-        for a in anchors:
-            try:
-                href = a.get_attribute("href")
-                title = (a.get_attribute("aria-label") or a.text or "").strip()
-                card = _nearest_card(a) # Contenedor del enlace
+        self._ensure_in_progress_tab() # Asegurar pestaña correcta (espera al re-render)
 
-                percent = _percent_from(card)
+        results: List[CourseProgress] = []
+        seen: set[Tuple[str, str]] = set() # (title, href)
+
+        # Las dos estrategias corren en el navegador en un solo execute_script.
+        # Si el script falla, la estrategia 1 se recorre con WebElements.
+        try:
+            harvest_all = d.execute_script(_HARVEST_JS, scope) or {}
+        except Exception as e:
+            self.logger.warning(f"No se pudo recorrer la página en el navegador ({e}); se usa el recorrido por filas.")
+            harvest_all = None
+
+        # 1. Estrategia: tarjetas de Especialización (que contienen cursos)
+        if harvest_all is not None:
+            for spec in harvest_all.get("specs") or []:
+                spec_percent = spec.get("percent")
+                if spec_percent is not None:
+                    spec_percent = max(0, min(100, int(spec_percent)))
+                for item in spec.get("items", []):
+                    key = (item["title"], item["href"])
+                    if key not in seen:
+                        seen.add(key)
+                        results.append(self._course_from_info(item, spec_percent))
+        else:
+            self._parse_spec_cards(scope, results, seen)
+
+        # 2. Estrategia: todos los enlaces de cursos (fallback)
+        harvest = (harvest_all or {}).get("anchors") or {}
+        total_anchors = harvest.get("total", 0)
+
+        for item in harvest.get("items", []):
+            title, href, percent = item["title"], item["href"], item["percent"]
+            if percent is not None:
+                percent = max(0, min(100, int(percent)))
+
+            key = (title, href)
+            if key in seen:
+                continue # Ya lo procesamos en la estrategia 1
                 
-                if percent is None:
-                    # Filtro: si no tiene %, al menos debe decir "Resume"
-                    txt = (card.text or "").lower()
-                    if ("resume" not in txt) and ("continuar" not in txt) and ("% " not in txt and "%" not in txt):
-                        continue # Probablemente un curso no iniciado o completado
-
-                if not title:
-                    # Intentar buscar un título mejor en el contenedor
-                    title = self._safe_text_first(card, [(By.XPATH, './/h2|.//h3|.//h4|.//span')]) or title
-
-                if not href or not title:
-                    continue # Dato inútil
-
-                key = (title, href)
-                if key in seen:
-                    continue # Ya lo procesamos en la estrategia 1
-                    
-                seen.add(key)
-                results.append(CourseProgress(title=title, percent=percent, course_url=href))
-            except Exception:
-                continue # Ignorar anchor individual
+            seen.add(key)
+            results.append(CourseProgress(title=title, percent=percent, course_url=href))
 
         # 3. Logueo de depuración si no se encuentra nada
         if not results:
-            try:
-                debug_path = self.outdir / "debug_last_my_learning.html"
-                with open(debug_path, "w", encoding="utf-8") as f:
-                    f.write(d.page_source)
+            debug_path = self.outdir / "debug_last_my_learning.html"
+            if self._dump_page(debug_path):
                 self.logger.warning(f"No se hallaron cursos en progreso. Se guardó dump en: {debug_path}")
-                try:
-                    total_anchors = len(anchors)
-                    self.logger.warning(f"Total anchors '/learn|/courses' encontrados: {total_anchors}")
-                except Exception:
-                    pass
-            except Exception as e:
-                self.logger.error(f"No se pudo guardar el dump HTML de depuración: {e}")
+            self.logger.warning(f"Total anchors '/learn|/courses' encontrados: {total_anchors}")
 
         return results
 
@@ -873,13 +1133,13 @@ class CourseraProgressScraper(BaseScraper):
         """
         Método principal para ejecutar el scraper.
         
-        Inicializa el driver, asegura la sesión (login/cookies) y
-        parsea los cursos en progreso.
+        Obtiene el driver (del BrowserPool si hay uno vivo), asegura la
+        sesión (login/cookies) y parsea los cursos en progreso.
         
         Returns:
             Lista de objetos CourseProgress.
         """
-        self._make_driver()
+        self._acquire_driver() # Navegador del pool (o uno nuevo vía _make_driver)
         if not self.driver:
             raise RuntimeError("El driver de Selenium no se inicializó correctamente.")
             
@@ -904,15 +1164,16 @@ class CourseraProgressScraper(BaseScraper):
         except Exception as e:
             self.logger.error(f"Falló el scraping de Coursera: {e}", exc_info=True)
             # Guardar dump en caso de error inesperado
-            try:
-                debug_path = self.outdir / f"debug_error_{int(time.time())}.html"
-                with open(debug_path, "w", encoding="utf-8") as f:
-                    f.write(self.driver.page_source)
+            debug_path = self.outdir / f"debug_error_{int(time.time())}.html"
+            if self._dump_page(debug_path):
                 self.logger.info(f"Se guardó dump del error en {debug_path}")
-            except Exception as de:
-                self.logger.error(f"No se pudo guardar el dump del error: {de}")
+            # Tras un error el navegador puede quedar en mal estado: descartarlo
+            self._release_driver(discard=True)
             return [] # Devolver lista vacía en caso de error
         finally:
-            if self.driver:
-                self.driver.quit()
-                self.driver = None
\ No newline at end of file
+            self._release_driver()
+            self._waits.clear()
+            # Los dumps pendientes terminan de escribirse en su hilo (se unen al salir)
+            if self._dump_exec is not None:
+                self._dump_exec.shutdown(wait=False)
+                self._dump_exec = None
\ No newline at end of file
@@ -15,19 +15,118 @@ Este script utiliza la API de GitHub para:
 from __future__ import annotations
 
 # Importaciones de la Biblioteca Estándar
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass
 from datetime import datetime, timedelta
+from itertools import islice
 from pathlib import Path
-from typing import Any, Dict, Iterator, List, Optional
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
 from zoneinfo import ZoneInfo
+import hashlib
+import json
+import os
+import re
+import threading
 import time
 
 # Importaciones de Terceros
-import requests
+try:
+    import orjson  # Parser en C, más rápido que json para las páginas de la API
+except ImportError:  # Dependencia opcional
+    orjson = None
+from requests import HTTPError
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 # Importaciones Locales
 from src.base_scraper import BaseScraper
 
+# Prefijo de la API (el adapter con reintentos se monta solo aquí)
+_API_ROOT = "https://api.github.com/"
+
+def _loads(content: bytes) -> Any:
+    """Decodifica el cuerpo JSON de una respuesta (orjson si está disponible)."""
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
+
+# Entradas del header 'Link' de paginación: <url>; rel="next"
+_LINK_RE = re.compile(r'<([^>]+)>;\s*rel="([^"]+)"')
+
+# Páginas pedidas en paralelo por adelantado cuando 'Link' trae rel="last"
+_PAGE_PREFETCH = 4
+
+
+def _page_range(next_url: str, last_url: Optional[str]) -> Optional[List[str]]:
+    """
+    URLs de las páginas desde `next_url` hasta `last_url` (inclusive),
+    cambiando solo el parámetro 'page'. None si no se pueden deducir.
+    """
+    if not last_url:
+        return None
+    parts = urlsplit(next_url)
+    query = dict(parse_qsl(parts.query))
+    last_query = dict(parse_qsl(urlsplit(last_url).query))
+    try:
+        first, last = int(query["page"]), int(last_query["page"])
+    except (KeyError, ValueError):
+        return None # Paginación por cursor u otro formato
+    urls = []
+    for page in range(first, last + 1):
+        query["page"] = str(page)
+        urls.append(urlunsplit(parts._replace(query=urlencode(query))))
+    return urls
+
+
+def _page_items(data: Any) -> Optional[List[dict]]:
+    """Ítems de una página: la lista tal cual, un dict como único ítem, o None (cortar)."""
+    if isinstance(data, list):
+        return data
+    if isinstance(data, dict):
+        # Para endpoints que no devuelven listas (ej. /user, /search)
+        return [data]
+    return None
+
+
+# Repos por consulta GraphQL (aliases r0..rN en un mismo request)
+_GRAPHQL_BATCH = 50
+
+# Historial del día de un repo: solo los campos que usa CommitItem.
+# Se formatea por alias; owner/name van como literales escapados con JSON.
+_GRAPHQL_REPO_FRAGMENT = """
+  r{idx}: repository(owner: {owner}, name: {name}) {{
+    nameWithOwner
+    defaultBranchRef {{
+      target {{
+        ... on Commit {{
+          history(since: $since, until: $until, first: 100) {{
+            pageInfo {{ hasNextPage }}
+            nodes {{ oid url message author {{ email date user {{ login }} }} }}
+          }}
+        }}
+      }}
+    }}
+  }}"""
+
+# Cache de respuestas condicionales (ETag / Last-Modified) dentro de outdir
+_ETAG_CACHE_NAME = ".etag_cache.json"
+
+# Login resuelto desde /user, asociado a un hash del token (dentro de outdir)
+_AUTHOR_LOGIN_CACHE_NAME = ".author_login.json"
+
+# Reintentos ante errores transitorios del gateway de GitHub. Solo GET:
+# el rate limit (403) se maneja aparte en _paginate.
+_API_RETRY = Retry(
+    total=3,
+    backoff_factor=0.5,
+    status_forcelist=(502, 503, 504),
+    allowed_methods=frozenset(["GET"]),
+    raise_on_status=False, # Devolver la última respuesta; raise_for_status decide
+)
+
 
 @dataclass
 class CommitItem:
@@ -58,11 +157,20 @@ class GitHubDailyActivityScraper(BaseScraper):
         self.token = self.config.get("github.token")
         self.visibility = self.config.get("github.visibility", "all")
         self.per_page = self.config.get_int("github.per_page", 100)
+        # Repos consultados en paralelo (trabajo de red, el GIL no molesta)
+        self.workers = max(1, self.config.get_int("github.workers", 8))
+        # Usar la Search API (una búsqueda por identidad) en lugar de recorrer repos.
+        # Opt-in: el índice de búsqueda tarda en reflejar los pushes y no cubre
+        # forks, así que puede omitir commits del día.
+        self.use_search = self.config.get_bool("github.use_search", False)
+        # Al recorrer repos, pedir el historial por GraphQL en lotes (REST como fallback)
+        self.use_graphql = self.config.get_bool("github.use_graphql", True)
         
         # Configuración de Autor
         self.author_login = self.config.get("github.author_login", "").strip()
         emails_str = self.config.get("github.author_emails", "")
-        self.author_emails = set(email.strip() for email in emails_str.split(",") if email.strip())
+        # En minúsculas una sola vez: los filtros comparan contra esto directamente
+        self.author_emails = frozenset(email.strip().lower() for email in emails_str.split(",") if email.strip())
         
         if not self.token:
             raise ValueError("Falta GITHUB_TOKEN en la configuración")
@@ -72,26 +180,62 @@ class GitHubDailyActivityScraper(BaseScraper):
         self.tz = ZoneInfo(tz_name)
         
         # Configurar Sesión HTTP
-        self.session = requests.Session()
         self.session.headers.update({
             "Accept": "application/vnd.github+json",
             "X-GitHub-Api-Version": "2022-11-28",
             "User-Agent": "personal-sync/1.0",
             "Authorization": f"Bearer {self.token}",
         })
+        # Adapter propio para la API: pool dimensionado para los workers (cada
+        # uno con su prefetch de páginas) y reintentos en 5xx.
+        pool_size = max(32, self.workers * (1 + _PAGE_PREFETCH))
+        self.session.mount(_API_ROOT, HTTPAdapter(
+            pool_connections=pool_size, pool_maxsize=pool_size, max_retries=_API_RETRY,
+        ))
         
+        # Cache de requests condicionales: un 304 no consume cuota del rate limit.
+        # Se carga al primer uso; se comparte entre los hilos de fetch_data.
+        self._etag_lock = threading.Lock()
+        self._etag_cache: Optional[Dict[str, Dict[str, Any]]] = None
+        self._etag_used: set[str] = set()
+
         # Resolver Autor
         # Resuelve el login del autor usando el token si no se proveyó
         if not self.author_login:
             self.author_login = self._resolve_author_login()
 
     def _resolve_author_login(self) -> str:
-        """Resuelve el login del autor (username) usando el token de API."""
+        """
+        Resuelve el login del autor (username) usando el token de API.
+
+        El resultado se cachea en outdir junto a un hash del token: mientras
+        el token no cambie, no se vuelve a consultar /user.
+        """
+        cache_path = self.outdir / _AUTHOR_LOGIN_CACHE_NAME
+        token_key = hashlib.sha256(self.token.encode("utf-8")).hexdigest()[:16]
+        try:
+            with open(cache_path, "r", encoding="utf-8") as f:
+                cached = json.load(f)
+            if cached.get("token") == token_key and cached.get("login"):
+                self.logger.debug(f"'author_login' desde cache: {cached['login']}")
+                return cached["login"]
+        except (OSError, ValueError, AttributeError):
+            pass # Sin cache, corrupto o de otro formato: resolver por API
+
         self.logger.info("Resolviendo 'author_login' desde la API de GitHub (/user)...")
         response = self.session.get("https://api.github.com/user", timeout=self.timeout)
         response.raise_for_status()
         login = response.json().get("login")
         self.logger.info(f"'author_login' resuelto como: {login}")
+
+        if login:
+            tmp_path = cache_path.with_name(cache_path.name + ".tmp")
+            try:
+                with open(tmp_path, "w", encoding="utf-8") as f:
+                    json.dump({"token": token_key, "login": login}, f)
+                os.replace(tmp_path, cache_path)
+            except OSError as e:
+                self.logger.debug(f"No se pudo cachear 'author_login': {e}")
         return login
 
     def _today_window(self) -> tuple[str, str]:
@@ -111,50 +255,153 @@ class GitHubDailyActivityScraper(BaseScraper):
         
         return start_utc, end_utc
 
-    def _paginate(self, url: str, params: Optional[Dict[str, Any]] = None) -> Iterator[dict]:
+    def _etag_path(self) -> Path:
+        """Ruta del cache de ETags de este scraper."""
+        return self.outdir / _ETAG_CACHE_NAME
+
+    def _etag_lookup(self, key: str) -> Optional[Dict[str, Any]]:
+        """Devuelve la entrada cacheada para `key` (cargando el archivo la primera vez)."""
+        with self._etag_lock:
+            if self._etag_cache is None:
+                try:
+                    with open(self._etag_path(), "r", encoding="utf-8") as f:
+                        self._etag_cache = json.load(f)
+                except (OSError, ValueError):
+                    self._etag_cache = {} # Sin cache o cache corrupto
+            return self._etag_cache.get(key)
+
+    def _etag_store(self, key: str, entry: Dict[str, Any]) -> None:
+        """Registra (o confirma) la entrada de `key` como usada en esta corrida."""
+        with self._etag_lock:
+            if self._etag_cache is None:
+                self._etag_cache = {}
+            self._etag_cache[key] = entry
+            self._etag_used.add(key)
+
+    def _save_etag_cache(self) -> None:
+        """
+        Persiste solo las entradas usadas en esta corrida (las de ventanas
+        de días anteriores se descartan). Escritura atómica.
+        """
+        with self._etag_lock:
+            if not self._etag_used:
+                return
+            pruned = {k: v for k, v in (self._etag_cache or {}).items() if k in self._etag_used}
+        path = self._etag_path()
+        tmp_path = path.with_name(path.name + ".tmp")
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(pruned, f, ensure_ascii=False, separators=(",", ":"))
+            os.replace(tmp_path, path)
+        except OSError as e:
+            self.logger.warning(f"No se pudo guardar el cache de ETags: {e}")
+
+    def _get_page(self, url: str, params: Optional[Dict[str, Any]] = None) -> Tuple[Any, str]:
+        """
+        Pide una página de la API y devuelve (cuerpo JSON, header 'Link').
+
+        La página se pide de forma condicional (If-None-Match /
+        If-Modified-Since); ante un 304 se usan el cuerpo y el 'Link'
+        cacheados. Espera y reintenta una vez si se alcanza el rate limit.
+        """
+        key = f"{url}?{urlencode(params)}" if params else url
+        cached = self._etag_lookup(key)
+        headers: Dict[str, str] = {}
+        if cached:
+            if cached.get("etag"):
+                headers["If-None-Match"] = cached["etag"]
+            if cached.get("last_modified"):
+                headers["If-Modified-Since"] = cached["last_modified"]
+
+        response = self.session.get(url, params=params, headers=headers, timeout=self.timeout)
+        
+        # Manejar Rate Limiting
+        if response.status_code == 403 and "rate limit" in response.text.lower():
+            reset_time_unix = response.headers.get("X-RateLimit-Reset")
+            wait_seconds = 60
+            if reset_time_unix:
+                wait_seconds = max(5, int(reset_time_unix) - int(time.time()))
+            
+            self.logger.warning(f"Rate limit detectado. Esperando {wait_seconds}s...")
+            time.sleep(wait_seconds)
+            response = self.session.get(url, params=params, headers=headers, timeout=self.timeout) # Reintentar
+
+        if response.status_code == 304 and cached:
+            # Sin cambios: reutilizar la página cacheada
+            self._etag_store(key, cached)
+            return cached.get("body"), cached.get("link", "")
+
+        response.raise_for_status()
+        data = _loads(response.content)
+        link_header = response.headers.get("Link", "")
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        if etag or last_modified:
+            self._etag_store(key, {
+                "etag": etag, "last_modified": last_modified,
+                "link": link_header, "body": data,
+            })
+        return data, link_header
+
+    def _prefetch_pages(self, urls: List[str]) -> Iterator[dict]:
+        """
+        Pide `urls` en paralelo (hasta _PAGE_PREFETCH por delante del
+        consumidor) y entrega los ítems en orden de página. Si el consumidor
+        corta antes, las páginas aún no iniciadas se cancelan.
+        """
+        pending_urls = iter(urls)
+        with ThreadPoolExecutor(max_workers=min(_PAGE_PREFETCH, len(urls)), thread_name_prefix="github-page") as ex:
+            futures = deque(ex.submit(self._get_page, u) for u in islice(pending_urls, _PAGE_PREFETCH))
+            try:
+                while futures:
+                    data, _ = futures.popleft().result()
+                    next_page = next(pending_urls, None)
+                    if next_page:
+                        futures.append(ex.submit(self._get_page, next_page))
+                    items = _page_items(data)
+                    if items is None:
+                        return
+                    yield from items
+            finally:
+                for future in futures:
+                    future.cancel()
+
+    def _paginate(self, url: str, params: Optional[Dict[str, Any]] = None, prefetch: bool = True) -> Iterator[dict]:
         """
         Iterador genérico para manejar la paginación de la API de GitHub.
         
         Maneja automáticamente el seguimiento de 'Link' headers y la
-        espera por rate limiting.
-        """
-        while url:
-            response = self.session.get(url, params=params, timeout=self.timeout)
-            
-            # Manejar Rate Limiting
-            if response.status_code == 403 and "rate limit" in response.text.lower():
-                reset_time_unix = response.headers.get("X-RateLimit-Reset")
-                wait_seconds = 60
-                if reset_time_unix:
-                    wait_seconds = max(5, int(reset_time_unix) - int(time.time()))
-                
-                self.logger.warning(f"Rate limit detectado. Esperando {wait_seconds}s...")
-                time.sleep(wait_seconds)
-                response = self.session.get(url, params=params, timeout=self.timeout) # Reintentar
+        espera por rate limiting (ver _get_page). Si la primera página trae
+        rel="last" con número de página, el resto se pide en paralelo; si no,
+        se sigue la cadena rel="next" página por página.
 
-            response.raise_for_status()
-            data = response.json()
-            
-            if isinstance(data, list):
-                yield from data
-            elif isinstance(data, dict):
-                # Para endpoints que no devuelven listas (ej. /user)
-                yield data
-            else:
+        Args:
+            url: Endpoint inicial.
+            params: Query params (solo para la primera solicitud).
+            prefetch: Permitir pedir páginas en paralelo (no para la Search API,
+                con un rate limit propio mucho más bajo).
+        """
+        data, link_header = self._get_page(url, params)
+        while True:
+            items = _page_items(data)
+            if items is None:
                 # Si la respuesta no es ni lista ni dict, parar.
-                break
+                return
+            yield from items
                 
             # Siguiente Página
-            link_header = response.headers.get("Link", "")
-            next_url = None
-            for part in link_header.split(","):
-                if 'rel="next"' in part:
-                    next_url = part[part.find("<") + 1:part.find(">")]
-                    break
-            
-            # Si hay 'next_url', se usará en la próxima iteración.
+            links = {rel: link_url for link_url, rel in _LINK_RE.findall(link_header)}
+            next_url = links.get("next")
+            if not next_url:
+                return
+
+            page_urls = _page_range(next_url, links.get("last")) if prefetch else None
+            if page_urls:
+                yield from self._prefetch_pages(page_urls)
+                return
+
             # 'params' solo se usa en la primera solicitud.
-            url, params = next_url, None
+            data, link_header = self._get_page(next_url)
 
     def _iter_repos(self) -> Iterator[dict]:
         """Itera sobre todos los repositorios del usuario."""
@@ -168,71 +415,177 @@ class GitHubDailyActivityScraper(BaseScraper):
         self.logger.info("Iniciando paginación de /user/repos...")
         yield from self._paginate(url, params)
 
-    def _repo_commits_today(self, owner: str, repo: str, since_utc: str, until_utc: str) -> List[CommitItem]:
-        """Obtiene commits del día para un repositorio específico."""
+    @staticmethod
+    def _to_commit_item(repo_full_name: str, commit_data: dict) -> CommitItem:
+        """Convierte un commit de la API (REST o Search) en un CommitItem."""
+        commit_info = commit_data.get("commit") or {}
+        author_info = commit_info.get("author") or {}
+        return CommitItem(
+            repo=repo_full_name,
+            sha=commit_data.get("sha", ""),
+            html_url=commit_data.get("html_url", ""),
+            message=(commit_info.get("message") or "").split("\n")[0].strip(), # Tomar solo la primera línea
+            date=author_info.get("date", ""),
+            author_login=(commit_data.get("author") or {}).get("login"),
+            author_email=author_info.get("email"),
+        )
+
+    def _search_commits_today(self, since_utc: str, until_utc: str) -> List[CommitItem]:
+        """
+        Obtiene los commits del día de todas las cuentas con la Search API.
+
+        Hace una búsqueda paginada por identidad (login y cada email) en
+        lugar de recorrer cada repo, y deduplica por sha.
+
+        Raises:
+            HTTPError: Si la API rechaza la consulta (ej. 422).
+        """
+        # La búsqueda no acepta fracciones de segundo
+        window = f"{since_utc.split('.')[0].rstrip('Z')}Z..{until_utc.split('.')[0].rstrip('Z')}Z"
+        # committer-date: mismo criterio que since/until de /repos/{o}/{r}/commits
+        queries = [f"author:{self.author_login} committer-date:{window}"]
+        queries += [f"author-email:{email} committer-date:{window}" for email in sorted(self.author_emails)]
+
+        seen_shas = set()
+        commits: List[CommitItem] = []
+        for q in queries:
+            params = {"q": q, "per_page": self.per_page, "sort": "committer-date", "order": "asc"}
+            for page in self._paginate(f"{_API_ROOT}search/commits", params=params, prefetch=False):
+                for item in page.get("items") or ():
+                    sha = item.get("sha")
+                    if not sha or sha in seen_shas:
+                        continue
+                    seen_shas.add(sha)
+                    repo_full_name = (item.get("repository") or {}).get("full_name", "")
+                    commits.append(self._to_commit_item(repo_full_name, item))
+
+        # Agrupar por repo, como en el recorrido por repos
+        commits.sort(key=lambda c: c.repo)
+        return commits
+
+    def _graphql(self, query: str, variables: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Ejecuta una consulta contra la API GraphQL v4.
+
+        Returns:
+            El objeto 'data' de la respuesta (puede ser parcial si hubo 'errors').
+        """
+        response = self.session.post(
+            f"{_API_ROOT}graphql",
+            json={"query": query, "variables": variables},
+            timeout=self.timeout,
+        )
+        response.raise_for_status()
+        payload = _loads(response.content)
+        if payload.get("errors"):
+            self.logger.debug(f"GraphQL devolvió errores: {payload['errors']}")
+        return payload.get("data") or {}
+
+    def _graphql_commits(
+        self, repos: List[Tuple[str, str]], since_utc: str, until_utc: str
+    ) -> Tuple[Dict[Tuple[str, str], List[CommitItem]], List[Tuple[str, str]]]:
+        """
+        Obtiene el historial del día de varios repos por GraphQL, en lotes de
+        hasta _GRAPHQL_BATCH repos por request y solo con los campos necesarios.
+
+        Returns:
+            (commits por repo, repos pendientes). Quedan pendientes los repos
+            de un lote fallido, los que GraphQL no devolvió y los que tienen
+            más de 100 commits en el día; esos se consultan por REST.
+        """
+        found: Dict[Tuple[str, str], List[CommitItem]] = {}
+        pending: List[Tuple[str, str]] = []
+        variables = {"since": since_utc, "until": until_utc}
+        own_login = (self.author_login or "").lower()
+
+        for start in range(0, len(repos), _GRAPHQL_BATCH):
+            batch = repos[start:start + _GRAPHQL_BATCH]
+            fragments = "".join(
+                _GRAPHQL_REPO_FRAGMENT.format(idx=i, owner=json.dumps(owner), name=json.dumps(name))
+                for i, (owner, name) in enumerate(batch)
+            )
+            query = f"query($since: GitTimestamp!, $until: GitTimestamp!) {{{fragments}\n}}"
+            try:
+                data = self._graphql(query, variables)
+            except Exception as e:
+                self.logger.warning(f"Lote GraphQL falló ({len(batch)} repos), se usa REST: {e}")
+                pending.extend(batch)
+                continue
+
+            for i, key in enumerate(batch):
+                node = data.get(f"r{i}")
+                if node is None:
+                    pending.append(key) # Sin acceso o error puntual
+                    continue
+                target = (node.get("defaultBranchRef") or {}).get("target") or {}
+                history = target.get("history")
+                if history is None:
+                    found[key] = [] # Repo vacío
+                    continue
+                if (history.get("pageInfo") or {}).get("hasNextPage"):
+                    pending.append(key) # Día muy activo: REST pagina completo
+                    continue
+
+                repo_full_name = node.get("nameWithOwner") or f"{key[0]}/{key[1]}"
+                commits = []
+                for c in history.get("nodes") or ():
+                    author = c.get("author") or {}
+                    login = (author.get("user") or {}).get("login")
+                    # Mismo filtro que _repo_commits_today: login o email configurado
+                    if not ((own_login and (login or "").lower() == own_login)
+                            or (author.get("email") or "").lower() in self.author_emails):
+                        continue
+                    commits.append(CommitItem(
+                        repo=repo_full_name,
+                        sha=c.get("oid", ""),
+                        html_url=c.get("url", ""),
+                        message=(c.get("message") or "").split("\n")[0].strip(),
+                        date=author.get("date", ""),
+                        author_login=login,
+                        author_email=author.get("email"),
+                    ))
+                found[key] = commits
+
+        return found, pending
+
+    def _repo_commits_today(
+        self, owner: str, repo: str, since_utc: str, until_utc: str, pushed_at: Optional[str] = None
+    ) -> List[CommitItem]:
+        """
+        Obtiene commits del día para un repositorio específico.
+
+        Una sola pasada paginada sin filtro de autor: el filtro por login y
+        por emails se aplica en memoria (antes eran dos recorridos). Si el
+        último push del repo es anterior a la ventana, no hace ningún request.
+        """
+        # Ambos en ISO 8601 Zulu sin fracción: la comparación de strings sirve
+        if pushed_at and pushed_at < since_utc:
+            return []
+
         base_url = f"https://api.github.com/repos/{owner}/{repo}/commits"
+        login = (self.author_login or "").lower()
         seen_shas = set()
         commits = []
 
-        # Estrategia 1: Buscar por 'author' (login)
-        params_author = {
+        params = {
             "since": since_utc,
             "until": until_utc,
-            "author": self.author_login,
             "per_page": self.per_page
         }
         
-        for commit_data in self._paginate(base_url, params=params_author):
+        for commit_data in self._paginate(base_url, params=params):
             sha = commit_data.get("sha")
             if not sha or sha in seen_shas:
                 continue
-                
-            seen_shas.add(sha)
-            commit_info = commit_data.get("commit", {})
-            author_info = commit_info.get("author", {})
-            
-            commits.append(CommitItem(
-                repo=f"{owner}/{repo}",
-                sha=sha,
-                html_url=commit_data.get("html_url", ""),
-                message=(commit_info.get("message") or "").split("\n")[0].strip(), # Tomar solo la primera línea
-                date=author_info.get("date", ""),
-                author_login=(commit_data.get("author") or {}).get("login"),
-                author_email=author_info.get("email")
-            ))
-
-        # Estrategia 2: Buscar por emails adicionales
-        if self.author_emails:
-            lower_emails = {email.lower() for email in self.author_emails}
-            
-            params_all = {
-                "since": since_utc,
-                "until": until_utc,
-                "per_page": self.per_page
-            }
-            
-            for commit_data in self._paginate(base_url, params=params_all):
-                sha = commit_data.get("sha") or ""
-                if sha in seen_shas:
-                    # Ya lo encontramos en la Estrategia 1
-                    continue
-                    
-                commit_info = commit_data.get("commit", {})
-                author_info = commit_info.get("author", {})
-                author_email = (author_info.get("email") or "").lower()
-                
-                # Verificar si el email del commit coincide con nuestra lista
-                if author_email in lower_emails:
-                    seen_shas.add(sha)
-                    commits.append(CommitItem(
-                        repo=f"{owner}/{repo}",
-                        sha=sha,
-                        html_url=commit_data.get("html_url", ""),
-                        message=(commit_info.get("message") or "").split("\n")[0].strip(),
-                        date=author_info.get("date", ""),
-                        author_login=(commit_data.get("author") or {}).get("login"),
-                        author_email=author_info.get("email")
-                    ))
+
+            commit_login = ((commit_data.get("author") or {}).get("login") or "").lower()
+            author_info = (commit_data.get("commit") or {}).get("author") or {}
+            author_email = (author_info.get("email") or "").lower()
+
+            # Aceptar si coincide el login o alguno de los emails configurados
+            if (login and commit_login == login) or author_email in self.author_emails:
+                seen_shas.add(sha)
+                commits.append(self._to_commit_item(f"{owner}/{repo}", commit_data))
 
         return commits
 
@@ -240,7 +593,9 @@ class GitHubDailyActivityScraper(BaseScraper):
         """
         Método principal para ejecutar el scraper.
         
-        Obtiene todos los commits del día para todos los repos del usuario.
+        Obtiene todos los commits del día para todos los repos del usuario:
+        vía Search API si está habilitada (y hay login), o recorriendo los
+        repos uno por uno si no (o si la búsqueda devuelve 422).
         
         Returns:
             Una lista de objetos CommitItem.
@@ -249,24 +604,74 @@ class GitHubDailyActivityScraper(BaseScraper):
         self.logger.info(f"Buscando commits entre {since_utc} y {until_utc}")
         self.logger.info(f"Filtrando por login: '{self.author_login}' y emails: {self.author_emails}")
         
-        all_commits = []
-        
+        all_commits: Optional[List[CommitItem]] = None
+        if self.use_search and self.author_login:
+            try:
+                all_commits = self._search_commits_today(since_utc, until_utc)
+            except HTTPError as e:
+                if e.response is None or e.response.status_code != 422:
+                    raise
+                self.logger.warning("La Search API rechazó la consulta (422); se recorren los repos.")
+
+        if all_commits is None:
+            all_commits = self._commits_by_repo(since_utc, until_utc)
+
+        self._save_etag_cache()
+
+        self.logger.info(f"Scraping finalizado. Total de commits del día: {len(all_commits)}")
+        return all_commits
+
+    def _commits_by_repo(self, since_utc: str, until_utc: str) -> List[CommitItem]:
+        """Recorre /user/repos y consulta los commits del día de cada repo."""
+        # 1. Listar repos primero (paginado, secuencial). /user/repos viene
+        # ordenado por 'pushed' desc: al primer repo sin push desde 'since',
+        # todos los siguientes tampoco tienen actividad y se corta (sin pedir
+        # más páginas).
+        since_dt = datetime.fromisoformat(since_utc.replace("Z", "+00:00"))
+        repos: List[Tuple[str, str]] = []
+        pushed: Dict[Tuple[str, str], Optional[str]] = {}
         for repo in self._iter_repos():
+            pushed_at = repo.get("pushed_at")
+            if pushed_at and datetime.fromisoformat(pushed_at.replace("Z", "+00:00")) < since_dt:
+                break
             owner = (repo.get("owner") or {}).get("login")
             repo_name = repo.get("name")
-            
-            if not owner or not repo_name:
-                continue
-                
-            try:
-                commits = self._repo_commits_today(owner, repo_name, since_utc, until_utc)
+            if owner and repo_name:
+                repos.append((owner, repo_name))
+                pushed[(owner, repo_name)] = pushed_at
+
+        # 2. GraphQL en lotes (si está habilitado); lo que no resuelva va por REST
+        by_repo: Dict[Tuple[str, str], List[CommitItem]] = {}
+        pending = repos
+        if self.use_graphql and repos:
+            found, pending = self._graphql_commits(repos, since_utc, until_utc)
+            for (owner, repo_name), commits in found.items():
                 if commits:
-                    all_commits.extend(commits)
+                    by_repo[(owner, repo_name)] = commits
                     self.logger.info(f"Encontrados {len(commits)} commits en {owner}/{repo_name}")
-            except Exception as e:
-                # No detener el scraper si falla un solo repositorio
-                self.logger.warning(f"Error obteniendo commits de {owner}/{repo_name}: {e}")
-                continue
 
-        self.logger.info(f"Scraping finalizado. Total de commits del día: {len(all_commits)}")
-        return all_commits
\ No newline at end of file
+        # 3. Consultar por REST los repos pendientes, en paralelo. Las
+        # conexiones salen del pool del adapter de la API (ver __init__).
+        workers = min(self.workers, len(pending)) or 1
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="github") as ex:
+            futures = {
+                ex.submit(
+                    self._repo_commits_today, owner, repo_name, since_utc, until_utc, pushed.get((owner, repo_name))
+                ): (owner, repo_name)
+                for owner, repo_name in pending
+            }
+            for future in as_completed(futures):
+                owner, repo_name = futures[future]
+                try:
+                    commits = future.result()
+                except Exception as e:
+                    # No detener el scraper si falla un solo repositorio
+                    self.logger.warning(f"Error obteniendo commits de {owner}/{repo_name}: {e}")
+                    continue
+                if commits:
+                    by_repo[(owner, repo_name)] = commits
+                    self.logger.info(f"Encontrados {len(commits)} commits en {owner}/{repo_name}")
+
+        # 4. Unir en el orden de /user/repos (salida estable entre corridas)
+        all_commits = [c for key in repos for c in by_repo.get(key, ())]
+        return all_commits
@@ -13,18 +13,130 @@ lectura.
 from __future__ import annotations
 
 # Importaciones de la Biblioteca Estándar
+import json
+import os
 import re
 from dataclasses import dataclass
+from functools import lru_cache
+from html import unescape
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 
 # Importaciones de Terceros
-import requests
-from bs4 import BeautifulSoup, Tag
+from bs4 import BeautifulSoup, SoupStrainer, Tag
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# Parser en C (lxml) si está disponible; si no, el html.parser en Python puro.
+try:
+    import lxml  # noqa: F401
+    _HTML_PARSER = "lxml"
+except ImportError:  # Dependencia opcional
+    _HTML_PARSER = "html.parser"
 
 # Importaciones Locales
 from src.base_scraper import BaseScraper
 
+# Patrones precompilados (se usan por fila/tarjeta en los bucles de parseo)
+_RE_PERCENT = re.compile(r'(\d{1,3})\s?%')
+# "X of Y pages" / "X de Y páginas" en una sola pasada
+_RE_PAGES_OF = re.compile(r'(\d{1,5})\s+(?:of|de)\s+(\d{1,5})\s+(?:pages|p(?:á|a)ginas)', re.I)
+_RE_PAGES_SLASH = re.compile(r'(?:\bp\.?\s*)?(\d{1,5})\s*/\s*(\d{1,5})\b', re.I)
+_RE_QFRAG = re.compile(r'[?#]')
+_RE_STYLE_WIDTH = re.compile(r'width\s*:\s*(\d{1,3})\s*%', re.I)
+_RE_WS = re.compile(r'\s+')
+_RE_USER_SHOW = re.compile(r'/user/show/(\d+)')
+_RE_PAREN_PCT = re.compile(r'\((\d{1,3})%\)')
+_RE_BY = re.compile(r'\bby\s+(.+)$', re.I)
+_RE_AUTHOR_SPLIT = re.compile(r'\s{2,}|\s\(|\s-\s')
+_RE_BOOK_ID = re.compile(r'/(book/show|work)/(\d+)')
+# Link de libro seguido (a lo sumo 6 tags después, sin cruzar otro <a>)
+# por un "(42%)". Grupos: href, texto del link, porcentaje. Se aplica sobre
+# HTML serializado por BeautifulSoup (atributos siempre entre comillas dobles).
+_RE_LINK_PAREN_PCT = re.compile(
+    r'<a\b[^>]*?\bhref="((?:https?://[^/"]+)?/(?:book|work)/[^"]+)"[^>]*>([^<]*)'
+    r'(?:(?!<a\b)<[^>]+>[^<]*?){0,6}?\((\d{1,3})%\)'
+)
+
+# Matchers de clase CSS para el layout de tabla (se aplican sobre el
+# atributo class completo, ver _row_cells)
+_RE_CLS_TABLELIST = re.compile(r'\btableList\b')
+_RE_CLS_FIELD_TITLE = re.compile(r'\bfield\s*title\b')
+_RE_CLS_TITLE = re.compile(r'\btitle\b')
+_RE_CLS_FIELD_AUTHOR = re.compile(r'\bfield\s*author\b')
+_RE_CLS_AUTHOR = re.compile(r'\bauthor\b')
+_RE_CLS_PROGRESS = re.compile(r'\bprogress\b')
+_RE_CLS_AUTHOR_ANY = re.compile('author', re.I)
+# Clases de barra de progreso (equivale a [class*="graph"], [class*="progress"], [class*="meter"])
+_RE_CLS_BAR = re.compile(r'graph|progress|meter')
+
+_BASE_URL = "https://www.goodreads.com"
+
+# Cache de user_id por URL de perfil (dentro de outdir). El ID numérico de
+# un perfil no cambia, así que no hace falta resolverlo en cada ejecución.
+_UID_CACHE_NAME = ".goodreads_uid.json"
+
+# Marcadores (en bytes) de los layouts de estantería conocidos. Si el HTML
+# crudo no contiene ninguno, se omite el parseo con BeautifulSoup.
+_TABLE_MARKERS = (b'id="books"', b"id='books'", b"tableList")
+_CARD_MARKERS = (b"bookalike", b"elementList", b"bookListItem", b"listWithDividers__item")
+
+# Strainers: BeautifulSoup solo construye los subárboles que cada parser usa
+# (el resto de la página, nav/scripts/footer, ni se materializa).
+_TABLE_STRAINER = SoupStrainer("table")
+_CARDS_STRAINER = SoupStrainer(class_=re.compile(r'\b(?:bookalike|elementList|bookListItem|listWithDividers__item)\b'))
+_PRINT_STRAINER = SoupStrainer("tr")
+_USER_LINKS_STRAINER = SoupStrainer(["a", "meta"])
+_WIDGET_STRAINER = SoupStrainer(id="currentlyReadingReviews")
+
+# Reintentos ante rate limit (429) y errores transitorios de Goodreads.
+# Retry-After se respeta por defecto.
+_HTTP_RETRY = Retry(
+    total=3,
+    backoff_factor=0.3,
+    status_forcelist=(429, 500, 502, 503, 504),
+    allowed_methods=frozenset(["GET", "HEAD"]),
+    raise_on_status=False, # Devolver la última respuesta; el caller revisa status_code
+)
+
+
+def _pct(digits: str) -> int:
+    """
+    Convierte los dígitos capturados (\\d{1,3}) a porcentaje.
+    Nunca son negativos, así que solo hace falta acotar por arriba.
+    """
+    v = int(digits)
+    return 100 if v > 100 else v
+
+
+@lru_cache(maxsize=2048)
+def _canonical_url(url: str, base_url: str) -> str:
+    """Versión cacheada de GoodreadsReadingScraper._canonical_book_url."""
+    if url.startswith("/"):
+        url = f"{base_url}{url}"
+    return _RE_QFRAG.split(url, 1)[0] # Quitar parámetros
+
+
+@lru_cache(maxsize=2048)
+def _norm_title(t: Optional[str]) -> Optional[str]:
+    """Normaliza un título de libro (lowercase, strip, espacios)."""
+    if not t:
+        return None
+    return _RE_WS.sub(' ', t).strip().lower()
+
+
+@lru_cache(maxsize=2048)
+def _match_key(url: str) -> str:
+    """
+    Clave para cruzar libros de la estantería con el widget del perfil.
+
+    Usa el ID numérico ('book/show/123'), así el slug del título no
+    importa ('/book/show/123.Dune' == '/book/show/123-dune'). Si la URL no
+    trae ID, se usa la URL en minúsculas.
+    """
+    m = _RE_BOOK_ID.search(url)
+    return f"{m.group(1)}/{m.group(2)}" if m else url.lower()
+
 
 @dataclass
 class BookProgress:
@@ -70,13 +182,18 @@ class GoodreadsReadingScraper(BaseScraper):
             
         # Resolver URL de perfil si solo se dio el username
         if not self.profile_url and self.username:
-            self.profile_url = f"https://www.goodreads.com/{self.username}"
+            self.profile_url = f"{_BASE_URL}/{self.username}"
 
         # Configuración de requests
-        self.base_url = "https://www.goodreads.com"
+        self.base_url = _BASE_URL
         self.timeout = self.config.get_int("goodreads.timeout", 25)
+
+        # Plantillas de URL de la estantería (solo falta el user_id)
+        self._shelf_url_tmpl = f"{self.base_url}/review/list/{{uid}}?shelf=currently-reading&per_page={self.per_page}"
+        self._shelf_print_tmpl = self._shelf_url_tmpl + "&print=true"
         
-        self.session = requests.Session()
+        # Sesión HTTP (requests mantiene las conexiones keep-alive por defecto).
+        # Accept-Encoding lo arma requests (gzip/deflate, y br si hay brotli).
         self.session.headers.update({
             "User-Agent": (
                 "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 "
@@ -84,22 +201,26 @@ class GoodreadsReadingScraper(BaseScraper):
             ),
             "Accept-Language": "es-ES,es;q=0.9,en-US;q=0.8,en;q=0.7",
         })
+        # Adapter propio para Goodreads: pocas conexiones (los requests son
+        # secuenciales) pero con reintentos en 429/5xx.
+        self.session.mount(self.base_url, HTTPAdapter(
+            pool_connections=4, pool_maxsize=8, max_retries=_HTTP_RETRY,
+        ))
 
-    def _extract_int(self, s: str) -> Optional[int]:
-        """Extrae un entero de una cadena, manejando fallos."""
-        try:
-            return int(s)
-        except (ValueError, TypeError):
-            return None
+        # user_id ya resueltos en ejecuciones anteriores (profile_url -> user_id)
+        self._uid_cache: Dict[str, str] = self._load_uid_cache()
+
+        # HTML del perfil descargado al resolver el user_id; el widget de
+        # 'currently reading' lo reutiliza en vez de pedirlo de nuevo.
+        self._profile_html: Optional[str] = None
 
     def _extract_percent_any(self, text: str) -> Optional[int]:
         """Captura '10%', '10 %', '35% done', etc. de una cadena."""
-        if not text:
+        if not text or "%" not in text: # Prefiltro literal, más barato que la regex
             return None
-        m = re.search(r'(\d{1,3})\s?%', text)
+        m = _RE_PERCENT.search(text)
         if m:
-            v = int(m.group(1))
-            return max(0, min(100, v)) # Clamp between 0 and 100
+            return _pct(m.group(1))
         return None
 
     def _extract_pages_progress(self, text: str) -> Tuple[Optional[int], Optional[int]]:
@@ -110,60 +231,89 @@ class GoodreadsReadingScraper(BaseScraper):
         if not text:
             return None, None
 
-        # "X of Y pages"
-        m = re.search(r'(\d{1,5})\s+of\s+(\d{1,5})\s+pages', text, re.I)
+        # "X of Y pages" / "X de Y páginas"; "p. X / Y" solo como último recurso
+        # (y solo si hay una '/' en el texto)
+        m = _RE_PAGES_OF.search(text) or ("/" in text and _RE_PAGES_SLASH.search(text))
         if m:
-            return self._extract_int(m.group(1)), self._extract_int(m.group(2))
+            return int(m.group(1)), int(m.group(2))
 
-        # "X de Y páginas"
-        m = re.search(r'(\d{1,5})\s+de\s+(\d{1,5})\s+p(?:á|a)ginas', text, re.I)
-        if m:
-            return self._extract_int(m.group(1)), self._extract_int(m.group(2))
+        return None, None
 
-        # "p. X / Y"
-        m = re.search(r'(?:\bp\.?\s*)?(\d{1,5})\s*/\s*(\d{1,5})\b', text, re.I)
-        if m:
-            return self._extract_int(m.group(1)), self._extract_int(m.group(2))
+    def _progress_from_text(self, text: str, percent: Optional[int]) -> Tuple[Optional[int], Optional[int], Optional[int]]:
+        """
+        Extrae (porcentaje, páginas leídas, páginas totales) del texto de una fila.
 
-        return None, None
+        Args:
+            text: Texto de la fila/tarjeta, obtenido una sola vez con get_text.
+            percent: Porcentaje ya encontrado (ej. en la barra de progreso), o None.
+
+        Returns:
+            Tupla (percent, pages_read, pages_total). Si no hay porcentaje
+            explícito, se calcula a partir de las páginas.
+        """
+        percent = percent or self._extract_percent_any(text)
+        rpages, tpages = self._extract_pages_progress(text)
+        if percent is None and rpages is not None and tpages and tpages > 0:
+            percent = (rpages * 100 + (tpages >> 1)) // tpages # Redondeo entero
+        return percent, rpages, tpages
 
     def _canonical_book_url(self, url: Optional[str]) -> Optional[str]:
         """Normaliza URLs de libros (quita query params/fragments, añade base_url)."""
         if not url:
             return url
-        if url.startswith("/"):
-            url = f"{self.base_url}{url}"
-        url = re.split(r"[?#]", url)[0] # Quitar parámetros
-        return url
+        return _canonical_url(url, self.base_url)
 
     def _extract_style_percent(self, node: Tag) -> Optional[int]:
         """
         Busca un porcentaje en estilos inline (ej. style="width: 42%").
         Usado para las barras de progreso.
+
+        Recorre el subárbol una sola vez:
+        1) Si hay elementos con clase de progreso (graph/progress/meter),
+           solo se consideran esos.
+        2) Si no hay ninguno, se usa cualquier elemento con "width" en el style.
+        En ambos casos se prefiere el valor más alto (suele ser la barra "llena").
         """
-        # 1) Buscar elementos específicos de progreso
-        elems = node.select('.graphBar, .progressGraph, .progress, .meter, [class*="graph"], [class*="progress"], [class*="meter"]')
-        
-        # 2) Búsqueda más amplia si la anterior no devolvió nada
-        if not elems:
-            elems = node.select('[style*="width"]')
-
-        best: Optional[int] = None
-        for el in elems:
-            style = (el.get("style") or "")
-            m = re.search(r'width\s*:\s*(\d{1,3})\s*%', style, re.I)
-            if m:
-                v = max(0, min(100, int(m.group(1))))
-                # Preferimos el valor más alto (suele ser la barra "llena")
-                if best is None or v > best:
-                    best = v
-        return best
-
-    def _norm_title(self, t: Optional[str]) -> Optional[str]:
-        """Normaliza un título de libro (lowercase, strip, espacios)."""
-        if not t:
-            return None
-        return re.sub(r'\s+', ' ', t).strip().lower()
+        has_bars = False
+        best_bar: Optional[int] = None
+        best_any: Optional[int] = None
+        for el in node.find_all(True):
+            cls = el.get("class")
+            is_bar = bool(cls) and _RE_CLS_BAR.search(" ".join(cls)) is not None
+            has_bars = has_bars or is_bar
+            style = el.get("style")
+            if not style:
+                continue
+            m = _RE_STYLE_WIDTH.search(style)
+            if not m:
+                continue
+            v = _pct(m.group(1))
+            if is_bar:
+                if best_bar is None or v > best_bar:
+                    best_bar = v
+            elif "width" in style and (best_any is None or v > best_any):
+                best_any = v
+        return best_bar if has_bars else best_any
+
+    def _load_uid_cache(self) -> Dict[str, str]:
+        """Lee el cache de user_id desde outdir; si falta o está corrupto, devuelve {}."""
+        try:
+            with open(self.outdir / _UID_CACHE_NAME, "r", encoding="utf-8") as f:
+                cached = json.load(f)
+            return {str(k): str(v) for k, v in cached.items()}
+        except (OSError, ValueError, AttributeError):
+            return {}
+
+    def _save_uid_cache(self) -> None:
+        """Persiste el cache de user_id de forma atómica (tmp + os.replace)."""
+        cache_path = self.outdir / _UID_CACHE_NAME
+        tmp_path = cache_path.with_name(cache_path.name + ".tmp")
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(self._uid_cache, f)
+            os.replace(tmp_path, cache_path)
+        except OSError as e:
+            self.logger.debug(f"No se pudo cachear el user_id: {e}")
 
     def _resolve_user_id(self) -> str:
         """
@@ -171,6 +321,10 @@ class GoodreadsReadingScraper(BaseScraper):
         
         Goodreads usa un ID numérico para las estanterías (ej. /review/list/USER_ID)
         que es diferente del username (ej. /mi_usuario).
+
+        Casi siempre el perfil redirige a /user/show/USER_ID, así que primero
+        se sigue la redirección con un HEAD (sin descargar el HTML). Solo si
+        eso no alcanza se hace el GET y se busca el ID en la página.
         
         Returns:
             El ID numérico del usuario.
@@ -179,45 +333,87 @@ class GoodreadsReadingScraper(BaseScraper):
             RuntimeError: Si no se puede encontrar el ID en la página de perfil.
         """
         self.logger.info(f"Resolviendo User ID desde {self.profile_url}")
+
+        # 0. La URL configurada ya puede traer el ID
+        m = _RE_USER_SHOW.search(self.profile_url)
+        if m:
+            return m.group(1)
+
+        # 1. Buscar en la URL final tras las redirecciones (HEAD)
+        try:
+            head = self.session.head(self.profile_url, timeout=self.timeout, allow_redirects=True)
+            m = _RE_USER_SHOW.search(head.url)
+            if m:
+                return m.group(1)
+        except Exception as e:
+            self.logger.debug(f"HEAD al perfil falló, se usa GET: {e}")
+
         resp = self.session.get(self.profile_url, timeout=self.timeout, allow_redirects=True)
-        final_url = resp.url
+        if resp.status_code == 200:
+            self._profile_html = resp.text
 
-        # 1. Buscar en la URL final
-        m = re.search(r'/user/show/(\d+)', final_url)
+        m = _RE_USER_SHOW.search(resp.url)
         if m:
             return m.group(1)
 
-        soup = BeautifulSoup(resp.text, "html.parser")
+        soup = BeautifulSoup(resp.text, _HTML_PARSER, parse_only=_USER_LINKS_STRAINER)
         
         # 2. Buscar en todos los enlaces de la página
         for a in soup.find_all("a", href=True):
-            hm = re.search(r'/user/show/(\d+)', a["href"])
+            hm = _RE_USER_SHOW.search(a["href"])
             if hm:
                 return hm.group(1)
 
         # 3. Buscar en metadatos OpenGraph
         og = soup.find("meta", property="og:url")
         if og and og.get("content"):
-            hm = re.search(r'/user/show/(\d+)', og["content"])
+            hm = _RE_USER_SHOW.search(og["content"])
             if hm:
                 return hm.group(1)
 
         raise RuntimeError("No se pudo resolver el user_id de Goodreads a partir del perfil.")
 
-    def _parse_table_layout(self, soup: BeautifulSoup) -> List[BookProgress]:
+    @staticmethod
+    def _row_cells(tr: Tag) -> Tuple[Optional[Tag], Optional[Tag], Optional[Tag]]:
+        """
+        Clasifica las celdas de una fila en (título, autor, progreso).
+
+        Equivale a un tr.find("td", class_=...) por campo ('field X' tiene
+        prioridad sobre 'X'), pero recorre las celdas una sola vez.
+        """
+        field_title = title = field_author = author = progress = None
+        for td in tr.find_all("td"):
+            cls = " ".join(td.get("class") or ())
+            if not cls:
+                continue
+            if field_title is None and _RE_CLS_FIELD_TITLE.search(cls):
+                field_title = td
+            if title is None and _RE_CLS_TITLE.search(cls):
+                title = td
+            if field_author is None and _RE_CLS_FIELD_AUTHOR.search(cls):
+                field_author = td
+            if author is None and _RE_CLS_AUTHOR.search(cls):
+                author = td
+            if progress is None and _RE_CLS_PROGRESS.search(cls):
+                progress = td
+        return field_title or title, field_author or author, progress
+
+    def _parse_table_layout(self, soup: BeautifulSoup) -> Tuple[List[BookProgress], int]:
         """Parsea el layout de estantería clásico (formato <table>)."""
         results: List[BookProgress] = []
-        table = soup.find("table", id="books") or soup.find("table", class_=re.compile(r"\btableList\b"))
+        missing = 0 # Libros sin porcentaje
+        table = soup.find("table", id="books") or soup.find("table", class_=_RE_CLS_TABLELIST)
         if not table:
-            return results
+            return results, missing
 
         rows = table.find_all("tr")
         for tr in rows:
             try:
+                tcell, acell, pc_cell = self._row_cells(tr)
+
                 # Título y URL
                 title = None
                 book_url = None
-                tcell = tr.find("td", class_=re.compile(r"\bfield\s*title\b")) or tr.find("td", class_=re.compile(r"\btitle\b"))
                 if tcell:
                     a = tcell.find("a", href=True)
                     if a:
@@ -226,34 +422,18 @@ class GoodreadsReadingScraper(BaseScraper):
 
                 # Autor
                 author = None
-                acell = tr.find("td", class_=re.compile(r"\bfield\s*author\b")) or tr.find("td", class_=re.compile(r"\bauthor\b"))
                 if acell:
                     a = acell.find("a")
                     author = (a.get_text(strip=True) if a else acell.get_text(strip=True)) or None
 
                 # Progreso
-                percent = None
-                pages_read = None
-                pages_total = None
-
-                pc_cell = tr.find("td", class_=re.compile(r"\bprogress\b"))
-                
                 # 1) Estilo width: XX% (barra de progreso)
-                percent = self._extract_style_percent(pc_cell or tr) or percent
-
-                # 2) Texto de la fila
-                row_full = tr.get_text(" ", strip=True)
-                percent = percent or self._extract_percent_any(row_full)
-                rpages, tpages = self._extract_pages_progress(row_full)
-                
-                if rpages is not None or tpages is not None:
-                    pages_read, pages_total = rpages, tpages
-                    # Calcular % si no existe y tenemos páginas
-                    if percent is None and rpages is not None and tpages and tpages > 0:
-                        try:
-                            percent = int(round((rpages / tpages) * 100))
-                        except Exception:
-                            pass # Evitar división por cero si tpages es 0
+                percent = self._extract_style_percent(pc_cell or tr)
+
+                # 2) Texto de la fila (un solo get_text por fila)
+                percent, pages_read, pages_total = self._progress_from_text(
+                    tr.get_text(" ", strip=True), percent
+                )
 
                 if not title and not book_url:
                     continue # Fila inútil 
@@ -267,14 +447,16 @@ class GoodreadsReadingScraper(BaseScraper):
                     book_url=book_url,
                     shelf="currently-reading",
                 ))
+                missing += percent is None
             except Exception:
                 continue # Ignorar fila rota
 
-        return results
+        return results, missing
 
-    def _parse_cards_layout(self, soup: BeautifulSoup) -> List[BookProgress]:
+    def _parse_cards_layout(self, soup: BeautifulSoup) -> Tuple[List[BookProgress], int]:
         """Parsea el layout de estantería moderno (formato de tarjetas/divs)."""
         results: List[BookProgress] = []
+        missing = 0 # Libros sin porcentaje
         # Selectores genéricos para varios layouts de "tarjetas"
         cards = soup.select('div.bookalike.review, div.elementList, li.bookListItem, div.listWithDividers__item')
         
@@ -285,7 +467,7 @@ class GoodreadsReadingScraper(BaseScraper):
                 book_url = self._canonical_book_url(a["href"]) if a else None
 
                 author = None
-                auth = card.find("a", class_=re.compile("author", re.I)) or card.find("span", class_=re.compile("author", re.I))
+                auth = card.find("a", class_=_RE_CLS_AUTHOR_ANY) or card.find("span", class_=_RE_CLS_AUTHOR_ANY)
                 if auth:
                     author = auth.get_text(strip=True)
 
@@ -293,17 +475,9 @@ class GoodreadsReadingScraper(BaseScraper):
                 percent = self._extract_style_percent(card)
 
                 # 2) Texto libre
-                txt = card.get_text(" ", strip=True)
-                percent = percent or self._extract_percent_any(txt)
-                rpages, tpages = self._extract_pages_progress(txt)
-                pages_read = rpages
-                pages_total = tpages
-                
-                if percent is None and rpages is not None and tpages and tpages > 0:
-                    try:
-                        percent = int(round((rpages / tpages) * 100))
-                    except Exception:
-                        pass
+                percent, pages_read, pages_total = self._progress_from_text(
+                    card.get_text(" ", strip=True), percent
+                )
 
                 if not (title or book_url):
                     continue
@@ -317,15 +491,17 @@ class GoodreadsReadingScraper(BaseScraper):
                     book_url=book_url,
                     shelf="currently-reading",
                 ))
+                missing += percent is None
             except Exception:
                 continue
 
-        return results
+        return results, missing
 
-    def _parse_print_layout(self, html_text: str) -> List[BookProgress]:
+    def _parse_print_layout(self, html_text: str) -> Tuple[List[BookProgress], int]:
         """Fallback: Parsea la vista de impresión (print=true)."""
         results: List[BookProgress] = []
-        sp = BeautifulSoup(html_text, "html.parser")
+        missing = 0 # Libros sin porcentaje
+        sp = BeautifulSoup(html_text, _HTML_PARSER, parse_only=_PRINT_STRAINER)
         
         for tr in sp.select("tr"):
             try:
@@ -336,20 +512,13 @@ class GoodreadsReadingScraper(BaseScraper):
                 author = None
                 row_txt = tr.get_text(" ", strip=True)
                 # El autor suele estar después de 'by'
-                by_m = re.search(r'\bby\s+(.+)$', row_txt, re.I)
+                by_m = _RE_BY.search(row_txt)
                 if by_m:
-                    author = re.split(r'\s{2,}|\s\(|\s-\s', by_m.group(1))[0].strip()
-
-                percent = self._extract_style_percent(tr) or self._extract_percent_any(row_txt)
-                rpages, tpages = self._extract_pages_progress(row_txt)
-                pages_read = rpages
-                pages_total = tpages
-                
-                if percent is None and rpages is not None and tpages and tpages > 0:
-                    try:
-                        percent = int(round((rpages / tpages) * 100))
-                    except Exception:
-                        pass
+                    author = _RE_AUTHOR_SPLIT.split(by_m.group(1), 1)[0].strip()
+
+                percent, pages_read, pages_total = self._progress_from_text(
+                    row_txt, self._extract_style_percent(tr)
+                )
 
                 if title or book_url:
                     results.append(BookProgress(
@@ -361,89 +530,129 @@ class GoodreadsReadingScraper(BaseScraper):
                         book_url=book_url,
                         shelf="currently-reading",
                     ))
+                    missing += percent is None
             except Exception:
                 continue
 
-        return results
+        return results, missing
+
+    @staticmethod
+    def _ancestor(node: Tag, levels: int) -> Tag:
+        """Sube `levels` niveles desde `node` (o hasta la raíz, si está más cerca)."""
+        for _ in range(levels):
+            if node.parent is None:
+                break
+            node = node.parent
+        return node
 
     def _augment_from_profile_widget(self) -> dict[str, int]:
         """
         Lee el perfil público y extrae porcentajes desde el widget 
         'currently reading' para rellenar datos faltantes.
+
+        Reutiliza el HTML descargado en _resolve_user_id; solo hace un GET
+        si no se tiene.
         
         Returns:
-            Un diccionario mapeando (URL o título normalizado) -> (porcentaje).
+            Un diccionario mapeando (_match_key de la URL o título normalizado) -> (porcentaje).
         """
         mapping: dict[str, int] = {}
         single_pct: list[int] = [] # Para casos donde solo hay un % sin libro claro
 
         try:
-            r = self.session.get(self.profile_url, timeout=self.timeout)
-            if r.status_code != 200:
-                return mapping
-
-            soup = BeautifulSoup(r.text, "html.parser")
-            # Buscar el widget específico, o usar todo el body como fallback
-            root = soup.find(id="currentlyReadingReviews") or soup
+            html = self._profile_html
+            if html is None:
+                r = self.session.get(self.profile_url, timeout=self.timeout)
+                if r.status_code != 200:
+                    return mapping
+                html = self._profile_html = r.text
+
+            # Parsear solo el widget; si no está, todo el documento como fallback
+            root = BeautifulSoup(html, _HTML_PARSER, parse_only=_WIDGET_STRAINER).find(id="currentlyReadingReviews")
+            if root is None:
+                root = BeautifulSoup(html, _HTML_PARSER)
+
+            # Un solo recorrido del widget: links de libro, barras de progreso
+            # (graphBar o style con "width") y candidatos a texto "(42%)".
+            book_links: List[Tag] = []
+            bars: List[Tag] = []
+            text_nodes: List[Tag] = []
+            for el in root.descendants:
+                if not isinstance(el, Tag):
+                    continue
+                if el.name == "a" or el.name == "span":
+                    text_nodes.append(el)
+                    href = el.get("href") if el.name == "a" else None
+                    if href and ("/book/" in href or "/work/" in href):
+                        book_links.append(el)
+                style = el.get("style")
+                if style and ("width" in style or "graphBar" in (el.get("class") or ())):
+                    bars.append(el)
+
+            # Primer link de libro (en orden de documento) bajo cada ancestro.
+            # Reemplaza el blk.find(...) por barra/texto con un lookup O(1).
+            first_link: Dict[int, Tag] = {}
+            for link in book_links:
+                for anc in link.parents:
+                    if id(anc) in first_link:
+                        break # Este ancestro (y los de arriba) ya tienen un link previo
+                    first_link[id(anc)] = link
 
             # Estrategia 1: Barras de progreso (style="width: X%")
-            bars = root.select("div.graphBar, .progressGraph .graphBar, [style*='width']")
             for bar in bars:
-                style = (bar.get("style") or "")
-                m = re.search(r"width\s*:\s*(\d{1,3})\s*%", style, re.I)
+                m = _RE_STYLE_WIDTH.search(bar["style"])
                 if not m:
                     continue
-                pct = max(0, min(100, int(m.group(1))))
-
-                # Intentar encontrar el link del libro en el mismo bloque
-                blk: Optional[Tag] = bar
-                for _ in range(4): # Subir 4 niveles
-                    if blk and blk.parent:
-                        blk = blk.parent
-                    else:
-                        break
+                pct = _pct(m.group(1))
 
-                a = None
-                if blk:
-                    a = blk.find("a", href=re.compile(r"/book/|/work/"))
-                if not a:
-                    # Fallback: buscar el primer link de libro en el widget
-                    a = root.find("a", href=re.compile(r"/book/|/work/"))
+                # Intentar encontrar el link del libro en el mismo bloque (4 niveles arriba)
+                a = first_link.get(id(self._ancestor(bar, 4)))
+                if not a and book_links:
+                    # Fallback: el primer link de libro en el widget
+                    a = book_links[0]
 
                 title = a.get_text(strip=True) if a else None
                 url = self._canonical_book_url(a["href"]) if a and a.has_attr("href") else None
 
                 if url:
-                    mapping[url] = pct
+                    mapping[_match_key(url)] = pct
                 if title:
-                    mapping[self._norm_title(title)] = pct
+                    mapping[_norm_title(title)] = pct
                 if not url and not title:
                     single_pct.append(pct)
 
-            # Estrategia 2: Texto tipo "(42%)"
-            for a in root.select("a, span"):
+            # Estrategia 2: Texto tipo "(42%)" junto al link del libro.
+            # Una sola pasada de regex sobre el HTML del widget; los libros
+            # que no matchea (markup inesperado) se buscan nodo por nodo.
+            inline_keys: set[str] = set()
+            for m in _RE_LINK_PAREN_PCT.finditer(root.decode()):
+                pct = _pct(m.group(3))
+                url = self._canonical_book_url(unescape(m.group(1)))
+                if url:
+                    key = _match_key(url)
+                    inline_keys.add(key)
+                    mapping[key] = pct
+                t = unescape(m.group(2)).strip()
+                if t:
+                    mapping[_norm_title(t)] = pct
+
+            for a in text_nodes:
                 txt = a.get_text(" ", strip=True)
-                m = re.search(r"\((\d{1,3})%\)", txt)
+                m = "%)" in txt and _RE_PAREN_PCT.search(txt)
                 if m:
-                    pct = max(0, min(100, int(m.group(1))))
+                    pct = _pct(m.group(1))
                     
-                    # Buscar el link asociado
-                    blk: Optional[Tag] = a
-                    for _ in range(3): # Subir 3 niveles
-                        if blk and blk.parent:
-                            blk = blk.parent
-                            
-                    link = None
-                    if blk:
-                        link = blk.find("a", href=re.compile(r"/book/|/work/"))
-                        
+                    # Buscar el link asociado (3 niveles arriba)
+                    link = first_link.get(id(self._ancestor(a, 3)))
                     if link:
                         url = self._canonical_book_url(link.get("href"))
+                        if url and _match_key(url) in inline_keys:
+                            continue # Ya resuelto por la regex
                         if url:
-                            mapping[url] = pct
+                            mapping[_match_key(url)] = pct
                         t = link.get_text(strip=True)
                         if t:
-                            mapping[self._norm_title(t)] = pct
+                            mapping[_norm_title(t)] = pct
                     else:
                         single_pct.append(pct)
 
@@ -459,41 +668,53 @@ class GoodreadsReadingScraper(BaseScraper):
 
     def _fetch_currently_reading(self, user_id: str) -> List[BookProgress]:
         """Descarga y parsea la shelf 'currently-reading'."""
-        shelf_url = f"{self.base_url}/review/list/{user_id}?shelf=currently-reading&per_page={self.per_page}"
+        shelf_url = self._shelf_url_tmpl.format(uid=user_id)
         self.logger.info(f"Accediendo a la estantería: {shelf_url}")
         r = self.session.get(shelf_url, timeout=self.timeout)
         if r.status_code != 200:
             raise RuntimeError(f"Goodreads devolvió {r.status_code} para {shelf_url}")
 
-        soup = BeautifulSoup(r.text, "html.parser")
-
-        # Estrategia A) Layout de tabla
-        results = self._parse_table_layout(soup)
-        if results:
-            self.logger.info(f"Parseando con layout de TABLA.")
+        # Prefiltro sobre los bytes crudos: qué layouts pueden estar presentes
+        body = r.content
+        has_table = any(mk in body for mk in _TABLE_MARKERS)
+        has_cards = any(mk in body for mk in _CARD_MARKERS)
 
-        # Estrategia B) Layout de tarjetas
-        if not results:
-            results = self._parse_cards_layout(soup)
-            if results:
-                self.logger.info(f"Parseando con layout de TARJETAS.")
+        results: List[BookProgress] = []
+        missing = 0 # Libros sin porcentaje (lo cuentan los _parse_*)
+        if has_table or has_cards:
+            # Cada layout se parsea solo con los subárboles que usa
+            text = r.text
+
+            # Estrategia A) Layout de tabla
+            if has_table:
+                results, missing = self._parse_table_layout(BeautifulSoup(text, _HTML_PARSER, parse_only=_TABLE_STRAINER))
+                if results:
+                    self.logger.info(f"Parseando con layout de TABLA.")
+
+            # Estrategia B) Layout de tarjetas
+            if not results and has_cards:
+                results, missing = self._parse_cards_layout(BeautifulSoup(text, _HTML_PARSER, parse_only=_CARDS_STRAINER))
+                if results:
+                    self.logger.info(f"Parseando con layout de TARJETAS.")
+        else:
+            self.logger.debug("Sin marcadores de tabla ni tarjetas en la estantería; se omite el parseo.")
 
         # Estrategia C) Layout de impresión (fallback)
         if not results:
             self.logger.info(f"Layout normal fallido. Intentando layout de IMPRESIÓN.")
-            shelf_print = f"{self.base_url}/review/list/{user_id}?shelf=currently-reading&per_page={self.per_page}&print=true"
+            shelf_print = self._shelf_print_tmpl.format(uid=user_id)
             try:
                 rp = self.session.get(shelf_print, timeout=self.timeout)
                 if rp.status_code == 200:
-                    results = self._parse_print_layout(rp.text)
+                    results, missing = self._parse_print_layout(rp.text)
             except Exception as e:
                 self.logger.warning(f"Fallback de impresión falló: {e}")
 
 
         # Estrategia D) Aumentar datos faltantes
         # Si algunos libros no tienen %, intentar sacarlos del widget del perfil.
-        need_pct = any(b.percent is None for b in results)
-        if results and need_pct:
+        # Si no falta ninguno, no se parsea (ni se descarga) el perfil.
+        if results and missing:
             self.logger.info("Faltan porcentajes, intentando aumentar desde el widget del perfil...")
             pct_map = self._augment_from_profile_widget()
             if pct_map:
@@ -503,13 +724,14 @@ class GoodreadsReadingScraper(BaseScraper):
                     if b.percent is not None:
                         continue
                     
-                    # 1. Match por URL exacta
-                    if b.book_url and b.book_url in pct_map:
-                        b.percent = pct_map[b.book_url]
+                    # 1. Match por URL (misma clave que usa el widget)
+                    pct = pct_map.get(_match_key(b.book_url)) if b.book_url else None
+                    if pct is not None:
+                        b.percent = pct
                         continue
                         
                     # 2. Match por Título normalizado
-                    tnorm = self._norm_title(b.title)
+                    tnorm = _norm_title(b.title)
                     if tnorm and tnorm in pct_map:
                         b.percent = pct_map[tnorm]
                         continue
@@ -535,20 +757,32 @@ class GoodreadsReadingScraper(BaseScraper):
         """
         Método principal para ejecutar el scraper.
         
-        1. Resuelve el ID de usuario.
+        1. Resuelve el ID de usuario (o lo toma del cache en disco).
         2. Obtiene y parsea la estantería 'currently-reading'.
         3. Intenta aumentar datos faltantes desde el widget del perfil.
         
         Returns:
             Una lista de objetos BookProgress.
         """
+        self._profile_html = None # Cada ejecución parte de un perfil fresco
+        user_id = self._uid_cache.get(self.profile_url)
+        from_cache = user_id is not None
         try:
-            user_id = self._resolve_user_id()
-            self.logger.info(f"User ID resuelto: {user_id}")
+            if from_cache:
+                self.logger.debug(f"User ID desde cache: {user_id}")
+            else:
+                user_id = self._resolve_user_id()
+                self.logger.info(f"User ID resuelto: {user_id}")
+                self._uid_cache[self.profile_url] = user_id
+                self._save_uid_cache()
             
             data = self._fetch_currently_reading(user_id)
             self.logger.info(f"Encontrados {len(data)} libros en lectura")
             return data
         except Exception as e:
             self.logger.error(f"Falló el scraping de Goodreads: {e}", exc_info=True)
+            if from_cache:
+                # Por si el ID cacheado quedó inválido: resolverlo de nuevo la próxima vez
+                self._uid_cache.pop(self.profile_url, None)
+                self._save_uid_cache()
             return []
\ No newline at end of file
@@ -5,23 +5,97 @@ from __future__ import annotations
 import json
 import time
 import logging
-import os
-import platform
-from typing import Any, Dict, List, Optional
+import re
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple
 from dataclasses import dataclass, asdict
 from pathlib import Path
 
-# Selenium
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
-
-# BeautifulSoup
-from bs4 import BeautifulSoup
+# Selenium y BeautifulSoup se importan dentro de los métodos que los usan:
+# importar el módulo (o instanciar el scraper) no paga su carga (~200ms).
+if TYPE_CHECKING:
+    from bs4 import BeautifulSoup, SoupStrainer
+    from selenium import webdriver
+
+# Parser en C (lxml) si está disponible; si no, el html.parser en Python puro.
+try:
+    import lxml.html
+    from lxml import etree
+    _HTML_PARSER = "lxml"
+except ImportError:  # Dependencia opcional (ej. ARM sin wheels)
+    lxml = None
+    _HTML_PARSER = "html.parser"
+
+# Condición de "página asentada" tras el scroll (reemplaza un sleep fijo)
+_SETTLED_JS = (
+    "return document.querySelector('li.pvs-list__paged-list-item') !== null"
+    " || document.readyState === 'complete';"
+)
+
+# Contenedor del texto del About (cualquier clase que contenga el nombre)
+_INLINE_SHOW_MORE_RE = re.compile(r"inline-show-more-text")
+
+# Documento nuevo (sin la marca de _navigate) y ya parseado
+_NEW_DOCUMENT_JS = "return window.__trackerStale === undefined && document.readyState !== 'loading';"
+
+# HTML del documento actual, y chequeo de sesión sin traer el HTML a Python
+_OUTER_HTML_JS = "return document.documentElement.outerHTML;"
+_HAS_NAV_ITEM_JS = "return document.documentElement.outerHTML.includes('nav-item');"
+
+# Requests que el scraper nunca necesita (tracking, ads, medios), bloqueados
+# vía CDP. Ningún patrón toca static.licdn.com/*.js (bundles de la SPA) ni
+# las XHR a /voyager/ de las que se hidrata la página.
+_BLOCKED_URLS = [
+    "*li/track*", "*platform.linkedin.com/li/track*",
+    "*.doubleclick.net/*", "*/collect?*",
+    "*media.licdn.com/dms/image/*",
+    "*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp",
+    "*.woff", "*.woff2", "*.mp4",
+]
+
+# Páginas /details/* que se scrapean (cada una en su pestaña)
+_LIST_ENDPOINTS = ("experience", "education", "certifications")
+
+
+def _xp_class(cls: str) -> str:
+    """Predicado XPath equivalente a class_="cls" de bs4 (token dentro de @class)."""
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {cls} ')"
+
+
+# XPath precompilados para las listas de /details/* (solo con lxml)
+if lxml is not None:
+    _XP_LIST = etree.XPath(f"(//div[{_xp_class('pvs-list__container')}])[1]")
+    _XP_LIST_ITEMS = etree.XPath(f".//li[{_xp_class('pvs-list__paged-list-item')}]")
+    _XP_HIDDEN_SPANS = etree.XPath(f".//span[{_xp_class('visually-hidden')}]")
+    _XP_INLINE_TEXT = etree.XPath(f"(.//*[{_xp_class('inline-show-more-text')}])[1]")
+    _XP_TEXT = etree.XPath(".//text()")
+    # About: contenedor del texto dentro de la <section> del primer div#about
+    _XP_ABOUT_CONTAINER = etree.XPath(
+        "((//div[@id='about'])[1]/ancestor::section[1]"
+        "//*[self::div or self::span][contains(@class, 'inline-show-more-text')])[1]"
+    )
+    _XP_FIRST_HIDDEN_SPAN = etree.XPath(f"(.//span[{_xp_class('visually-hidden')}])[1]")
+    _XP_FIRST_ARIA_HIDDEN_SPAN = etree.XPath("(.//span[@aria-hidden='true'])[1]")
+
+
+def _xp_text(node: Any, sep: str = "") -> str:
+    """Equivalente a get_text(sep, strip=True) de bs4 para un nodo lxml."""
+    return sep.join(t for t in (s.strip() for s in _XP_TEXT(node)) if t)
+
+@lru_cache(maxsize=1)
+def _strainers() -> Dict[str, "SoupStrainer"]:
+    """
+    SoupStrainers de los parsers, creados al primer uso (importa bs4).
+
+    Al parsear, el strainer ve el atributo class crudo ("a pvs-list__container b"),
+    por eso 'list' matchea el token con una regex y no con un string.
+    """
+    from bs4 import SoupStrainer
+    return {
+        "list": SoupStrainer("div", class_=re.compile(r"(?:^|\s)pvs-list__container(?:\s|$)")), # Listas de /details/*
+        "about": SoupStrainer("section"), # div#about vive dentro de una <section>
+        "hidden_span": SoupStrainer("span", class_="visually-hidden"), # Filtro de find_all (árbol ya parseado)
+    }
 
 # Local Imports
 from src.base_scraper import BaseScraper
@@ -29,6 +103,8 @@ from src.base_scraper import BaseScraper
 @dataclass
 class LinkedInProfileData:
     """Estructura de datos para el perfil."""
+    # __slots__ a mano (dataclass(slots=True) requiere Python 3.10)
+    __slots__ = ("about", "experience", "education", "certifications")
     about: str
     experience: List[Dict[str, str]]
     education: List[Dict[str, str]]
@@ -61,84 +137,80 @@ class LinkedInProfileScraper(BaseScraper):
         self.timeout = self.config.get_int("linkedin.timeout", 60)
         self.wait_timeout = self.config.get_int("linkedin.wait_timeout", 20)
 
-    def _is_arm_architecture(self) -> bool:
-        """Detecta si estamos en Raspberry Pi / ARM."""
-        arch = platform.machine().lower()
-        return any(a in arch for a in ["arm", "aarch64", "armv"])
+    def _make_driver(self) -> None:
+        """Inicializa el driver (ver BaseScraper._make_driver)."""
+        super()._make_driver(extra_args=(
+            "--window-size=1366,768",
+            "--disable-blink-features=AutomationControlled",
+        ))
+
+    def _setup_driver(self) -> None:
+        """Ajustes tras crear el driver: timeout y CDP de la pestaña inicial."""
+        super()._setup_driver()
+        self._configure_tab()
 
-    def _make_driver(self):
+    def _configure_tab(self) -> None:
         """
-        Inicializa el driver.
+        Ajustes CDP de la pestaña activa: dominio Page (ver _navigate) y, si
+        block_resources está activo, bloqueo de trackers y medios. Los comandos
+        CDP aplican solo al target actual, así que corre en cada pestaña nueva.
         """
-        options = Options()
-        if self.headless:
-            options.add_argument("--headless=new")
-        
-        options.page_load_strategy = 'normal'
-        options.add_argument("--disable-gpu")
-        options.add_argument("--disable-dev-shm-usage")
-        options.add_argument("--no-sandbox")
-        options.add_argument("--window-size=1366,768")
-        
-        # Rutas de datos persistentes (prod)
-        if self.env_name == "prod":
-            data_dir = "/var/lib/personal-track/chromium_data_linkedin"
-            options.add_argument(f"--user-data-dir={data_dir}/user-data")
-            options.add_argument(f"--disk-cache-dir={data_dir}/cache")
-        
-        options.add_argument("--disable-blink-features=AutomationControlled")
-        options.add_experimental_option("excludeSwitches", ["enable-automation"])
-        options.add_experimental_option("useAutomationExtension", False)
-
-        # 1. Buscar binario de Chromium (navegador)
-        chromium_binaries = [
-            "/usr/bin/chromium",
-            "/usr/bin/chromium-browser",
-            "/usr/lib/chromium/chromium",
-        ]
-        for path in chromium_binaries:
-            if os.path.exists(path):
-                options.binary_location = path
-                self.logger.info(f"Usando binario Chromium: {path}")
-                break
-
-        # 2. Buscar binario de Chromedriver (driver)
-        is_arm = self._is_arm_architecture()
-        if is_arm:
-            arm_driver_paths = [
-                "/usr/bin/chromedriver",
-                "/usr/lib/chromium-browser/chromedriver",
-                "/usr/lib/chromium/chromedriver",
-            ]
-            for path in arm_driver_paths:
-                if os.path.exists(path):
-                    self.logger.info(f"Usando driver ARM detectado: {path}")
-                    try:
-                        service = Service(executable_path=path)
-                        self.driver = webdriver.Chrome(service=service, options=options)
-                        self.driver.set_page_load_timeout(self.timeout)
-                        return
-                    except Exception as e:
-                        self.logger.warning(f"Fallo al iniciar driver ARM {path}: {e}")
-                        continue
-
-        # 3. Fallback estándar (PC / Mac)
         try:
-            self.driver = webdriver.Chrome(options=options)
-            self.driver.set_page_load_timeout(self.timeout)
+            self.driver.execute_cdp_cmd("Page.enable", {})
         except Exception as e:
-            # Último intento manual para Arch en PC si Selenium Manager falla
-            self.logger.warning(f"Selenium Manager falló: {e}. Intentando fallback manual...")
-            try:
-                service = Service("/usr/bin/chromedriver")
-                self.driver = webdriver.Chrome(service=service, options=options)
-            except Exception as final_e:
-                raise RuntimeError(f"No se pudo iniciar el driver: {final_e}")
+            self.logger.debug(f"No se pudo habilitar Page vía CDP: {e}")
+
+        if not self.config.get_bool("linkedin.block_resources", True):
+            return
+        try:
+            self.driver.execute_cdp_cmd("Network.enable", {})
+            self.driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": _BLOCKED_URLS})
+        except Exception as e:
+            self.logger.warning(f"No se pudo configurar el bloqueo de recursos vía CDP: {e}")
+
+    def _navigate(self, url: str) -> None:
+        """
+        Navega con CDP Page.navigate, que vuelve apenas arranca la navegación,
+        y espera solo a que el documento nuevo esté parseado.
+
+        El documento actual se marca antes de navegar para que la espera no
+        confunda la página vieja con la nueva. Si CDP no está disponible,
+        usa driver.get. Lanza TimeoutException si la página no llega a tiempo.
+        """
+        from selenium.common.exceptions import WebDriverException
+        from selenium.webdriver.support.ui import WebDriverWait
+
+        d = self.driver
+        try:
+            d.execute_script("window.__trackerStale = true;")
+            d.execute_cdp_cmd("Page.navigate", {"url": url, "transitionType": "link"})
+        except WebDriverException as e:
+            self.logger.debug(f"Page.navigate no disponible ({e}); se usa driver.get.")
+            d.get(url)
+            return
+        WebDriverWait(d, self.timeout, poll_frequency=0.1, ignored_exceptions=(WebDriverException,)).until(
+            lambda x: x.execute_script(_NEW_DOCUMENT_JS)
+        )
 
     def _login(self):
         """Login original del script que funcionaba."""
+        from selenium.webdriver.common.by import By
+        from selenium.webdriver.support import expected_conditions as EC
+        from selenium.webdriver.support.ui import WebDriverWait
+
         d = self.driver
-        d.get(self.login_url)
+
+        # Se prueba /feed primero (sesión del perfil/pool o cookies guardadas):
+        # si no redirige, no hace falta el formulario.
+        restored = self._restore_session_cookies("https://www.linkedin.com/")
+        d.get("https://www.linkedin.com/feed/")
+        if "/feed" in d.current_url:
+            self.logger.info(f"Sesión {'restaurada desde cookies' if restored else 'activa'}, saltando login.")
+            return
+
+        # Sin sesión LinkedIn suele redirigir solo a /login (o a /authwall)
+        if "/login" not in d.current_url:
+            d.get(self.login_url)
 
         # Check rápido de sesión
         try:
@@ -148,8 +220,10 @@ class LinkedInProfileScraper(BaseScraper):
         except:
             pass
 
-        if "feed" in d.current_url or "nav-item" in d.page_source:
+        # La búsqueda corre en el navegador: vuelve un bool, no todo el HTML
+        if "feed" in d.current_url or d.execute_script(_HAS_NAV_ITEM_JS):
             self.logger.info("Sesión detectada, saltando login.")
+            self._save_session_cookies()
             return
 
         try:
@@ -173,42 +247,130 @@ class LinkedInProfileScraper(BaseScraper):
                 raise RuntimeError("LinkedIn Challenge detectado. Requiere intervención manual.")
                 
             self.logger.info("Login realizado con éxito.")
+            self._save_session_cookies()
             
         except Exception as e:
             if "feed" in d.current_url:
                 return 
             raise RuntimeError(f"Fallo en login: {e}")
 
-    def _get_soup(self, url: str, wait_selector: Optional[Tuple[str, str]] = None, wait_time: Optional[int] = None) -> BeautifulSoup:
-        """Navegación y espera visual con tolerancia a timeouts."""
-        self.logger.info(f"Navegando a: {url}")
+    def _load_page(
+        self,
+        url: str,
+        wait_selector: Optional[Tuple[str, str]] = None,
+        wait_time: Optional[int] = None,
+        handle: Optional[str] = None,
+    ) -> str:
+        """
+        Navegación y espera visual con tolerancia a timeouts. Devuelve el HTML.
+
+        Si se pasa `handle` (pestaña abierta con _open_tabs), no se navega:
+        se cambia a esa pestaña, que ya viene cargando `url` en paralelo.
+        """
+        from selenium.common.exceptions import TimeoutException
+        from selenium.webdriver.common.by import By
+        from selenium.webdriver.support import expected_conditions as EC
+        from selenium.webdriver.support.ui import WebDriverWait
+
         wait_selector = wait_selector or (By.CSS_SELECTOR, ".pvs-list, #profile-content, .artdeco-card, footer")
         wait_time = wait_time or self.wait_timeout
 
-        try:
-            self.driver.get(url)
-        except TimeoutException:
-            self.logger.warning(f"Timeout de carga en {url}, usando HTML parcial...")
+        if handle is not None:
+            self.logger.info(f"Leyendo pestaña precargada: {url}")
+            self.driver.switch_to.window(handle)
+        else:
+            self.logger.info(f"Navegando a: {url}")
             try:
-                self.driver.execute_script("window.stop();")
-            except Exception:
-                pass
+                self._navigate(url)
+            except TimeoutException:
+                self.logger.warning(f"Timeout de carga en {url}, usando HTML parcial...")
+                try:
+                    self.driver.execute_script("window.stop();")
+                except Exception:
+                    pass
         
         try:
             # Espera genérica a que cargue algo de contenido
             WebDriverWait(self.driver, wait_time).until(
                 EC.presence_of_element_located(wait_selector)
             )
-            self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight / 2);")
-            time.sleep(2) 
-            self.driver.execute_script("window.scrollTo(0, 0);")
         except TimeoutException:
             self.logger.warning(f"Timeout esperando carga visual de {url}, parseando lo que haya...")
+        else:
+            # Scroll para disparar el lazy-load; se espera a que haya ítems o termine la carga
+            self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight / 2);")
+            try:
+                WebDriverWait(self.driver, 5, poll_frequency=0.2).until(
+                    lambda d: d.execute_script(_SETTLED_JS)
+                )
+            except TimeoutException:
+                pass # Se parsea lo que haya
+            self.driver.execute_script("window.scrollTo(0, 0);")
+
+        # outerHTML vía JS: evita la capa de page_source de Selenium
+        return self.driver.execute_script(_OUTER_HTML_JS)
 
-        return BeautifulSoup(self.driver.page_source, "html.parser")
+    def _open_tabs(self, urls: List[str]) -> Dict[str, str]:
+        """
+        Abre una pestaña por URL y arranca su navegación sin esperarla.
+
+        Las páginas cargan en paralelo dentro del mismo navegador (misma
+        sesión); luego _load_page(handle=...) solo espera y lee cada una.
+        Vuelve a dejar activa la pestaña original.
+
+        Returns:
+            Mapeo url -> window handle (sin las URLs que no se pudieron abrir).
+        """
+        main = self.driver.current_window_handle
+        handles: Dict[str, str] = {}
+        for url in urls:
+            try:
+                self.driver.switch_to.new_window("tab")
+                self._configure_tab()
+                # location.assign no bloquea (a diferencia de driver.get)
+                self.driver.execute_script("window.location.assign(arguments[0]);", url)
+                handles[url] = self.driver.current_window_handle
+            except Exception as e:
+                self.logger.warning(f"No se pudo abrir pestaña para {url}: {e}")
+        self.driver.switch_to.window(main)
+        return handles
+
+    def _close_tab(self, handle: str, main: str) -> None:
+        """Cierra la pestaña `handle` (si es la activa) y vuelve a `main`."""
+        try:
+            if self.driver.current_window_handle == handle:
+                self.driver.close()
+        except Exception:
+            pass
+        self.driver.switch_to.window(main)
+
+    def _extract_about(self, html: str) -> str:
+        """
+        Extrae el texto del About desde el HTML de la página.
+
+        Con lxml, un solo XPath precompilado ubica el contenedor del texto
+        desde la raíz (div#about -> su <section> -> '.inline-show-more-text');
+        sin lxml, BeautifulSoup (ver _extract_about_from_soup).
+        """
+        if lxml is None:
+            from bs4 import BeautifulSoup
+            return self._extract_about_from_soup(
+                BeautifulSoup(html, _HTML_PARSER, parse_only=_strainers()["about"])
+            )
+
+        found = _XP_ABOUT_CONTAINER(lxml.html.fromstring(html))
+        if not found:
+            return ""
+        container = found[0]
+        # Preferencia: span oculto (texto completo) > span visible > todo el contenedor
+        for xp in (_XP_FIRST_HIDDEN_SPAN, _XP_FIRST_ARIA_HIDDEN_SPAN):
+            spans = xp(container)
+            if spans:
+                return _xp_text(spans[0], " ")
+        return _xp_text(container, " ")
 
     def _extract_about_from_soup(self, soup: BeautifulSoup) -> str:
-        """Extrae About desde un soup ya cargado."""
+        """Extrae About desde un soup ya cargado (camino sin lxml)."""
         about_anchor = soup.find("div", {"id": "about"})
         if not about_anchor:
             return ""
@@ -217,11 +379,7 @@ class LinkedInProfileScraper(BaseScraper):
         if not section:
             return ""
 
-        text_container = section.find(
-            lambda tag: tag.name in ["div", "span"]
-            and tag.get("class")
-            and any("inline-show-more-text" in c for c in tag.get("class"))
-        )
+        text_container = section.find(["div", "span"], class_=_INLINE_SHOW_MORE_RE)
 
         if text_container:
             hidden_span = text_container.find("span", class_="visually-hidden")
@@ -238,82 +396,92 @@ class LinkedInProfileScraper(BaseScraper):
 
     def _parse_about(self) -> str:
         """Extrae el texto de la sección 'Acerca de' con fallback."""
+        from selenium.webdriver.common.by import By
+
         try:
-            soup = self._get_soup(self.profile_url, wait_time=self.config.get_int("linkedin.about_wait", self.wait_timeout + 10))
-            about_text = self._extract_about_from_soup(soup)
+            html = self._load_page(
+                self.profile_url,
+                wait_time=self.config.get_int("linkedin.about_wait", self.wait_timeout + 10),
+            )
+            about_text = self._extract_about(html)
             if about_text:
                 return about_text
 
             # Fallback a página más ligera de detalles/about
             about_details_url = f"{self.profile_url}/details/about/"
-            soup = self._get_soup(
+            html = self._load_page(
                 about_details_url,
                 wait_selector=(By.CSS_SELECTOR, ".pvs-list, .artdeco-card"),
                 wait_time=self.config.get_int("linkedin.about_wait", self.wait_timeout + 10),
             )
-            return self._extract_about_from_soup(soup)
+            return self._extract_about(html)
         except Exception as e:
             self.logger.warning(f"No se pudo extraer About: {e}")
             return ""
 
-    def _parse_list_page(self, endpoint: str) -> List[Dict[str, str]]: 
+    def _parse_list_page(self, endpoint: str, tabs: Optional[Dict[str, str]] = None) -> List[Dict[str, str]]: 
         """
         Extrae ítems usando lógica posicional sobre elementos de accesibilidad.
         Estrategia: Si ya tenemos Título, Subtítulo y Meta en los índices 0, 1 y 2,
         todo lo que sobre (índices 3+) es parte del cuerpo (Descripción, Ubicación o Skills).
+
+        Con lxml se usa XPath directo sobre el árbol en C; sin lxml, BeautifulSoup.
+
+        Args:
+            endpoint: Sección de /details/ (ej. "experience").
+            tabs: Pestañas precargadas (url -> handle) de _open_tabs, si las hay.
         """
         full_url = f"{self.profile_url}/details/{endpoint}/"
-        soup = self._get_soup(full_url)
+        handle = (tabs or {}).get(full_url)
+        if handle is None:
+            html = self._load_page(full_url)
+        else:
+            main = self.driver.current_window_handle
+            try:
+                html = self._load_page(full_url, handle=handle)
+            finally:
+                self._close_tab(handle, main)
         
         items = []
-        
-        main_list = soup.find("div", class_="pvs-list__container")
-        if not main_list:
+
+        if lxml is not None:
+            found = _XP_LIST(lxml.html.fromstring(html))
+            main_list = found[0] if found else None
+        else:
+            from bs4 import BeautifulSoup
+            main_list = BeautifulSoup(html, _HTML_PARSER, parse_only=_strainers()["list"]).find("div", class_="pvs-list__container")
+        if main_list is None:
             self.logger.warning(f"No se encontró lista PVS en {endpoint}")
             return []
 
-        for li in main_list.find_all("li", class_="pvs-list__paged-list-item"):
-            try:
-                item_data = {}
-                
-                # Buscamos TODOS los spans ocultos, que contienen la estructura semántica real
-                hidden_spans = li.find_all("span", class_="visually-hidden")
-                
-                # 0: Título (Rol)
-                if len(hidden_spans) >= 1:
-                    item_data['title'] = hidden_spans[0].get_text(strip=True)
-                
-                # 1: Subtítulo (Empresa / Institución)
-                if len(hidden_spans) >= 2:
-                    raw_subtitle = hidden_spans[1].get_text(strip=True)
-                    # Limpieza común: a veces trae " · Jornada completa", lo quitamos si queremos solo la empresa
-                    item_data['subtitle'] = raw_subtitle.split("·")[0].strip() 
-                
-                # 2: Meta (Fechas / Duración)
-                if len(hidden_spans) >= 3:
-                    item_data['meta'] = hidden_spans[2].get_text(strip=True)
-
-                # Si hay más de 3 elementos, son la descripción, la ubicación o las aptitudes.
-                # Los unimos todos con saltos de línea para no perder nada.
-                description_parts = []
-                if len(hidden_spans) > 3:
-                    for span in hidden_spans[3:]:
-                        text = span.get_text(" ", strip=True)
-                        # Filtros básicos para evitar ruido del sistema
-                        if text and "ver más" not in text.lower():
-                            description_parts.append(text)
-                
-                # Fallback: Si por alguna razón no hay hidden spans extras, buscamos la clase visual
-                # Esto ayuda si LinkedIn decide no poner la descripción en hidden (raro, pero posible)
-                if not description_parts:
-                    outer_desc = li.find("div", class_="display-flex align-items-center")
-                    # A veces la descripción está en un div hermano directo con la clase inline-show-more-text
-                    inline_text = li.select_one(".inline-show-more-text")
-                    if inline_text:
-                         description_parts.append(inline_text.get_text(" ", strip=True))
+        # Texto de los spans ocultos: [0..2] con get_text(strip=True), [3:] separados por espacio
+        if lxml is not None:
+            lis = _XP_LIST_ITEMS(main_list)
+
+            def hidden_of(li) -> List[str]:
+                # Span hoja (lo habitual): su .text ya es todo el texto, sin otro XPath
+                return [
+                    (sp.text or "").strip() if not len(sp) else _xp_text(sp, "" if i < 3 else " ")
+                    for i, sp in enumerate(_XP_HIDDEN_SPANS(li))
+                ]
+
+            def inline_of(li) -> Optional[str]:
+                nodes = _XP_INLINE_TEXT(li)
+                return _xp_text(nodes[0], " ") if nodes else None
+        else:
+            lis = main_list.find_all("li", class_="pvs-list__paged-list-item")
 
-                item_data['description'] = "\n".join(description_parts).strip()
+            def hidden_of(li) -> List[str]:
+                spans = li.find_all(_strainers()["hidden_span"])
+                return [sp.get_text("" if i < 3 else " ", strip=True) for i, sp in enumerate(spans)]
 
+            def inline_of(li) -> Optional[str]:
+                node = li.select_one(".inline-show-more-text")
+                return node.get_text(" ", strip=True) if node else None
+
+        for li in lis:
+            try:
+                item_data = self._item_from_texts(hidden_of(li), lambda: inline_of(li))
                 if item_data.get('title'):
                     items.append(item_data)
                     
@@ -324,18 +492,66 @@ class LinkedInProfileScraper(BaseScraper):
         self.logger.info(f"Extraídos {len(items)} elementos de {endpoint}")
         return items
 
+    def _item_from_texts(self, hidden_texts: List[str], inline_text: Callable[[], Optional[str]]) -> Dict[str, str]:
+        """
+        Arma un ítem a partir del texto de los spans 'visually-hidden' de un <li>,
+        que contienen la estructura semántica real.
+
+        Args:
+            hidden_texts: Texto de cada span, en orden de documento.
+            inline_text: Devuelve el texto de '.inline-show-more-text' (solo se
+                llama si no hay descripción en los spans).
+        """
+        item_data = {}
+
+        # 0: Título (Rol)
+        if len(hidden_texts) >= 1:
+            item_data['title'] = hidden_texts[0]
+        
+        # 1: Subtítulo (Empresa / Institución)
+        if len(hidden_texts) >= 2:
+            # Limpieza común: a veces trae " · Jornada completa", lo quitamos si queremos solo la empresa
+            item_data['subtitle'] = hidden_texts[1].split("·")[0].strip() 
+        
+        # 2: Meta (Fechas / Duración)
+        if len(hidden_texts) >= 3:
+            item_data['meta'] = hidden_texts[2]
+
+        # Si hay más de 3 elementos, son la descripción, la ubicación o las aptitudes.
+        # Los unimos todos con saltos de línea para no perder nada.
+        description_parts = []
+        for text in hidden_texts[3:]:
+            # Filtros básicos para evitar ruido del sistema
+            if text and "ver más" not in text.lower():
+                description_parts.append(text)
+        
+        # Fallback: Si por alguna razón no hay hidden spans extras, buscamos la clase visual
+        # Esto ayuda si LinkedIn decide no poner la descripción en hidden (raro, pero posible)
+        if not description_parts:
+            # A veces la descripción está en un div hermano directo con la clase inline-show-more-text
+            text = inline_text()
+            if text is not None:
+                description_parts.append(text)
+
+        item_data['description'] = "\n".join(description_parts).strip()
+        return item_data
+
     def fetch_data(self) -> LinkedInProfileData:
-        self._make_driver()
+        self._acquire_driver() # Navegador del pool (con sesión si ya se usó en este proceso)
         if not self.driver:
             raise RuntimeError("No se pudo iniciar el driver.")
 
         try:
             self._login()
+
+            # Las páginas /details/* cargan en pestañas propias mientras se
+            # procesa el About en la principal.
+            tabs = self._open_tabs([f"{self.profile_url}/details/{ep}/" for ep in _LIST_ENDPOINTS])
             
             about_text = self._parse_about()
-            experience_data = self._parse_list_page("experience")
-            education_data = self._parse_list_page("education")
-            certifications_data = self._parse_list_page("certifications")
+            experience_data = self._parse_list_page("experience", tabs)
+            education_data = self._parse_list_page("education", tabs)
+            certifications_data = self._parse_list_page("certifications", tabs)
 
             return LinkedInProfileData(
                 about=about_text,
@@ -346,13 +562,14 @@ class LinkedInProfileScraper(BaseScraper):
 
         except Exception as e:
             self.logger.error(f"Error fatal en scraping: {e}", exc_info=True)
+            # Tras un error el navegador puede quedar en mal estado: descartarlo
+            self._release_driver(discard=True)
             return None
             
         finally:
-            if self.driver:
-                self.driver.quit()
+            self._release_driver()
 
-    def save_data(self, data: LinkedInProfileData) -> Optional[Path]:
+    def save_data(self, data: LinkedInProfileData, timestamp: Optional[str] = None) -> Optional[Path]:
         if not data:
             return None
-        return super().save_data([asdict(data)])
+        return super().save_data([asdict(data)], timestamp=timestamp)
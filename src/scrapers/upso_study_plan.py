@@ -18,31 +18,39 @@ import re
 import time
 from dataclasses import dataclass
 from pathlib import Path
-from typing import List, Optional, Tuple
+from typing import TYPE_CHECKING, List, Optional, Tuple
 from urllib.parse import urlparse, urlunparse
-import os
-import platform
 
-# Importaciones de Terceros (Selenium)
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.common.by import By
-from selenium.webdriver.common.keys import Keys
-from selenium.webdriver.remote.webelement import WebElement
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.support.ui import WebDriverWait
-
-# NOTA: webdriver_manager se importa condicionalmente dentro de _make_driver
-# como un fallback.
+# Selenium se importa dentro de los métodos que lo usan: importar el
+# módulo (o instanciar el scraper) no paga su carga.
+if TYPE_CHECKING:
+    from selenium import webdriver
 
 # Importaciones Locales
 from src.base_scraper import BaseScraper
 
 
+# "Nombre de Materia (Codigo)": nombre y código numérico final
+_MATERIA_CODE_RE = re.compile(r"^(.*?)[\s\u00A0]*\((\d+)\)\s*$")
+
+# Lee la tabla del plan (arguments[0]) de una vez: encabezados y texto de
+# cada celda, como {headers: [...], rows: [[...], ...]}.
+_TABLE_JS = """
+const table = arguments[0];
+const text = (el) => (el.innerText || "").trim();
+return {
+    headers: Array.from(table.querySelectorAll("thead th"), text),
+    rows: Array.from(table.querySelectorAll("tbody tr"),
+                     (tr) => Array.from(tr.querySelectorAll("td"), text)),
+};
+"""
+
+
 @dataclass
 class PlanItem:
     """Representa una materia en el plan de estudios."""
+    # __slots__ a mano (dataclass(slots=True) requiere Python 3.10)
+    __slots__ = ("codigo", "nombre", "estado", "tipo", "anio", "periodo", "creditos", "correlativas")
     codigo: Optional[str]
     nombre: str
     estado: str
@@ -84,104 +92,9 @@ class UPSOStudyPlanScraper(BaseScraper):
 
     # Métodos de Inicialización del Driver
 
-    def _is_arm_architecture(self) -> bool:
-        """Determina si estamos ejecutando en una arquitectura ARM (como Raspberry Pi)."""
-        arch = platform.machine().lower()
-        return any(a in arch for a in ["arm", "aarch64", "armv"])
-
-    def _make_driver(self):
-        """Inicializa el driver de Selenium con lógica multi-arquitectura."""
-        
-        options = Options()
-        if self.headless:
-            options.add_argument("--headless=new")
-        
-        # Argumentos de Seguridad/Headless Agregados
-        options.add_argument("--disable-gpu")
-        options.add_argument("--disable-software-rasterizer")
-        options.add_argument("--disable-dev-shm-usage")
-        options.add_argument("--no-sandbox")
-        options.add_argument("--window-size=1280,1600")
-
-        # Bloque de perfil de usuario para 'prod'
-        if self.env_name == "prod":
-            # Forzar a Chromium a usar directorios escribibles por el usuario 'track'.
-            data_dir = "/var/lib/personal-track/chromium_data_upso"
-            options.add_argument(f"--user-data-dir={data_dir}/user-data")
-            options.add_argument(f"--disk-cache-dir={data_dir}/cache")
-            options.add_argument(f"--crash-dumps-dir={data_dir}/crash-dumps")
-        
-        options.add_argument("--disable-setuid-sandbox")
-        options.add_argument("--disable-features=UtilityProcessSandbox")
-        options.add_argument("--disable-features=TranslateService") 
-        options.add_argument("--disable-dbus")
-        
-        options.add_experimental_option("excludeSwitches", ["enable-automation"])
-        options.add_experimental_option("useAutomationExtension", False)
-
-        # Flexibilizar búsqueda de binario
-        chromium_binaries = [
-            "/usr/bin/chromium",
-            "/usr/bin/chromium-browser",
-            "/usr/lib/chromium/chromium",
-        ]
-        
-        found_binary = None
-        for path in chromium_binaries:
-            if os.path.exists(path):
-                found_binary = path
-                break
-        
-        if found_binary:
-             options.binary_location = found_binary
-             self.logger.info(f"Usando binario de Chromium: {found_binary}")
-        else:
-            # Si no se encuentra, dejar que Selenium Manager intente (para PC local)
-            pass
-        
-        is_arm = self._is_arm_architecture()
-        
-        # 1. Intento RPi/ARM: Usar driver pre-instalado
-        if is_arm:
-            arm_driver_paths = [
-                "/usr/bin/chromedriver",
-                "/usr/lib/chromium-browser/chromedriver",
-                "/usr/lib/chromium/chromedriver",
-            ]
-            
-            for path in arm_driver_paths:
-                if os.path.exists(path):
-                    self.logger.info(f"Usando chromedriver del sistema ARM: {path}")
-                    try:
-                        service = Service(executable_path=path) 
-                        self.driver = webdriver.Chrome(service=service, options=options)
-                        self.driver.set_page_load_timeout(self.timeout)
-                        return
-                    except Exception as e:
-                        self.logger.warning(f"Driver ARM encontrado pero falló al iniciar: {e}")
-                        continue
-            
-            raise RuntimeError("Driver ARM no encontrado/funcional. La descarga automática está deshabilitada en esta arquitectura (Exec format error).")
-
-        # 2. Intento PC (Selenium Manager)
-        try:
-            self.logger.info("Intentando iniciar driver con Selenium Manager (PC x86-64).")
-            self.driver = webdriver.Chrome(options=options)
-            self.driver.set_page_load_timeout(self.timeout)
-            return
-        except Exception as e1:
-            self.logger.warning(f"Selenium Manager falló: {e1}")
-
-        # 3. Intento PC (WebDriver Manager - Fallback)
-        try:
-            self.logger.info("Intentando descarga con WebDriver Manager (solo para PC).")
-            from webdriver_manager.chrome import ChromeDriverManager
-            service = Service(ChromeDriverManager().install())
-            self.driver = webdriver.Chrome(service=service, options=options)
-            self.driver.set_page_load_timeout(self.timeout)
-            return
-        except Exception as e3:
-            raise RuntimeError(f"No se pudo inicializar Chrome (PC Error): {e3}")
+    def _make_driver(self) -> None:
+        """Inicializa el driver (ver BaseScraper._make_driver)."""
+        super()._make_driver(extra_args=("--window-size=1280,1600",))
 
     # Métodos de Navegación y Login
 
@@ -198,9 +111,20 @@ class UPSOStudyPlanScraper(BaseScraper):
 
     def _login(self):
         """Realiza el login en UPSO Guaraní."""
+        from selenium.webdriver.common.by import By
+        from selenium.webdriver.common.keys import Keys
+        from selenium.webdriver.support import expected_conditions as EC
+        from selenium.webdriver.support.ui import WebDriverWait
+
         self.logger.info("Iniciando login en Guaraní UPSO...")
+        self._restore_session_cookies("https://guarani3w.upso.edu.ar/guarani3w/")
         self.driver.get("https://guarani3w.upso.edu.ar/guarani3w/acceso/login")
         
+        # Sesión viva (cookies restauradas o navegador del pool): Guaraní redirige
+        if "inicio_alumno" in self.driver.current_url:
+            self.logger.info("Sesión activa, se omite el login.")
+            return
+        
         # Esperar y completar campos de login
         try:
             username_field = WebDriverWait(self.driver, 10).until(
@@ -219,6 +143,7 @@ class UPSOStudyPlanScraper(BaseScraper):
                 EC.url_contains("inicio_alumno")
             )
             self.logger.info("Login exitoso.")
+            self._save_session_cookies()
             
         except Exception as e:
             raise RuntimeError(f"Fallo durante el login: {e}")
@@ -228,21 +153,30 @@ class UPSOStudyPlanScraper(BaseScraper):
         Navega a la página del plan de estudios.
         Intenta con varias URL normalizadas por si acaso.
         """
+        from selenium.webdriver.common.by import By
+        from selenium.webdriver.support import expected_conditions as EC
+        from selenium.webdriver.support.ui import WebDriverWait
+
         self.logger.info("Navegando al plan de estudios...")
-        urls_to_try = [
+        default_url = "https://guarani3w.upso.edu.ar/guarani3w/plan"
+        # Sin repetidos (con la config por defecto, plan_url == default_url)
+        urls_to_try = list(dict.fromkeys([
             self.plan_url,
             self._normalize_url(self.plan_url),
-            "https://guarani3w.upso.edu.ar/guarani3w/plan",
-            self._normalize_url("https://guarani3w.upso.edu.ar/guarani3w/plan")
-        ]
+            default_url,
+            self._normalize_url(default_url),
+        ]))
         
         for url in urls_to_try:
             try:
                 self.driver.get(url)
-                time.sleep(2) # Dar tiempo a que JS redirija si es necesario
-                if "plan" in self.driver.current_url.lower():
-                    self.logger.info("Página del plan cargada.")
-                    return
+                # La URL pedida ya contiene "plan": lo que prueba que cargó es
+                # la tabla (si JS redirige, aparece en la página final)
+                WebDriverWait(self.driver, 10).until(
+                    EC.presence_of_element_located((By.CSS_SELECTOR, "table.table"))
+                )
+                self.logger.info("Página del plan cargada.")
+                return
             except Exception:
                 continue
                 
@@ -254,26 +188,30 @@ class UPSOStudyPlanScraper(BaseScraper):
         """Parsea 'Nombre de Materia (Codigo)' -> (Nombre, Codigo)."""
         text = (raw_text or "").strip()
         # Busca un código numérico entre paréntesis al final de la cadena
-        match = re.search(r"^(.*?)[\s\u00A0]*\((\d+)\)\s*$", text)
+        match = _MATERIA_CODE_RE.match(text)
         if match:
             return match.group(1).strip(), match.group(2).strip()
         return text, None # Devuelve solo nombre si no hay código
 
-    def _find_column_index(self, headers: List[str], keywords: List[str]) -> Optional[int]:
-        """Encuentra el índice de columna (case-insensitive) basado en keywords."""
-        for i, header in enumerate(headers):
-            header_lower = header.lower()
-            for keyword in keywords:
-                if keyword in header_lower:
-                    return i
-        return None
+    def _find_column_index(self, headers_lower: List[str], keywords: List[str]) -> Optional[int]:
+        """
+        Encuentra el índice de la primera columna que contiene alguna keyword.
+        `headers_lower` ya viene en minúsculas (se convierte una vez en fetch_data).
+        """
+        return next(
+            (i for i, header in enumerate(headers_lower) if any(k in header for k in keywords)),
+            None,
+        )
 
     # Método Principal de Ejecución
 
     def fetch_data(self) -> List[PlanItem]:
         """Obtiene el plan de estudios completo."""
+        from selenium.webdriver.common.by import By
+        from selenium.webdriver.support import expected_conditions as EC
+        from selenium.webdriver.support.ui import WebDriverWait
         
-        self._make_driver() # Inicializar el driver al inicio de la ejecución
+        self._acquire_driver() # Navegador del pool (o uno nuevo vía _make_driver)
         if not self.driver:
             raise RuntimeError("El driver de Selenium no se inicializó correctamente.")
             
@@ -286,9 +224,9 @@ class UPSOStudyPlanScraper(BaseScraper):
                 EC.presence_of_element_located((By.CSS_SELECTOR, "table.table"))
             )
             
-            # Mapeo de Columnas
-            header_cells = table.find_elements(By.CSS_SELECTOR, "thead th")
-            headers = [cell.text.strip() for cell in header_cells]
+            # Encabezados y celdas en un solo execute_script (no un .text por celda)
+            table_data = self.driver.execute_script(_TABLE_JS, table)
+            headers = [h.lower() for h in table_data["headers"]] # Búsqueda case-insensitive
             
             # Mapear columnas dinámicamente por palabras clave
             col_materia = self._find_column_index(headers, ["materia", "code"])
@@ -303,17 +241,15 @@ class UPSOStudyPlanScraper(BaseScraper):
             self.logger.info(f"Mapeo de columnas: Nombre(idx={col_nombre}), Estado(idx={col_estado})")
 
             # Procesamiento de Filas
-            rows = table.find_elements(By.CSS_SELECTOR, "tbody tr")
             plan_items = []
             
-            for row in rows:
-                cells = row.find_elements(By.TAG_NAME, "td")
+            for cells in table_data["rows"]:
                 if not cells:
                     continue # Ignorar filas vacías
                     
                 def get_cell_text(idx: Optional[int]) -> str:
                     """Helper para obtener texto de celda por índice de forma segura."""
-                    return cells[idx].text.strip() if idx is not None and idx < len(cells) else ""
+                    return cells[idx] if idx is not None and idx < len(cells) else ""
                 
                 # Extraer información de celdas
                 materia_text = get_cell_text(col_materia) # Suele ser el código
@@ -349,9 +285,9 @@ class UPSOStudyPlanScraper(BaseScraper):
                 self.logger.info(f"Se guardó dump del error en {debug_path}")
             except Exception as de:
                 self.logger.error(f"No se pudo guardar el dump del error: {de}")
+            # Tras un error el navegador puede quedar en mal estado: descartarlo
+            self._release_driver(discard=True)
             return [] # Devolver lista vacía en caso de error
             
         finally:
-            if self.driver:
-                self.driver.quit()
-                self.driver = None
\ No newline at end of file
+            self._release_driver()
\ No newline at end of file
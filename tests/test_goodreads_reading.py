@@ -0,0 +1,49 @@
+# tests/test_goodreads_reading.py
+
+"""Tests del widget 'currently reading' del scraper de Goodreads."""
+
+import logging
+
+from src.scrapers.goodreads_reading import _RE_LINK_PAREN_PCT, GoodreadsReadingScraper
+
+# Dos libros contiguos: el primero sin "(NN%)" propio, el segundo con uno
+TWO_BOOKS = (
+    '<div><a href="/book/show/1">A</a></div>'
+    '<div><a href="/book/show/2">B</a> (42%)</div>'
+)
+
+
+def _scraper(profile_html: str) -> GoodreadsReadingScraper:
+    """Instancia sin __init__ (no lee config ni hace requests)."""
+    scraper = GoodreadsReadingScraper.__new__(GoodreadsReadingScraper)
+    scraper.base_url = "https://www.goodreads.com"
+    scraper.logger = logging.getLogger("test_goodreads")
+    scraper._profile_html = profile_html
+    return scraper
+
+
+def test_link_paren_pct_does_not_cross_anchors():
+    matches = [m.groups() for m in _RE_LINK_PAREN_PCT.finditer(TWO_BOOKS)]
+    assert matches == [("/book/show/2", "B", "42")]
+
+
+def test_widget_assigns_percent_to_adjacent_book_only():
+    html = f'<html><body><div id="currentlyReadingReviews">{TWO_BOOKS}</div></body></html>'
+    mapping = _scraper(html)._augment_from_profile_widget()
+    assert mapping["b"] == 42
+    assert "a" not in mapping
+    assert not any(key.endswith("/book/show/1") for key in mapping)
+
+
+def test_widget_falls_back_to_dom_for_books_the_regex_misses():
+    # El segundo libro tiene el "(13%)" a más de 6 tags del link: solo lo ve el DOM
+    deep = "<span>" * 4 + "(13%)" + "</span>" * 4
+    html = (
+        '<html><body><div id="currentlyReadingReviews">'
+        '<div><a href="/book/show/1">A</a> (42%)</div>'
+        f'<div><div><a href="/book/show/2">B</a><i></i><i></i><i></i>{deep}</div></div>'
+        '</div></body></html>'
+    )
+    mapping = _scraper(html)._augment_from_profile_widget()
+    assert mapping["a"] == 42
+    assert mapping["b"] == 13